@@ -2,71 +2,209 @@
 This module lists all externally useful classes and functions
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ._version import __version__
-from .api import (
-    AsyncProcessRequest,
-    BatchProcessClient,
-    BatchProcessRequest,
-    BatchRequestStatus,
-    BatchStatisticalRequest,
-    BatchUserAction,
-    ByocCollection,
-    ByocCollectionAdditionalData,
-    ByocCollectionBand,
-    ByocTile,
-    SentinelHubBatchStatistical,
-    SentinelHubBYOC,
-    SentinelHubCatalog,
-    SentinelHubRequest,
-    SentinelHubStatistical,
-    WcsRequest,
-    WebFeatureService,
-    WmsRequest,
-    get_async_running_status,
-    monitor_batch_process_analysis,
-    monitor_batch_process_job,
-    monitor_batch_statistical_analysis,
-    monitor_batch_statistical_job,
-    opensearch,
-)
-from .api.ogc import CustomUrlParam
-from .api.opensearch import get_area_dates, get_area_info, get_tile_info, get_tile_info_id
-from .areas import (
-    BBoxSplitter,
-    CustomGridSplitter,
-    OsmSplitter,
-    TileSplitter,
-    UtmGridSplitter,
-    UtmZoneSplitter,
-)
-from .config import SHConfig
-from .constants import CRS, MimeType, MosaickingOrder, ResamplingType, ServiceType, ServiceUrl, SHConstants
-from .data_collections import DataCollection
-from .data_collections_bands import Band, Unit
-from .download import (
-    DownloadClient,
-    DownloadRequest,
-    SentinelHubDownloadClient,
-    SentinelHubSession,
-    SentinelHubStatisticalDownloadClient,
-)
-from .evalscript import generate_evalscript, parse_data_collection_bands
-from .exceptions import AwsDownloadFailedException, DownloadFailedException
-from .geo_utils import (
-    bbox_to_dimensions,
-    bbox_to_resolution,
-    get_image_dimension,
-    get_utm_bbox,
-    get_utm_crs,
-    pixel_to_utm,
-    to_utm_bbox,
-    to_wgs84,
-    transform_point,
-    utm_to_pixel,
-    wgs84_to_pixel,
-    wgs84_to_utm,
+
+if TYPE_CHECKING:
+    from .api import (
+        AsyncProcessRequest,
+        BatchProcessClient,
+        BatchProcessRequest,
+        BatchRequestStatus,
+        BatchStatisticalRequest,
+        BatchUserAction,
+        ByocCollection,
+        ByocCollectionAdditionalData,
+        ByocCollectionBand,
+        ByocTile,
+        CatalogCache,
+        SentinelHubBatchStatistical,
+        SentinelHubBYOC,
+        SentinelHubCatalog,
+        SentinelHubRequest,
+        SentinelHubStatistical,
+        WcsRequest,
+        WebFeatureService,
+        WmsRequest,
+        get_async_running_status,
+        monitor_batch_process_analysis,
+        monitor_batch_process_job,
+        monitor_batch_statistical_analysis,
+        monitor_batch_statistical_job,
+        opensearch,
+    )
+    from .api.ogc import CustomUrlParam
+    from .api.opensearch import get_area_dates, get_area_info, get_tile_info, get_tile_info_id
+    from .areas import (
+        BBoxSplitter,
+        CustomGridSplitter,
+        OsmSplitter,
+        TileGrid,
+        TileGridSplitter,
+        TileSplitter,
+        UtmGridSplitter,
+        UtmZoneSplitter,
+    )
+    from .config import FrozenSHConfig, SHConfig
+    from .constants import CRS, MimeType, MosaickingOrder, ResamplingType, ServiceType, ServiceUrl, SHConstants
+    from .data_collections import DataCollection
+    from .data_collections_bands import Band, Unit
+    from .download import (
+        DownloadClient,
+        DownloadRequest,
+        SentinelHubDownloadClient,
+        SentinelHubSession,
+        SentinelHubStatisticalDownloadClient,
+    )
+    from .evalscript import generate_evalscript, parse_data_collection_bands
+    from .exceptions import AwsDownloadFailedException, DownloadFailedException
+    from .geo_utils import (
+        bbox_to_dimensions,
+        bbox_to_dimensions_many,
+        bbox_to_resolution,
+        get_image_dimension,
+        get_utm_bbox,
+        get_utm_crs,
+        get_utm_crs_array,
+        pixel_to_utm,
+        to_utm_bbox,
+        to_wgs84,
+        transform_point,
+        transform_points,
+        utm_to_pixel,
+        wgs84_to_pixel,
+        wgs84_to_utm,
+    )
+    from .geometry import BBox, BBoxArray, Geometry, GeometryArray
+    from .geopedia import GeopediaFeatureIterator, GeopediaImageRequest, GeopediaSession, GeopediaWmsRequest
+    from .io_utils import read_data, read_many, write_data, write_many
+    from .json_utils import get_json_backend, set_json_backend
+    from .time_utils import filter_times, is_valid_time, parse_time, parse_time_interval, serialize_time
+
+# Public names are imported only when they are first accessed, which keeps importing the package fast
+_LAZY_IMPORTS = {
+    ".api": (
+        "AsyncProcessRequest",
+        "BatchProcessClient",
+        "BatchProcessRequest",
+        "BatchRequestStatus",
+        "BatchStatisticalRequest",
+        "BatchUserAction",
+        "ByocCollection",
+        "ByocCollectionAdditionalData",
+        "ByocCollectionBand",
+        "ByocTile",
+        "CatalogCache",
+        "SentinelHubBatchStatistical",
+        "SentinelHubBYOC",
+        "SentinelHubCatalog",
+        "SentinelHubRequest",
+        "SentinelHubStatistical",
+        "WcsRequest",
+        "WebFeatureService",
+        "WmsRequest",
+        "get_async_running_status",
+        "monitor_batch_process_analysis",
+        "monitor_batch_process_job",
+        "monitor_batch_statistical_analysis",
+        "monitor_batch_statistical_job",
+    ),
+    ".api.opensearch": ("opensearch", "get_area_dates", "get_area_info", "get_tile_info", "get_tile_info_id"),
+    ".api.ogc": ("CustomUrlParam",),
+    ".areas": (
+        "BBoxSplitter",
+        "CustomGridSplitter",
+        "OsmSplitter",
+        "TileGrid",
+        "TileGridSplitter",
+        "TileSplitter",
+        "UtmGridSplitter",
+        "UtmZoneSplitter",
+    ),
+    ".config": ("FrozenSHConfig", "SHConfig"),
+    ".constants": ("CRS", "MimeType", "MosaickingOrder", "ResamplingType", "ServiceType", "ServiceUrl", "SHConstants"),
+    ".data_collections": ("DataCollection",),
+    ".data_collections_bands": ("Band", "Unit"),
+    ".download": (
+        "DownloadClient",
+        "DownloadRequest",
+        "SentinelHubDownloadClient",
+        "SentinelHubSession",
+        "SentinelHubStatisticalDownloadClient",
+    ),
+    ".evalscript": ("generate_evalscript", "parse_data_collection_bands"),
+    ".exceptions": ("AwsDownloadFailedException", "DownloadFailedException"),
+    ".geo_utils": (
+        "bbox_to_dimensions",
+        "bbox_to_dimensions_many",
+        "bbox_to_resolution",
+        "get_image_dimension",
+        "get_utm_bbox",
+        "get_utm_crs",
+        "get_utm_crs_array",
+        "pixel_to_utm",
+        "to_utm_bbox",
+        "to_wgs84",
+        "transform_point",
+        "transform_points",
+        "utm_to_pixel",
+        "wgs84_to_pixel",
+        "wgs84_to_utm",
+    ),
+    ".geometry": ("BBox", "BBoxArray", "Geometry", "GeometryArray"),
+    ".geopedia": ("GeopediaFeatureIterator", "GeopediaImageRequest", "GeopediaSession", "GeopediaWmsRequest"),
+    ".io_utils": ("read_data", "read_many", "write_data", "write_many"),
+    ".json_utils": ("get_json_backend", "set_json_backend"),
+    ".time_utils": ("filter_times", "is_valid_time", "parse_time", "parse_time_interval", "serialize_time"),
+}
+_NAME_TO_MODULE = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
+_SUBMODULES = frozenset(
+    {
+        "api",
+        "areas",
+        "aws",
+        "base",
+        "commands",
+        "config",
+        "constants",
+        "data_collections",
+        "data_collections_bands",
+        "data_utils",
+        "decoding",
+        "download",
+        "evalscript",
+        "exceptions",
+        "geo_utils",
+        "geometry",
+        "geopedia",
+        "io_utils",
+        "json_utils",
+        "testing_utils",
+        "time_utils",
+        "types",
+    }
 )
-from .geometry import BBox, Geometry
-from .geopedia import GeopediaFeatureIterator, GeopediaImageRequest, GeopediaSession, GeopediaWmsRequest
-from .io_utils import read_data, write_data
-from .time_utils import filter_times, is_valid_time, parse_time, parse_time_interval, serialize_time
+
+__all__ = ["__version__", *_NAME_TO_MODULE]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a public name from its module or a submodule on the first access, as described in PEP 562."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _NAME_TO_MODULE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_NAME_TO_MODULE[name], __name__)
+    # Submodule `opensearch` is itself a public name
+    value = module if module.__name__.rpartition(".")[2] == name else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
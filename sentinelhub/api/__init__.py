@@ -2,21 +2,86 @@
 The part of the package that implements interface with Sentinel Hub services.
 """
 
-from .batch import (
-    BatchProcessClient,
-    BatchProcessRequest,
-    BatchRequestStatus,
-    BatchStatisticalRequest,
-    BatchUserAction,
-    SentinelHubBatchStatistical,
-    monitor_batch_process_analysis,
-    monitor_batch_process_job,
-    monitor_batch_statistical_analysis,
-    monitor_batch_statistical_job,
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batch import (
+        BatchProcessClient,
+        BatchProcessRequest,
+        BatchRequestStatus,
+        BatchStatisticalRequest,
+        BatchUserAction,
+        SentinelHubBatchStatistical,
+        monitor_batch_process_analysis,
+        monitor_batch_process_job,
+        monitor_batch_statistical_analysis,
+        monitor_batch_statistical_job,
+    )
+    from .byoc import ByocCollection, ByocCollectionAdditionalData, ByocCollectionBand, ByocTile, SentinelHubBYOC
+    from .catalog import SentinelHubCatalog
+    from .catalog_cache import CatalogCache
+    from .ogc import WcsRequest, WmsRequest
+    from .process import AsyncProcessRequest, SentinelHubRequest, get_async_running_status
+    from .statistical import SentinelHubStatistical
+    from .wfs import WebFeatureService
+
+# Public names are imported only when they are first accessed, which keeps importing the package fast
+_LAZY_IMPORTS = {
+    ".batch": (
+        "BatchProcessClient",
+        "BatchProcessRequest",
+        "BatchRequestStatus",
+        "BatchStatisticalRequest",
+        "BatchUserAction",
+        "SentinelHubBatchStatistical",
+        "monitor_batch_process_analysis",
+        "monitor_batch_process_job",
+        "monitor_batch_statistical_analysis",
+        "monitor_batch_statistical_job",
+    ),
+    ".byoc": ("ByocCollection", "ByocCollectionAdditionalData", "ByocCollectionBand", "ByocTile", "SentinelHubBYOC"),
+    ".catalog": ("SentinelHubCatalog",),
+    ".catalog_cache": ("CatalogCache",),
+    ".ogc": ("WcsRequest", "WmsRequest"),
+    ".process": ("AsyncProcessRequest", "SentinelHubRequest", "get_async_running_status"),
+    ".statistical": ("SentinelHubStatistical",),
+    ".wfs": ("WebFeatureService",),
+}
+_NAME_TO_MODULE = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
+_SUBMODULES = frozenset(
+    {
+        "base",
+        "base_request",
+        "batch",
+        "byoc",
+        "catalog",
+        "catalog_cache",
+        "ogc",
+        "opensearch",
+        "process",
+        "statistical",
+        "utils",
+        "wfs",
+    }
 )
-from .byoc import ByocCollection, ByocCollectionAdditionalData, ByocCollectionBand, ByocTile, SentinelHubBYOC
-from .catalog import SentinelHubCatalog
-from .ogc import WcsRequest, WmsRequest
-from .process import AsyncProcessRequest, SentinelHubRequest, get_async_running_status
-from .statistical import SentinelHubStatistical
-from .wfs import WebFeatureService
+
+__all__ = [*_NAME_TO_MODULE]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a public name from its module or a submodule on the first access, as described in PEP 562."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _NAME_TO_MODULE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_NAME_TO_MODULE[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
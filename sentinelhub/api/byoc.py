@@ -7,7 +7,7 @@ Module implementing an interface with
 # do not use `from __future__ import annotations`, it clashes with `dataclass_json`
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Literal, Optional, Union
 
 from dataclasses_json import CatchAll, LetterCase, Undefined, dataclass_json
 from dataclasses_json import config as dataclass_config
@@ -162,7 +162,12 @@ class SentinelHubBYOC(SentinelHubService):
         return self.client.get_json(url=url, request_type=RequestType.POST, use_session=True)
 
     def iter_tiles(
-        self, collection: CollectionType, sort: Optional[str] = None, path: Optional[str] = None, **kwargs: Any
+        self,
+        collection: CollectionType,
+        sort: Optional[str] = None,
+        path: Optional[str] = None,
+        feature_storage: Literal["memory", "disk", "none"] = "memory",
+        **kwargs: Any,
     ) -> SentinelHubFeatureIterator:
         """Iterator over collection tiles
 
@@ -171,6 +176,8 @@ class SentinelHubBYOC(SentinelHubService):
         :param collection: a ByocCollection, dict or collection id string
         :param sort: Order in which to return tiles
         :param path: An exact path where tiles are located
+        :param feature_storage: Where to keep tiles that were already obtained, either in `"memory"`, in a temporary
+            file on `"disk"` or `"none"`. Check `FeatureIterator` for more info.
         :param kwargs: Any other request parameters
         :return: An iterator over payloads of tiles from the collection
         """
@@ -180,6 +187,7 @@ class SentinelHubBYOC(SentinelHubService):
             url=f"{self.service_url}/collections/{collection_id}/tiles",
             params={"sort": sort, "path": path, **kwargs},
             exception_message=f"Failed to obtain information about tiles in BYOC collection {collection_id}",
+            feature_storage=feature_storage,
         )
 
     def get_tile(self, collection: CollectionType, tile: TileType) -> JsonDict:
@@ -5,7 +5,13 @@ A client interface for `Sentinel Hub Catalog API <https://docs.sentinel-hub.com/
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any, Iterable, Literal
+import itertools as it
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Sequence, Tuple, cast
+
+import numpy as np
+import shapely
 
 from ..base import FeatureIterator
 from ..config import SHConfig
@@ -16,6 +22,11 @@ from ..types import JsonDict, RawTimeIntervalType, RawTimeType
 from .base import SentinelHubService
 from .utils import remove_undefined
 
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
+
+    from .catalog_cache import CatalogCache
+
 
 class SentinelHubCatalog(SentinelHubService):
     """The main class for interacting with Sentinel Hub Catalog API
@@ -97,6 +108,8 @@ class SentinelHubCatalog(SentinelHubService):
         fields: JsonDict | None = None,
         distinct: str | None = None,
         limit: int = 100,
+        prefetch: bool = False,
+        cache: CatalogCache | None = None,
         **kwargs: Any,
     ) -> CatalogSearchIterator:
         """Catalog STAC search
@@ -121,6 +134,10 @@ class SentinelHubCatalog(SentinelHubService):
         :param distinct: A special query attribute described in Catalog API documentation
         :param limit: A number of results to return per each request. At the end iterator will always provide all
             results the difference is only in how many requests it will have to make in the background.
+        :param prefetch: If `True` the iterator will request the next page of results in a background thread while
+            the current page is being consumed.
+        :param cache: A local cache of search results. If given, a search with a bounding box and a bounded time
+            interval will be answered from the cache and only the missing parts will be requested from the service.
         :param kwargs: Any other parameters that will be passed directly to the service
         """
 
@@ -157,7 +174,70 @@ class SentinelHubCatalog(SentinelHubService):
             }
         )
 
-        return CatalogSearchIterator(self.client, url, payload)
+        if cache is not None and cache.is_cacheable(payload):
+            return cache.search(self.client, url, payload)
+        return CatalogSearchIterator(self.client, url, payload, prefetch=prefetch)
+
+    def search_parallel(
+        self,
+        collection: DataCollection | str,
+        *,
+        time: RawTimeIntervalType,
+        bbox: BBox | None = None,
+        time_split: dt.timedelta | None = None,
+        bbox_split: tuple[int, int] | None = None,
+        max_threads: int | None = None,
+        **kwargs: Any,
+    ) -> list[JsonDict]:
+        """Splits a large catalog search into smaller searches over time windows and/or parts of a bounding box and
+        runs them in parallel. The results are merged and features that are returned by multiple searches, e.g. those
+        on a border between two parts, are included only once.
+
+        :param collection: A data collection object or a collection ID
+        :param time: A time interval of the search.
+        :param bbox: A search bounding box. It can only be split if it is given.
+        :param time_split: A length of time windows into which the time interval is split. By default, the time
+            interval is not split.
+        :param bbox_split: A number of columns and rows into which the bounding box is split. By default, the bounding
+            box is not split.
+        :param max_threads: Maximum number of threads used to run searches in parallel.
+        :param kwargs: Any other parameters of the `search` method.
+        :return: A list of features, ordered by time windows and then by parts of the bounding box.
+        """
+        start_time, end_time = cast(Tuple[dt.datetime, dt.datetime], parse_time_interval(time))
+        time_windows = [(start_time, end_time)]
+        if time_split is not None:
+            if time_split <= dt.timedelta(0):
+                raise ValueError(f"Parameter `time_split` should be a positive time difference, got {time_split}")
+
+            time_windows = []
+            window_start = start_time
+            while window_start < end_time:
+                time_windows.append((window_start, min(window_start + time_split, end_time)))
+                window_start += time_split
+
+        bboxes: list[BBox | None] = [bbox]
+        if bbox_split is not None:
+            if bbox is None:
+                raise ValueError("Parameter `bbox_split` can only be used together with parameter `bbox`")
+            num_x, num_y = bbox_split
+            bboxes = [*it.chain.from_iterable(bbox.get_partition(num_x=num_x, num_y=num_y))]
+
+        def _search_part(time_window: tuple[dt.datetime, dt.datetime], part_bbox: BBox | None) -> list[JsonDict]:
+            return list(self.search(collection, time=time_window, bbox=part_bbox, **kwargs))
+
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            futures = [
+                executor.submit(_search_part, time_window, part_bbox)
+                for time_window in time_windows
+                for part_bbox in bboxes
+            ]
+            results = [future.result() for future in futures]
+
+        features: dict[str, JsonDict] = {}
+        for feature in it.chain.from_iterable(results):
+            features.setdefault(feature["id"], feature)
+        return list(features.values())
 
     @staticmethod
     def _parse_collection_id(collection: str | DataCollection) -> str:
@@ -234,22 +314,47 @@ class SentinelHubCatalog(SentinelHubService):
 class CatalogSearchIterator(FeatureIterator[JsonDict]):
     """Searches a catalog with a given query and provides results"""
 
-    def __init__(self, *args: Any, **kwargs: Any):
+    def __init__(self, *args: Any, prefetch: bool = False, **kwargs: Any):
+        """
+        :param args: Arguments passed to FeatureIterator
+        :param prefetch: If `True` the next page of results is requested in a background thread as soon as the
+            current page is obtained.
+        :param kwargs: Keyword arguments passed to FeatureIterator
+        """
         super().__init__(*args, **kwargs)
         self.next: JsonDict | None = None
 
+        self.prefetch = prefetch
+        self._executor: ThreadPoolExecutor | None = None
+        self._next_page: Future | None = None
+
     def _fetch_features(self) -> Iterable[JsonDict]:
         """Collects more results from the service"""
-        payload = remove_undefined({**self.params, "next": self.next})
-
-        results = self.client.get_json_dict(self.url, post_values=payload, use_session=True)
+        if self._next_page is None:
+            results = self._fetch_page(self.next)
+        else:
+            results = self._next_page.result()
+            self._next_page = None
 
         self.next = results["context"].get("next")
         new_features = results["features"]
         self.finished = self.next is None or not new_features
 
+        if self.prefetch and not self.finished:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._next_page = self._executor.submit(self._fetch_page, self.next)
+        elif self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         return new_features
 
+    def _fetch_page(self, next_token: JsonDict | None) -> JsonDict:
+        """Makes a single search request for a page of results"""
+        payload = remove_undefined({**self.params, "next": next_token})
+        return self.client.get_json_dict(self.url, post_values=payload, use_session=True)
+
     def get_timestamps(self) -> list[dt.datetime]:
         """Provides features timestamps
 
@@ -271,6 +376,68 @@ class CatalogSearchIterator(FeatureIterator[JsonDict]):
         """
         return [feature["id"] for feature in self]
 
+    def to_arrays(self, properties: Sequence[str] = ()) -> dict[str, np.ndarray]:
+        """Collects features IDs, timestamps, geometries and selected properties in a single pass over features
+
+        :param properties: Names of feature properties to collect, e.g. `["eo:cloud_cover"]`.
+        :return: A dictionary with an array of IDs under `"ids"`, an array of UTC sensing times of type
+            `datetime64[ms]` under `"timestamps"`, an array of `shapely` geometries in WGS 84 under `"geometries"`
+            and an array for each of the given properties under its name.
+        """
+        features = list(self)
+
+        ids = np.array([feature["id"] for feature in features], dtype=object)
+        timestamps = _parse_datetime64([feature.get("properties", {}).get("datetime") for feature in features])
+        geometries = shapely.from_geojson(
+            np.array(
+                [json.dumps(feature["geometry"]) if feature.get("geometry") else None for feature in features],
+                dtype=object,
+            )
+        )
+
+        arrays = {"ids": ids, "timestamps": timestamps, "geometries": geometries}
+        for property_name in properties:
+            values = [feature.get("properties", {}).get(property_name) for feature in features]
+            try:
+                arrays[property_name] = np.array(values)
+            except ValueError:  # values of different shapes are kept in an array of objects
+                arrays[property_name] = np.empty(len(values), dtype=object)
+                arrays[property_name][:] = values
+
+        return arrays
+
+    def to_geodataframe(self, properties: Sequence[str] = ()) -> GeoDataFrame:
+        """Collects features into a `GeoDataFrame` with the same columns as arrays from `to_arrays` method. It requires
+        an additional dependency `geopandas`.
+
+        :param properties: Names of feature properties to collect, e.g. `["eo:cloud_cover"]`.
+        :return: A dataframe with a geometry column `"geometries"` in WGS 84.
+        """
+        try:
+            import geopandas  # pylint: disable=import-outside-toplevel
+        except ImportError as exception:
+            raise ImportError("Package `geopandas` is required to create a `GeoDataFrame` of features") from exception
+
+        arrays = self.to_arrays(properties=properties)
+        columns = {name: list(values) if values.ndim > 1 else values for name, values in arrays.items()}
+        return geopandas.GeoDataFrame(columns, geometry="geometries", crs=CRS.WGS84.pyproj_crs())
+
+
+def _parse_datetime64(times: list[str | None]) -> np.ndarray:
+    """Parses ISO 8601 time strings into an array of UTC times of type `datetime64[ms]`. Strings in UTC time zone are
+    parsed by `numpy` in bulk, other strings are parsed one by one."""
+    utc_times: list[str | None] = []
+    for time in times:
+        if time is None or time.endswith("Z"):
+            utc_times.append(time and time[:-1])
+        else:
+            parsed_time = parse_time(time, force_datetime=True)
+            if parsed_time.tzinfo is not None:
+                parsed_time = parsed_time.astimezone(dt.timezone.utc).replace(tzinfo=None)
+            utc_times.append(parsed_time.isoformat())
+
+    return np.array(utc_times, dtype="datetime64[ms]")
+
 
 def get_available_timestamps(
     bbox: BBox,
@@ -281,6 +448,7 @@ def get_available_timestamps(
     ignore_tz: bool = True,
     maxcc: float | None = None,
     config: SHConfig | None = None,
+    cache: CatalogCache | None = None,
 ) -> list[dt.datetime]:
     """Helper function to search for all available timestamps for a given area and query parameters.
 
@@ -292,6 +460,7 @@ def get_available_timestamps(
     :param ignore_tz: Ignore the time zone part in the returned timestamps. Default is True.
     :param maxcc: Maximum cloud coverage filter from interval [0, 1]. Default is None.
     :param config: The SH configuration object.
+    :param cache: A local cache of Catalog API search results.
     :return: A list of timestamps of available observations.
     """
     query_filter = None
@@ -309,7 +478,7 @@ def get_available_timestamps(
 
     catalog = SentinelHubCatalog(config=config)
     search_iterator = catalog.search(
-        collection=data_collection, bbox=bbox, time=time_interval, filter=query_filter, fields=fields
+        collection=data_collection, bbox=bbox, time=time_interval, filter=query_filter, fields=fields, cache=cache
     )
 
     timestamps = [parse_time(ts, force_datetime=True, ignoretz=ignore_tz) for ts in search_iterator.get_timestamps()]
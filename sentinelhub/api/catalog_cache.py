@@ -0,0 +1,231 @@
+"""
+A local cache of `Sentinel Hub Catalog API <https://docs.sentinel-hub.com/api/latest/api/catalog>`__ search results.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sqlite3
+from threading import Lock
+from typing import Iterable
+
+import shapely.geometry
+
+from ..download import DownloadClient
+from ..time_utils import parse_time
+from ..types import JsonDict
+from .catalog import CatalogSearchIterator
+
+_UNCACHED_PARAMS = ("intersects", "ids", "distinct", "next")
+_QUERY_EXCLUDED_PARAMS = ("datetime", "bbox", "limit", "next")
+
+
+class CatalogCache:
+    """A persistent cache of Catalog API search features, stored in an SQLite database.
+
+    The cache keeps all features it has seen, indexed by acquisition time and with an R-tree index of their bounding
+    boxes. It also keeps records of which bounding boxes and time intervals have already been searched. A new search
+    is answered from the local database and the service is only queried for the parts of the time interval that have
+    not been searched yet for an area containing the search bounding box.
+
+    Only searches defined with a bounding box and a bounded time interval are cached. Searches with different `fields`
+    parameters are cached separately. Features without an acquisition time, e.g. because `fields` exclude it, are
+    stored without a timestamp and are returned for any searched time interval.
+    """
+
+    def __init__(self, filename: str = ":memory:", *, staleness: dt.timedelta = dt.timedelta(days=7)):
+        """
+        :param filename: A path to an SQLite database file. If the file doesn't exist it will be created. By default,
+            the cache is kept only in memory.
+        :param staleness: Search results for acquisition times closer than this to the time of the search are
+            considered stale and will be requested from the service again. This is because the service might still
+            be ingesting new acquisitions for recent dates.
+        """
+        self.filename = filename
+        self.staleness = staleness
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        """Creates database tables if they don't exist yet."""
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS features (
+                    id INTEGER PRIMARY KEY,
+                    query_key TEXT NOT NULL,
+                    feature_id TEXT NOT NULL,
+                    timestamp REAL,
+                    feature TEXT NOT NULL,
+                    UNIQUE (query_key, feature_id)
+                );
+                CREATE INDEX IF NOT EXISTS features_time ON features (query_key, timestamp);
+                CREATE VIRTUAL TABLE IF NOT EXISTS features_rtree USING rtree(id, min_x, max_x, min_y, max_y);
+                CREATE TABLE IF NOT EXISTS searches (
+                    query_key TEXT NOT NULL,
+                    min_x REAL NOT NULL,
+                    min_y REAL NOT NULL,
+                    max_x REAL NOT NULL,
+                    max_y REAL NOT NULL,
+                    start_time REAL NOT NULL,
+                    end_time REAL NOT NULL,
+                    search_time REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS searches_query ON searches (query_key);
+                """
+            )
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._connection.close()
+
+    def clear(self) -> None:
+        """Removes all cached features and search records."""
+        with self._lock, self._connection:
+            self._connection.executescript("DELETE FROM features; DELETE FROM features_rtree; DELETE FROM searches;")
+
+    @staticmethod
+    def is_cacheable(payload: JsonDict) -> bool:
+        """Checks if a search with a given payload can be answered by the cache."""
+        if any(param in payload for param in _UNCACHED_PARAMS) or "bbox" not in payload:
+            return False
+        return ".." not in payload.get("datetime", "..").split("/")
+
+    def search(self, client: DownloadClient, url: str, payload: JsonDict) -> CatalogSearchIterator:
+        """Answers a search from the local database. Parts of the search time interval which have not been searched
+        yet are first requested from the service and added to the cache.
+
+        :param client: A download client used for requests to the service.
+        :param url: A URL of the Catalog API search endpoint.
+        :param payload: A search payload, as prepared by `SentinelHubCatalog.search`.
+        :return: A search iterator which already contains all features.
+        """
+        if not self.is_cacheable(payload):
+            raise ValueError("Only searches with a bounding box and a bounded time interval can be cached.")
+
+        query_key = self._get_query_key(payload)
+        bbox = payload["bbox"]
+        start_time, end_time = (
+            parse_time(time, force_datetime=True).timestamp() for time in payload["datetime"].split("/")
+        )
+
+        for gap_start, gap_end in self._get_uncovered_intervals(query_key, bbox, start_time, end_time):
+            gap_payload = dict(payload)
+            gap_payload["datetime"] = "/".join(
+                dt.datetime.fromtimestamp(time, tz=dt.timezone.utc).isoformat().replace("+00:00", "Z")
+                for time in (gap_start, gap_end)
+            )
+            search_time = dt.datetime.now(tz=dt.timezone.utc).timestamp()
+            features = list(CatalogSearchIterator(client, url, gap_payload))
+            self._add_search(query_key, bbox, gap_start, gap_end, search_time, features)
+
+        search_iterator = CatalogSearchIterator(client, url, payload)
+        search_iterator.features = self._query_features(query_key, bbox, start_time, end_time)
+        search_iterator.finished = True
+        return search_iterator
+
+    @staticmethod
+    def _get_query_key(payload: JsonDict) -> str:
+        """Creates a key from all search parameters which define a set of features in an area and a time interval."""
+        query = {key: value for key, value in payload.items() if key not in _QUERY_EXCLUDED_PARAMS}
+        return json.dumps(query, sort_keys=True)
+
+    def _get_uncovered_intervals(
+        self, query_key: str, bbox: list[float], start_time: float, end_time: float
+    ) -> list[tuple[float, float]]:
+        """Provides parts of the time interval which were not searched yet for an area containing the bounding box.
+        Search results for times within the staleness window of a search are not considered as covered."""
+        min_x, min_y, max_x, max_y = bbox
+        staleness = self.staleness.total_seconds()
+        with self._lock:
+            covered_intervals = self._connection.execute(
+                """
+                SELECT start_time, MIN(end_time, search_time - ?) AS covered_end FROM searches
+                WHERE query_key = ? AND min_x <= ? AND min_y <= ? AND max_x >= ? AND max_y >= ?
+                    AND start_time <= ? AND covered_end >= ?
+                ORDER BY start_time
+                """,
+                (staleness, query_key, min_x, min_y, max_x, max_y, end_time, start_time),
+            ).fetchall()
+
+        covered_intervals = [(start, end) for start, end in covered_intervals if start <= end]
+        if not covered_intervals:
+            return [(start_time, end_time)]
+
+        uncovered_intervals = []
+        current_start = start_time
+        for covered_start, covered_end in covered_intervals:
+            if covered_start > current_start:
+                uncovered_intervals.append((current_start, covered_start))
+            current_start = max(current_start, covered_end)
+        if current_start < end_time:
+            uncovered_intervals.append((current_start, end_time))
+
+        return uncovered_intervals
+
+    def _add_search(
+        self,
+        query_key: str,
+        bbox: list[float],
+        start_time: float,
+        end_time: float,
+        search_time: float,
+        features: Iterable[JsonDict],
+    ) -> None:
+        """Stores features obtained by a search and a record of the search."""
+        with self._lock, self._connection:
+            for feature in features:
+                acquisition_time = feature.get("properties", {}).get("datetime")
+                timestamp = (
+                    None if acquisition_time is None else parse_time(acquisition_time, force_datetime=True).timestamp()
+                )
+                if feature.get("geometry"):
+                    feature_bbox = shapely.geometry.shape(feature["geometry"]).bounds
+                else:
+                    feature_bbox = feature.get("bbox", bbox)
+
+                self._connection.execute(
+                    "DELETE FROM features_rtree WHERE id IN "
+                    "(SELECT id FROM features WHERE query_key = ? AND feature_id = ?)",
+                    (query_key, feature["id"]),
+                )
+                cursor = self._connection.execute(
+                    "INSERT OR REPLACE INTO features (query_key, feature_id, timestamp, feature) VALUES (?, ?, ?, ?)",
+                    (query_key, feature["id"], timestamp, json.dumps(feature)),
+                )
+                min_x, min_y, max_x, max_y = feature_bbox
+                self._connection.execute(
+                    "INSERT INTO features_rtree VALUES (?, ?, ?, ?, ?)", (cursor.lastrowid, min_x, max_x, min_y, max_y)
+                )
+
+            self._connection.execute(
+                "INSERT INTO searches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (query_key, *bbox, start_time, end_time, search_time),
+            )
+
+    def _query_features(self, query_key: str, bbox: list[float], start_time: float, end_time: float) -> list[JsonDict]:
+        """Collects cached features which intersect the bounding box and were acquired within the time interval or
+        have no acquisition time."""
+        min_x, min_y, max_x, max_y = bbox
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT features.feature FROM features JOIN features_rtree ON features.id = features_rtree.id
+                WHERE features.query_key = ? AND (features.timestamp BETWEEN ? AND ? OR features.timestamp IS NULL)
+                    AND features_rtree.min_x <= ? AND features_rtree.max_x >= ?
+                    AND features_rtree.min_y <= ? AND features_rtree.max_y >= ?
+                ORDER BY features.timestamp, features.feature_id
+                """,
+                (query_key, start_time, end_time, max_x, min_x, max_y, min_y),
+            ).fetchall()
+
+        search_box = shapely.geometry.box(min_x, min_y, max_x, max_y)
+        features = [json.loads(feature) for (feature,) in rows]
+        return [
+            feature
+            for feature in features
+            if not feature.get("geometry") or shapely.geometry.shape(feature["geometry"]).intersects(search_box)
+        ]
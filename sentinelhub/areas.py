@@ -4,13 +4,20 @@ Module for working with large geographical areas
 
 from __future__ import annotations
 
+import copy
+import datetime as dt
+import functools
 import itertools
 import json
 import math
 import os
 from abc import ABCMeta, abstractmethod
-from typing import Any, ClassVar, Iterable, TypeVar, cast
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, ClassVar, Iterable, Iterator, TypeVar, cast
 
+import numpy as np
 import shapely
 import shapely.geometry
 import shapely.ops
@@ -18,14 +25,17 @@ from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
 from shapely.geometry.base import BaseGeometry
 
 from .api import SentinelHubCatalog
+from .api.catalog_cache import CatalogCache
 from .config import SHConfig
 from .constants import CRS
 from .data_collections import DataCollection
 from .geo_utils import transform_point
-from .geometry import BBox, Geometry, _BaseGeometry
+from .geometry import BBox, BBoxArray, Geometry, _BaseGeometry, _get_partition_params
 
 T = TypeVar("T", float, int)
 
+_SPLIT_CHUNK_SIZE = 2**16
+
 
 class AreaSplitter(metaclass=ABCMeta):
     """Abstract class for splitter classes. It implements common methods used for splitting large area into smaller
@@ -49,8 +59,15 @@ class AreaSplitter(metaclass=ABCMeta):
         self.area_shape = self._join_shape_list(self.shape_list)
         self.reduce_bbox_sizes = reduce_bbox_sizes
 
+        # Shapes are copied so that preparing them doesn't modify geometries given by the caller
+        self._shape_array = np.empty(len(self.shape_list), dtype=object)
+        self._shape_array[:] = [copy.copy(shape) for shape in self.shape_list]
+        shapely.prepare(self._shape_array)
+        self._shape_tree = shapely.STRtree(self._shape_array)
+
         self.area_bbox = self.get_area_bbox()
-        self.bbox_list, self.info_list = self._make_split()
+        self._split: tuple[BBoxArray, list[dict[str, object]]] | None = None
+        self._bbox_list: list[BBox] | None = None
 
     @staticmethod
     def _parse_shape(shape: Polygon | MultiPolygon | _BaseGeometry, crs: CRS) -> Polygon | MultiPolygon:
@@ -75,8 +92,41 @@ class AreaSplitter(metaclass=ABCMeta):
         return shapely.ops.cascaded_union(shape_list)
 
     @abstractmethod
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
-        """The abstract method where the splitting will happen"""
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
+        """The abstract method where the splitting will happen. It yields consecutive parts of the split, each one as a
+        collection of bounding boxes together with a list of their info dictionaries."""
+
+    def _make_split(self) -> tuple[BBoxArray, list[dict[str, object]]]:
+        """Collects all parts of the split"""
+        bbox_arrays: list[BBoxArray] = []
+        info_list: list[dict[str, object]] = []
+        for bbox_array, infos in self._iter_split():
+            bbox_arrays.append(bbox_array)
+            info_list.extend(infos)
+        return BBoxArray.concatenate(bbox_arrays, crs=self.crs), info_list
+
+    @property
+    def bbox_array(self) -> BBoxArray:
+        """A collection of bounding boxes obtained in split. The split is made on first access."""
+        if self._split is None:
+            self._split = self._make_split()
+        return self._split[0]
+
+    @property
+    def info_list(self) -> list[dict[str, object]]:
+        """A list of dictionaries with information about bounding boxes obtained in split. The split is made on first
+        access."""
+        if self._split is None:
+            self._split = self._make_split()
+        return self._split[1]
+
+    @property
+    def bbox_list(self) -> list[BBox]:
+        """A list of bounding boxes obtained in split. The `BBox` objects are created from `bbox_array` on first
+        access."""
+        if self._bbox_list is None:
+            self._bbox_list = self.bbox_array.to_list()
+        return self._bbox_list
 
     def get_bbox_list(
         self,
@@ -93,18 +143,73 @@ class AreaSplitter(metaclass=ABCMeta):
             fit the given geometry in `shape_list`. This overrides the same parameter from constructor
         :return: List of bounding boxes
         """
-        bbox_list = self.bbox_list
+        if reduce_bbox_sizes is None:
+            reduce_bbox_sizes = self.reduce_bbox_sizes
+        if not (crs or buffer or reduce_bbox_sizes):
+            return self.bbox_list
+        return self._process_bbox_array(self.bbox_array, crs, buffer, reduce_bbox_sizes).to_list()
+
+    def get_bbox_array(
+        self,
+        crs: CRS | None = None,
+        buffer: None | float | tuple[float, float] = None,
+        reduce_bbox_sizes: bool | None = None,
+    ) -> BBoxArray:
+        """Returns a collection of bounding boxes that are the result of the split. Parameters are the same as in
+        `get_bbox_list`, but all operations are vectorised over the entire collection.
+
+        :param crs: Coordinate reference system in which the bounding boxes should be returned. If `None` the CRS will
+            be the default CRS of the splitter.
+        :param buffer: A percentage of each BBox size increase. This will cause neighbouring bounding boxes to overlap.
+        :param reduce_bbox_sizes: If `True` it will reduce the sizes of bounding boxes so that they will tightly
+            fit the given geometry in `shape_list`. This overrides the same parameter from constructor
+        :return: A collection of bounding boxes
+        """
+        return self._process_bbox_array(self.bbox_array, crs, buffer, reduce_bbox_sizes)
+
+    def iter_split(
+        self,
+        crs: CRS | None = None,
+        buffer: None | float | tuple[float, float] = None,
+        reduce_bbox_sizes: bool | None = None,
+    ) -> Iterator[tuple[BBox, dict[str, object]]]:
+        """Lazily iterates over bounding boxes of the split together with their info dictionaries. Parameters are the
+        same as in `get_bbox_list`.
+
+        If the split hasn't been made yet, it is computed part by part while iterating and nothing is stored in the
+        splitter. This way processing of the first bounding boxes can start before the entire area is split and memory
+        usage doesn't grow with the size of the area.
+
+        :param crs: Coordinate reference system in which the bounding boxes should be returned. If `None` the CRS will
+            be the default CRS of the splitter.
+        :param buffer: A percentage of each BBox size increase. This will cause neighbouring bounding boxes to overlap.
+        :param reduce_bbox_sizes: If `True` it will reduce the sizes of bounding boxes so that they will tightly
+            fit the given geometry in `shape_list`. This overrides the same parameter from constructor
+        :return: An iterator of pairs of a bounding box and its info dictionary
+        """
+        split_parts = self._iter_split() if self._split is None else iter([self._split])
+        for bbox_array, infos in split_parts:
+            yield from zip(self._process_bbox_array(bbox_array, crs, buffer, reduce_bbox_sizes), infos)
+
+    def _process_bbox_array(
+        self,
+        bbox_array: BBoxArray,
+        crs: CRS | None,
+        buffer: None | float | tuple[float, float],
+        reduce_bbox_sizes: bool | None,
+    ) -> BBoxArray:
+        """Buffers, reduces and transforms bounding boxes obtained in split."""
         if buffer:
-            bbox_list = [bbox.buffer(buffer, relative=True) for bbox in bbox_list]
+            bbox_array = bbox_array.buffer(buffer, relative=True)
 
         if reduce_bbox_sizes is None:
             reduce_bbox_sizes = self.reduce_bbox_sizes
         if reduce_bbox_sizes:
-            bbox_list = self._reduce_sizes(bbox_list)
+            bbox_array = self._reduce_sizes(bbox_array)
 
         if crs:
-            return [bbox.transform(crs) for bbox in bbox_list]
-        return bbox_list
+            return bbox_array.transform(crs)
+        return bbox_array
 
     def get_geometry_list(self) -> list[Polygon | MultiPolygon]:
         """For each bounding box an intersection with the shape of entire given area is calculated. CRS of the returned
@@ -112,7 +217,7 @@ class AreaSplitter(metaclass=ABCMeta):
 
         :return: List of polygons or multipolygons corresponding to the order of bounding boxes
         """
-        return [self._intersection_area(bbox) for bbox in self.bbox_list]
+        return list(shapely.intersection(self.bbox_array.transform(self.crs).geometries, self.area_shape))
 
     def get_info_list(self) -> list[dict[str, object]]:
         """Returns a list of dictionaries containing information about bounding boxes obtained in split. The order in
@@ -146,34 +251,25 @@ class AreaSplitter(metaclass=ABCMeta):
             return bbox
         return bbox.transform(crs)
 
-    def _intersects_area(self, bbox: BBox) -> bool:
-        """Checks if the bounding box intersects the entire area
+    def _intersects_area_array(self, bbox_array: BBoxArray) -> np.ndarray:
+        """Checks which bounding boxes intersect the entire area. Candidate pairs of bounding boxes and input shapes
+        are obtained from a spatial index of shapes and then tested with prepared shapes in a single vectorised call.
 
-        :param bbox: A bounding box
-        :return: `True` if bbox intersects the entire area else False
+        :param bbox_array: A collection of bounding boxes
+        :return: A boolean array
         """
-        return self._bbox_to_area_polygon(bbox).intersects(self.area_shape)
-
-    def _intersection_area(self, bbox: BBox) -> Polygon | MultiPolygon:
-        """Calculates the intersection of a given bounding box and the entire area
-
-        :param bbox: A bounding box
-        :return: A shape of intersection
-        """
-        return self._bbox_to_area_polygon(bbox).intersection(self.area_shape)
-
-    def _bbox_to_area_polygon(self, bbox: BBox) -> Polygon:
-        """Transforms bounding box into a polygon object in the area CRS.
+        polygons = bbox_array.transform(self.crs).geometries
+        polygon_indices, shape_indices = self._shape_tree.query(polygons)
+        intersects = shapely.intersects(self._shape_array[shape_indices], polygons[polygon_indices])
 
-        :param bbox: A bounding box
-        :return: A polygon
-        """
-        projected_bbox = bbox.transform(self.crs)
-        return projected_bbox.geometry
+        mask = np.zeros(len(bbox_array), dtype=bool)
+        mask[polygon_indices[intersects]] = True
+        return mask
 
-    def _reduce_sizes(self, bbox_list: list[BBox]) -> list[BBox]:
+    def _reduce_sizes(self, bbox_array: BBoxArray) -> BBoxArray:
         """Reduces sizes of bounding boxes"""
-        return [BBox(self._intersection_area(bbox).bounds, self.crs).transform(bbox.crs) for bbox in bbox_list]
+        intersections = shapely.intersection(bbox_array.transform(self.crs).geometries, self.area_shape)
+        return BBoxArray(shapely.bounds(intersections), self.crs).transform(bbox_array.epsg_codes)
 
 
 class BBoxSplitter(AreaSplitter):
@@ -211,64 +307,191 @@ class BBoxSplitter(AreaSplitter):
             raise ValueError("Exactly one of 'split_shape' or 'split_size' needs to be specified.")
         super().__init__(shape_list, crs, **kwargs)
 
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
         mode, split_params = self.split_params
         if mode == "shape":
-            columns, rows = split_params
-            bbox_partition = self.area_bbox.get_partition(num_x=columns, num_y=rows)
+            partition_params = dict(zip(("num_x", "num_y"), split_params))
         else:
-            width, height = split_params
-            bbox_partition = self.area_bbox.get_partition(size_x=width, size_y=height)
+            partition_params = dict(zip(("size_x", "size_y"), split_params))
+        columns, rows, _, _ = _get_partition_params(self.area_bbox, **partition_params)
+
+        chunk_columns = max(_SPLIT_CHUNK_SIZE // rows, 1)
+        for start_column in range(0, columns, chunk_columns):
+            column_range = range(start_column, min(start_column + chunk_columns, columns))
+            bbox_partition = BBoxArray.from_partition(self.area_bbox, **partition_params, column_range=column_range)
+
+            part_indices = np.flatnonzero(self._intersects_area_array(bbox_partition))
+            info_list: list[dict[str, object]] = [
+                {
+                    "parent_bbox": self.area_bbox,
+                    "index_x": start_column + int(index // rows),
+                    "index_y": int(index % rows),
+                }
+                for index in part_indices
+            ]
+            yield bbox_partition[part_indices], info_list
+
+
+@dataclass(frozen=True)
+class TileGrid:
+    """A hierarchical grid of tiles, such as a grid of web map tiles. On zoom level 0 the bounding box of the grid is
+    split into `num_x` columns and `num_y` rows of tiles and on each next zoom level every tile is split into 2 x 2
+    tiles. Columns are indexed from west to east and rows from north to south.
+    """
 
-            columns = len(bbox_partition)
-            rows = len(bbox_partition[0])
+    bbox: BBox
+    num_x: int = 1
+    num_y: int = 1
 
-        bbox_list, info_list = [], []
-        for i, j in itertools.product(range(columns), range(rows)):
-            if self._intersects_area(bbox_partition[i][j]):
-                bbox_list.append(bbox_partition[i][j])
+    @classmethod
+    def web_mercator(cls) -> TileGrid:
+        """A grid of web map tiles, as used by OSM, in EPSG:3857"""
+        pop_web_max = transform_point((180, 0), CRS.WGS84, CRS.POP_WEB)[0]
+        return cls(BBox((-pop_web_max, -pop_web_max, pop_web_max, pop_web_max), crs=CRS.POP_WEB))
 
-                info = {"parent_bbox": self.area_bbox, "index_x": i, "index_y": j}
-                info_list.append(info)
+    @classmethod
+    def wgs84_quad(cls) -> TileGrid:
+        """A grid of tiles in WGS84 with 2 tiles on zoom level 0, each covering one hemisphere"""
+        return cls(BBox((-180, -90, 180, 90), crs=CRS.WGS84), num_x=2, num_y=1)
 
-        return bbox_list, info_list
+    def get_tile_size(self, zoom_level: int) -> tuple[float, float]:
+        """Calculates the size of tiles on a zoom level
 
+        :param zoom_level: A zoom level of the grid
+        :return: Width and height of tiles in units of the grid CRS
+        """
+        scale = 2**zoom_level
+        return (
+            (self.bbox.max_x - self.bbox.min_x) / (self.num_x * scale),
+            (self.bbox.max_y - self.bbox.min_y) / (self.num_y * scale),
+        )
 
-class OsmSplitter(AreaSplitter):
-    """A tool that splits the given area into smaller parts. For the splitting it uses Open Street Map (OSM) grid on
-    the specified zoom level. It calculates bounding boxes of all OSM tiles that intersect the area. If specified by
-    user it can also reduce the sizes of the remaining bounding boxes to best fit the area.
+    def get_tile_bboxes(self, index_x: np.ndarray, index_y: np.ndarray, zoom_level: int) -> BBoxArray:
+        """Calculates bounding boxes of tiles from their indices
+
+        :param index_x: Column indices of tiles
+        :param index_y: Row indices of tiles
+        :param zoom_level: A zoom level of the grid
+        :return: A collection of tile bounding boxes in the grid CRS
+        """
+        size_x, size_y = self.get_tile_size(zoom_level)
+        bounds = np.column_stack(
+            (
+                self.bbox.min_x + index_x * size_x,
+                self.bbox.max_y - (index_y + 1) * size_y,
+                self.bbox.min_x + (index_x + 1) * size_x,
+                self.bbox.max_y - index_y * size_y,
+            )
+        )
+        return BBoxArray(bounds, self.bbox.crs)
+
+
+class TileGridSplitter(AreaSplitter):
+    """A tool that splits the given area into tiles of a hierarchical tile grid on the specified zoom level. It
+    calculates bounding boxes of all tiles that intersect the area. If specified by user it can also reduce the sizes
+    of the remaining bounding boxes to best fit the area.
+
+    Tiles are found by descending the grid one zoom level at a time and keeping only tiles which intersect the area.
+    All of this works on arrays of tile indices and bounding boxes are only created for tiles that intersect the area.
     """
 
     def __init__(
         self,
         shape_list: Iterable[Polygon | MultiPolygon | _BaseGeometry],
         crs: CRS,
+        tile_grid: TileGrid,
         zoom_level: int,
         **kwargs: Any,
     ):
         """
         :param shape_list: A list of geometrical shapes describing the area of interest
         :param crs: Coordinate reference system of the shapes in `shape_list`
-        :param zoom_level: A zoom level defined by OSM. Level 0 is entire world, level 1 splits the world into
-            4 parts, etc.
+        :param tile_grid: A grid of tiles
+        :param zoom_level: A zoom level of the grid on which tiles are obtained
         :param reduce_bbox_sizes: If `True` it will reduce the sizes of bounding boxes so that they will tightly fit
             the given area geometry from `shape_list`.
         """
-        self._POP_WEB_MAX = transform_point((180, 0), CRS.WGS84, CRS.POP_WEB)[0]  # pylint: disable=invalid-name
-
+        self.tile_grid = tile_grid
         self.zoom_level = zoom_level
         super().__init__(shape_list, crs, **kwargs)
 
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
-        self.area_bbox = self.get_area_bbox(CRS.POP_WEB)
+        self.area_bbox = self.get_area_bbox(tile_grid.bbox.crs)
         self._check_area_bbox()
 
-        bbox_list, info_list = self._recursive_split(self.get_world_bbox(), 0, 0, 0)
+    def _check_area_bbox(self) -> None:
+        """The method checks if the area bounding box is completely inside the tile grid.
 
-        for i, bbox in enumerate(bbox_list):
-            bbox_list[i] = bbox.transform(self.crs)
-        return bbox_list, info_list
+        :raises: ValueError
+        """
+        if not self.tile_grid.bbox.geometry.covers(self.area_bbox.geometry):
+            raise ValueError(f"The area bounding box {self.area_bbox!r} is not completely inside the tile grid")
+
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
+        num_x, num_y = self.tile_grid.num_x, self.tile_grid.num_y
+        # tiles of each column are ordered from south to north, the same as on the next zoom levels
+        index_x, index_y = np.repeat(np.arange(num_x), num_y), np.tile(np.arange(num_y)[::-1], num_x)
+
+        for tile_bboxes, tile_index_x, tile_index_y in self._iter_tiles(index_x, index_y, 0):
+            info_list: list[dict[str, object]] = [
+                {"zoom_level": self.zoom_level, "index_x": column, "index_y": row}
+                for column, row in zip(tile_index_x.tolist(), tile_index_y.tolist())
+            ]
+            yield tile_bboxes.transform(self.crs), info_list
+
+    def _iter_tiles(
+        self, index_x: np.ndarray, index_y: np.ndarray, zoom_level: int
+    ) -> Iterator[tuple[BBoxArray, np.ndarray, np.ndarray]]:
+        """Finds tiles on the zoom level of the splitter which are contained in the given tiles and intersect the
+        area. Tiles are yielded in parts in the order of a depth-first traversal of the grid, where sub-tiles of each
+        tile are ordered by columns and from south to north.
+
+        :param index_x: Column indices of tiles
+        :param index_y: Row indices of tiles
+        :param zoom_level: A zoom level of given tiles
+        :return: An iterator of tile bounding boxes and their column and row indices
+        """
+        tile_bboxes = self.tile_grid.get_tile_bboxes(index_x, index_y, zoom_level)
+        tile_indices = np.flatnonzero(self._intersects_area_array(tile_bboxes))
+        if not tile_indices.size:
+            return
+
+        if zoom_level == self.zoom_level:
+            yield tile_bboxes[tile_indices], index_x[tile_indices], index_y[tile_indices]
+            return
+
+        chunk_size = max(_SPLIT_CHUNK_SIZE // 4, 1)
+        for start_index in range(0, tile_indices.size, chunk_size):
+            chunk_indices = tile_indices[start_index : start_index + chunk_size]
+            sub_index_x = np.repeat(2 * index_x[chunk_indices], 4) + np.tile([0, 0, 1, 1], chunk_indices.size)
+            sub_index_y = np.repeat(2 * index_y[chunk_indices], 4) + np.tile([1, 0, 1, 0], chunk_indices.size)
+            yield from self._iter_tiles(sub_index_x, sub_index_y, zoom_level + 1)
+
+
+class OsmSplitter(TileGridSplitter):
+    """A tool that splits the given area into smaller parts. For the splitting it uses Open Street Map (OSM) grid on
+    the specified zoom level. It calculates bounding boxes of all OSM tiles that intersect the area. If specified by
+    user it can also reduce the sizes of the remaining bounding boxes to best fit the area.
+    """
+
+    def __init__(
+        self,
+        shape_list: Iterable[Polygon | MultiPolygon | _BaseGeometry],
+        crs: CRS,
+        zoom_level: int,
+        **kwargs: Any,
+    ):
+        """
+        :param shape_list: A list of geometrical shapes describing the area of interest
+        :param crs: Coordinate reference system of the shapes in `shape_list`
+        :param zoom_level: A zoom level defined by OSM. Level 0 is entire world, level 1 splits the world into
+            4 parts, etc.
+        :param reduce_bbox_sizes: If `True` it will reduce the sizes of bounding boxes so that they will tightly fit
+            the given area geometry from `shape_list`.
+        """
+        tile_grid = TileGrid.web_mercator()
+        self._POP_WEB_MAX = tile_grid.bbox.max_x  # pylint: disable=invalid-name
+
+        super().__init__(shape_list, crs, tile_grid, zoom_level, **kwargs)
 
     def _check_area_bbox(self) -> None:
         """The method checks if the area bounding box is completely inside the OSM grid. That means that its latitudes
@@ -287,36 +510,7 @@ class OsmSplitter(AreaSplitter):
 
         :return: Bounding box of entire world
         """
-        return BBox((-self._POP_WEB_MAX, -self._POP_WEB_MAX, self._POP_WEB_MAX, self._POP_WEB_MAX), crs=CRS.POP_WEB)
-
-    def _recursive_split(
-        self,
-        bbox: BBox,
-        zoom_level: int,
-        column: int,
-        row: int,
-    ) -> tuple[list[BBox], list[dict[str, object]]]:
-        """Method that recursively creates bounding boxes of OSM grid that intersect the area.
-
-        :param bbox: Bounding box
-        :param zoom_level: OSM zoom level
-        :param column: Column in the OSM grid
-        :param row: Row in the OSM grid
-        """
-        if zoom_level == self.zoom_level:
-            return [bbox], [{"zoom_level": zoom_level, "index_x": column, "index_y": row}]
-
-        bbox_list, info_list = [], []
-        bbox_partition = bbox.get_partition(num_x=2, num_y=2)
-        for i, j in itertools.product(range(2), range(2)):
-            if self._intersects_area(bbox_partition[i][j]):
-                bboxes, infos = self._recursive_split(
-                    bbox_partition[i][j], zoom_level + 1, 2 * column + i, 2 * row + 1 - j
-                )
-                bbox_list.extend(bboxes)
-                info_list.extend(infos)
-
-        return bbox_list, info_list
+        return self.tile_grid.bbox
 
 
 class TileSplitter(AreaSplitter):
@@ -337,6 +531,7 @@ class TileSplitter(AreaSplitter):
         data_collection: DataCollection,
         tile_split_shape: int | tuple[int, int] = 1,
         config: SHConfig | None = None,
+        catalog_cache: CatalogCache | None = None,
         **kwargs: Any,
     ):
         """
@@ -349,9 +544,11 @@ class TileSplitter(AreaSplitter):
             split into `n` columns and `m` rows. It can also be a single integer `n` which is the same
             as `(n, n)`.
         :param config: A custom instance of config class to override parameters from the saved configuration.
+        :param catalog_cache: A local cache of Catalog API search results, which can be shared between splitters.
         :param kwargs: Parameters that are propagated to the base `AreaSplitter` class
         """
         self.time_interval = time_interval
+        self.catalog_cache = catalog_cache
         self.tile_split_shape = tile_split_shape
         self.data_collection = data_collection
 
@@ -362,44 +559,51 @@ class TileSplitter(AreaSplitter):
         self.catalog = SentinelHubCatalog(config=sh_config)
         super().__init__(shape_list, crs, **kwargs)
 
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
         tile_dict: dict[tuple[tuple[float, ...], int], dict[str, Any]] = {}
 
         search_iterator = self.catalog.search(
-            self.data_collection, time=self.time_interval, bbox=self.area_bbox, fields=self._CATALOG_FILTER
+            self.data_collection,
+            time=self.time_interval,
+            bbox=self.area_bbox,
+            fields=self._CATALOG_FILTER,
+            cache=self.catalog_cache,
         )
 
-        timestamps = search_iterator.get_timestamps()
-        geometry_list = search_iterator.get_geometries()
-        for tile_info, (timestamp, geometry) in zip(search_iterator, zip(timestamps, geometry_list)):
-            tile_properties = tile_info["properties"]
-            bbox = BBox(tile_properties["proj:bbox"], crs=tile_properties["proj:epsg"])
+        tile_arrays = search_iterator.to_arrays(properties=["proj:bbox", "proj:epsg"])
+        timestamps = [
+            timestamp.replace(tzinfo=dt.timezone.utc) for timestamp in tile_arrays["timestamps"].astype(dt.datetime)
+        ]
+        geometry_list = [Geometry(geometry, crs=CRS.WGS84) for geometry in tile_arrays["geometries"]]
+        tile_values = zip(
+            tile_arrays["ids"], timestamps, geometry_list, tile_arrays["proj:bbox"], tile_arrays["proj:epsg"]
+        )
+
+        for tile_id, timestamp, geometry, tile_coords, tile_epsg in tile_values:
+            bbox = BBox(tuple(tile_coords), crs=tile_epsg)
             bbox_hash = tuple(bbox), bbox.crs.epsg
 
             if bbox_hash not in tile_dict:
                 tile_dict[bbox_hash] = {"bbox": bbox, "timestamps": [], "ids": [], "geometries": []}
             tile_dict[bbox_hash]["timestamps"].append(timestamp)
-            tile_dict[bbox_hash]["ids"].append(tile_info["id"])
+            tile_dict[bbox_hash]["ids"].append(tile_id)
             tile_dict[bbox_hash]["geometries"].append(geometry)
 
-        bbox_list, info_list = [], []
-
-        for tile_info in tile_dict.values():
-            if not self._intersects_area(tile_info["bbox"]):
-                continue
+        tile_info_list = list(tile_dict.values())
+        tile_grid = BBoxArray.from_bboxes([tile_info["bbox"] for tile_info in tile_info_list], crs=self.crs)
 
+        for tile_index in np.flatnonzero(self._intersects_area_array(tile_grid)):
+            tile_info = tile_info_list[tile_index]
             tile_bbox: BBox = tile_info["bbox"]
             bbox_splitter = BBoxSplitter([tile_bbox.geometry], tile_bbox.crs, split_shape=self.tile_split_shape)
 
-            for bbox, info in zip(bbox_splitter.get_bbox_list(), bbox_splitter.get_info_list()):
-                if self._intersects_area(bbox):
-                    bbox_list.append(bbox)
-
-                    info["ids"] = tile_info["ids"]
-                    info["timestamps"] = tile_info["timestamps"]
-                    info_list.append(info)
+            part_indices = np.flatnonzero(self._intersects_area_array(bbox_splitter.bbox_array))
+            info_list = [bbox_splitter.info_list[part_index] for part_index in part_indices]
+            for info in info_list:
+                info["ids"] = tile_info["ids"]
+                info["timestamps"] = tile_info["timestamps"]
 
-        return bbox_list, info_list
+            yield bbox_splitter.bbox_array[part_indices], info_list
 
 
 class CustomGridSplitter(AreaSplitter):
@@ -428,22 +632,18 @@ class CustomGridSplitter(AreaSplitter):
         self.bbox_split_shape = bbox_split_shape
         super().__init__(shape_list, crs, **kwargs)
 
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
-        bbox_list: list[BBox] = []
-        info_list: list[dict[str, object]] = []
-
-        for grid_idx, grid_bbox in enumerate(self.bbox_grid):
-            if self._intersects_area(grid_bbox):
-                bbox_splitter = BBoxSplitter([grid_bbox.geometry], grid_bbox.crs, split_shape=self.bbox_split_shape)
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
+        grid_array = BBoxArray.from_bboxes(self.bbox_grid, crs=self.crs)
+        for grid_idx in np.flatnonzero(self._intersects_area_array(grid_array)):
+            grid_bbox = self.bbox_grid[grid_idx]
+            bbox_splitter = BBoxSplitter([grid_bbox.geometry], grid_bbox.crs, split_shape=self.bbox_split_shape)
 
-                for bbox, info in zip(bbox_splitter.get_bbox_list(), bbox_splitter.get_info_list()):
-                    if self._intersects_area(bbox):
-                        info["grid_index"] = grid_idx
+            part_indices = np.flatnonzero(self._intersects_area_array(bbox_splitter.bbox_array))
+            info_list = [bbox_splitter.info_list[part_index] for part_index in part_indices]
+            for info in info_list:
+                info["grid_index"] = int(grid_idx)
 
-                        bbox_list.append(bbox)
-                        info_list.append(info)
-
-        return bbox_list, info_list
+            yield bbox_splitter.bbox_array[part_indices], info_list
 
 
 class BaseUtmSplitter(AreaSplitter, metaclass=ABCMeta):
@@ -459,6 +659,7 @@ class BaseUtmSplitter(AreaSplitter, metaclass=ABCMeta):
         crs: CRS,
         bbox_size: float | tuple[float, float],
         offset: tuple[float, float] | None = None,
+        max_threads: int | None = 1,
     ):
         """
         :param shape_list: A list of geometrical shapes describing the area of interest
@@ -466,12 +667,17 @@ class BaseUtmSplitter(AreaSplitter, metaclass=ABCMeta):
         :param bbox_size: A size of generated bounding boxes in horizontal and vertical directions in meters. If a
             single value is given that will be interpreted as (value, value).
         :param offset: Bounding box offset in horizontal and vertical directions in meters.
+        :param max_threads: Maximum number of threads used to split UTM grid cells in parallel. By default, cells are
+            split one after another. If set to `None`, the default number of threads of `ThreadPoolExecutor` is used.
+            The result doesn't depend on this parameter.
         """
         self.bbox_size = _parse_to_pair(bbox_size, allowed_types=(int, float), param_name="bbox_size")
 
         self.offset = _parse_to_pair(offset or 0.0, allowed_types=(int, float), param_name="offset")
+        self.max_threads = max_threads
 
         self.utm_grid = self._get_utm_polygons()
+        self._utm_tree = shapely.STRtree([utm_cell_geom for utm_cell_geom, _ in self.utm_grid])
         super().__init__(shape_list, crs)
 
     @abstractmethod
@@ -504,48 +710,95 @@ class BaseUtmSplitter(AreaSplitter, metaclass=ABCMeta):
 
         return BBox(((aligned_x, aligned_y), bbox.upper_right), crs=bbox.crs)
 
-    def _make_split(self) -> tuple[list[BBox], list[dict[str, object]]]:
-        """Split each UTM grid into equally sized bboxes in correct UTM zone"""
-        size_x, size_y = self.bbox_size
-        bbox_list: list[BBox] = []
-        info_list: list[dict[str, object]] = []
+    def _iter_split(self) -> Iterator[tuple[BBoxArray, list[dict[str, object]]]]:
+        """Split each UTM grid into equally sized bboxes in correct UTM zone. Cells are split in parallel if multiple
+        threads are allowed, but their results are always collected in the order of cells."""
+        area_geometry = Geometry(self.area_shape, self.crs).transform(CRS.WGS84).geometry
 
-        index = 0
-        shape_geometry = Geometry(self.area_shape, self.crs).transform(CRS.WGS84)
+        cell_indices = np.sort(self._utm_tree.query(area_geometry, predicate="intersects"))
+        # the UTM MGRS grid definition contains four 0 zones at the poles (0A, 0B, 0Y, 0Z)
+        utm_cells = [self.utm_grid[cell_index] for cell_index in cell_indices if self.utm_grid[cell_index][1]["zone"]]
 
-        for utm_cell in self.utm_grid:
-            utm_cell_geom, utm_cell_prop = utm_cell
-            # the UTM MGRS grid definition contains four 0 zones at the poles (0A, 0B, 0Y, 0Z)
-            if utm_cell_prop["zone"] == 0:
+        index = 0
+        for cell_split in self._iter_cell_splits(utm_cells, area_geometry):
+            if cell_split is None:
                 continue
-            utm_crs = self._get_utm_from_props(utm_cell_prop)
-            cell_info = dict(
-                crs=utm_crs.name,
-                utm_zone=str(utm_cell_prop["zone"]).zfill(2),
-                utm_row=utm_cell_prop["row"],
-                direction=utm_cell_prop["direction"],
+            bbox_array, cell_info, part_positions = cell_split
+            info_list: list[dict[str, object]] = [
+                dict(**cell_info, index=index + i, index_x=index_x, index_y=index_y)
+                for i, (index_x, index_y) in enumerate(part_positions)
+            ]
+            index += len(info_list)
+
+            yield bbox_array, info_list
+
+    def _iter_cell_splits(
+        self, utm_cells: list[tuple[BaseGeometry, dict[str, Any]]], area_geometry: BaseGeometry
+    ) -> Iterator[tuple[BBoxArray, dict[str, object], list[tuple[int, int]]] | None]:
+        """Splits UTM grid cells and yields results in the order of cells. In parallel mode only a limited window of
+        cells is split ahead of the consumer, therefore results are still produced lazily."""
+        split_cell = functools.partial(self._split_utm_cell, area_geometry=area_geometry)
+        if self.max_threads == 1:
+            yield from map(split_cell, utm_cells)
+            return
+
+        max_workers = self.max_threads or min(32, (os.cpu_count() or 1) + 4)  # the default of ThreadPoolExecutor
+        cell_iterator = iter(utm_cells)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(split_cell, cell) for cell in itertools.islice(cell_iterator, 2 * max_workers)
             )
+            try:
+                while pending:
+                    cell_split = pending.popleft().result()
+                    next_cell = next(cell_iterator, None)
+                    if next_cell is not None:
+                        pending.append(executor.submit(split_cell, next_cell))
+                    yield cell_split
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _split_utm_cell(
+        self, utm_cell: tuple[BaseGeometry, dict[str, Any]], area_geometry: BaseGeometry
+    ) -> tuple[BBoxArray, dict[str, object], list[tuple[int, int]]] | None:
+        """Splits a part of the area inside a single UTM grid cell into equally sized bboxes.
+
+        :param utm_cell: A geometry and properties of a UTM grid cell
+        :param area_geometry: A geometry of the entire area in WGS84
+        :return: Bounding boxes in the UTM CRS of the cell, info about the cell, and horizontal and vertical indices of
+            bounding boxes in the cell. If the area doesn't overlap with the cell, `None` is returned.
+        """
+        utm_cell_geom, utm_cell_prop = utm_cell
+        utm_crs = self._get_utm_from_props(utm_cell_prop)
+        cell_info: dict[str, object] = dict(
+            crs=utm_crs.name,
+            utm_zone=str(utm_cell_prop["zone"]).zfill(2),
+            utm_row=utm_cell_prop["row"],
+            direction=utm_cell_prop["direction"],
+        )
 
-            intersection = utm_cell_geom.intersection(shape_geometry.geometry)
+        intersection = utm_cell_geom.intersection(area_geometry)
 
-            if not intersection.is_empty and isinstance(intersection, GeometryCollection):
-                intersection = MultiPolygon(
-                    geo_object for geo_object in intersection if isinstance(geo_object, (Polygon, MultiPolygon))
-                )
+        if not intersection.is_empty and isinstance(intersection, GeometryCollection):
+            intersection = MultiPolygon(
+                geo_object for geo_object in intersection.geoms if isinstance(geo_object, (Polygon, MultiPolygon))
+            )
 
-            if intersection.area > 0:
-                intersection = Geometry(intersection, CRS.WGS84).transform(utm_crs)
+        if intersection.area <= 0:
+            return None
 
-                bbox_partition = self._align_bbox_to_size(intersection.bbox).get_partition(size_x=size_x, size_y=size_y)
+        size_x, size_y = self.bbox_size
+        utm_intersection = Geometry(intersection, CRS.WGS84).transform(utm_crs)
 
-                for i, column in enumerate(bbox_partition):
-                    for j, part in enumerate(column):
-                        if part.geometry.intersects(intersection.geometry):
-                            bbox_list.append(part)
-                            info_list.append(dict(**cell_info, index=index, index_x=i, index_y=j))
-                            index += 1
+        aligned_bbox = self._align_bbox_to_size(utm_intersection.bbox)
+        bbox_partition = BBoxArray.from_partition(aligned_bbox, size_x=size_x, size_y=size_y)
+        rows = math.ceil((aligned_bbox.max_y - aligned_bbox.min_y) / size_y)
 
-        return bbox_list, info_list
+        shapely.prepare(utm_intersection.geometry)
+        part_indices = np.flatnonzero(bbox_partition.intersects(utm_intersection.geometry))
+        part_positions = [(index // rows, index % rows) for index in part_indices.tolist()]
+        return bbox_partition[part_indices], cell_info, part_positions
 
     def get_bbox_list(self, buffer: None | float | tuple[float, float] = None) -> list[BBox]:  # type: ignore[override]
         """Get list of bounding boxes.
@@ -558,6 +811,30 @@ class BaseUtmSplitter(AreaSplitter, metaclass=ABCMeta):
         """
         return super().get_bbox_list(buffer=buffer)
 
+    def get_bbox_array(self, buffer: None | float | tuple[float, float] = None) -> BBoxArray:  # type: ignore[override]
+        """Get a collection of bounding boxes.
+
+        The CRS is fixed to the computed UTM CRS. This BBox splitter does not support reducing size of output
+        bounding boxes
+
+        :param buffer: A percentage of each BBox size increase. This will cause neighbouring bounding boxes to overlap.
+        :return: A collection of bounding boxes
+        """
+        return super().get_bbox_array(buffer=buffer)
+
+    def iter_split(  # type: ignore[override]
+        self, buffer: None | float | tuple[float, float] = None
+    ) -> Iterator[tuple[BBox, dict[str, object]]]:
+        """Lazily iterate over bounding boxes together with their info dictionaries.
+
+        The CRS is fixed to the computed UTM CRS. This BBox splitter does not support reducing size of output
+        bounding boxes
+
+        :param buffer: A percentage of each BBox size increase. This will cause neighbouring bounding boxes to overlap.
+        :return: An iterator of pairs of a bounding box and its info dictionary
+        """
+        return super().iter_split(buffer=buffer)
+
 
 class UtmGridSplitter(BaseUtmSplitter):
     """Splitter that returns bounding boxes of fixed size aligned to the UTM MGRS grid"""
@@ -567,26 +844,7 @@ class UtmGridSplitter(BaseUtmSplitter):
 
         :return: List of geometries and properties of UTM grid zones overlapping with input area shape
         """
-        # file downloaded from faculty.baruch.cuny.edu/geoportal/data/esri/world/utmzone.zip
-        utm_grid_filename = os.path.join(os.path.dirname(__file__), ".utmzones.geojson")
-
-        if not os.path.isfile(utm_grid_filename):
-            raise OSError(f"UTM grid definition file does not exist: {os.path.abspath(utm_grid_filename)}")
-
-        with open(utm_grid_filename) as utm_grid_file:
-            utm_grid = json.load(utm_grid_file)["features"]
-
-        utm_geom_list = [shapely.geometry.shape(utm_zone["geometry"]) for utm_zone in utm_grid]
-        utm_prop_list = [
-            dict(
-                zone=utm_zone["properties"]["ZONE"],
-                row=utm_zone["properties"]["ROW_"],
-                direction="N" if utm_zone["properties"]["ROW_"] >= "N" else "S",
-            )
-            for utm_zone in utm_grid
-        ]
-
-        return list(zip(utm_geom_list, utm_prop_list))
+        return [(utm_geom, dict(utm_prop)) for utm_geom, utm_prop in _load_utm_grid()]
 
 
 class UtmZoneSplitter(BaseUtmSplitter):
@@ -602,25 +860,71 @@ class UtmZoneSplitter(BaseUtmSplitter):
 
         :return: List of geometries and properties of UTM zones overlapping with input area shape
         """
-        utm_geom_list = []
-        for lat in [(self.LAT_EQ, self.LAT_MAX), (self.LAT_MIN, self.LAT_EQ)]:
-            for lng in range(self.LNG_MIN, self.LNG_MAX, self.LNG_UTM):
-                # A new point is added per each degree - this is inline with geometries used by UtmGridSplitter
-                # In the future the number of points will be calculated according to bbox_size parameter
-                points = (
-                    [(lng, degree) for degree in range(lat[0], lat[1])]
-                    + [(degree, lat[1]) for degree in range(lng, lng + self.LNG_UTM)]
-                    + [(lng + self.LNG_UTM, degree) for degree in range(lat[1], lat[0], -1)]
-                    + [(degree, lat[0]) for degree in range(lng + self.LNG_UTM, lng, -1)]
-                )
+        utm_zones = _make_utm_zones(
+            (self.LNG_MIN, self.LNG_MAX, self.LNG_UTM), (self.LAT_MIN, self.LAT_MAX, self.LAT_EQ)
+        )
+        return [(utm_geom, dict(utm_prop)) for utm_geom, utm_prop in utm_zones]
 
-                utm_geom_list.append(Polygon(points))
 
-        utm_prop_list = [
-            dict(zone=zone, row="", direction=direction) for direction in ["N", "S"] for zone in range(1, 61)
-        ]
+@functools.lru_cache(maxsize=1)
+def _load_utm_grid() -> tuple[tuple[BaseGeometry, dict[str, Any]], ...]:
+    """Loads and parses the bundled definition of the UTM MGRS grid. The grid is parsed only once per process.
+
+    :return: Geometries and properties of all UTM grid zones
+    """
+    # file downloaded from faculty.baruch.cuny.edu/geoportal/data/esri/world/utmzone.zip
+    utm_grid_filename = os.path.join(os.path.dirname(__file__), ".utmzones.geojson")
+
+    if not os.path.isfile(utm_grid_filename):
+        raise OSError(f"UTM grid definition file does not exist: {os.path.abspath(utm_grid_filename)}")
+
+    with open(utm_grid_filename) as utm_grid_file:
+        utm_grid = json.load(utm_grid_file)["features"]
+
+    utm_geom_list = [shapely.geometry.shape(utm_zone["geometry"]) for utm_zone in utm_grid]
+    utm_prop_list = [
+        dict(
+            zone=utm_zone["properties"]["ZONE"],
+            row=utm_zone["properties"]["ROW_"],
+            direction="N" if utm_zone["properties"]["ROW_"] >= "N" else "S",
+        )
+        for utm_zone in utm_grid
+    ]
+
+    return tuple(zip(utm_geom_list, utm_prop_list))
+
+
+@functools.lru_cache(maxsize=None)
+def _make_utm_zones(
+    lng_params: tuple[int, int, int], lat_params: tuple[int, int, int]
+) -> tuple[tuple[BaseGeometry, dict[str, Any]], ...]:
+    """Creates geometries of UTM zones, each one as a triangle ranging from the equator to the North/South Pole.
+    Geometries are created only once per process for each set of parameters.
+
+    :param lng_params: Minimal and maximal longitude and the width of a UTM zone
+    :param lat_params: Minimal and maximal latitude and the latitude of the equator
+    :return: Geometries and properties of UTM zones
+    """
+    lng_min, lng_max, lng_utm = lng_params
+    lat_min, lat_max, lat_eq = lat_params
+
+    utm_geom_list = []
+    for lat in [(lat_eq, lat_max), (lat_min, lat_eq)]:
+        for lng in range(lng_min, lng_max, lng_utm):
+            # A new point is added per each degree - this is inline with geometries used by UtmGridSplitter
+            # In the future the number of points will be calculated according to bbox_size parameter
+            points = (
+                [(lng, degree) for degree in range(lat[0], lat[1])]
+                + [(degree, lat[1]) for degree in range(lng, lng + lng_utm)]
+                + [(lng + lng_utm, degree) for degree in range(lat[1], lat[0], -1)]
+                + [(degree, lat[0]) for degree in range(lng + lng_utm, lng, -1)]
+            )
+
+            utm_geom_list.append(Polygon(points))
+
+    utm_prop_list = [dict(zone=zone, row="", direction=direction) for direction in ["N", "S"] for zone in range(1, 61)]
 
-        return list(zip(utm_geom_list, utm_prop_list))
+    return tuple(zip(utm_geom_list, utm_prop_list))
 
 
 def _parse_to_pair(parameter: T | tuple[T, T], allowed_types: tuple[type, ...], param_name: str = "") -> tuple[T, T]:
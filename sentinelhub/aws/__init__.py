@@ -8,7 +8,7 @@ which can be installed with:
 
 """
 
-from .batch import AwsBatchStatisticalResults
+from .batch import AwsBatchProcessResults, AwsBatchStatisticalResults
 from .client import AwsDownloadClient
 from .constants import AwsConstants
 from .data import AwsProduct, AwsTile
@@ -1,16 +1,31 @@
 """
-Module implementing utilities for collecting data, produced with Sentinel Hub Statistical Batch API, from an S3 bucket.
+Module implementing utilities for collecting data, produced with Sentinel Hub Batch Process API and Batch Statistical
+API, from an S3 bucket.
 """
 
-from typing import List, Optional, Sequence, Union
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+from boto3.s3.transfer import TransferConfig
+from tqdm.auto import tqdm
+
+from ..api.batch.process import BatchProcessClient, BatchProcessRequest, BatchRequestType
 from ..api.batch.statistical import BatchStatisticalRequest, BatchStatisticalRequestType, SentinelHubBatchStatistical
 from ..base import DataRequest
 from ..config import SHConfig
 from ..constants import MimeType
 from ..download.models import DownloadRequest
+from ..io_utils import read_data, write_data
 from .client import AwsDownloadClient
 
+LOGGER = logging.getLogger(__name__)
+
 
 class AwsBatchStatisticalResults(DataRequest):
     """A utility class for downloading results of Batch Statistical API from an S3 bucket."""
@@ -89,3 +104,227 @@ class AwsBatchStatisticalResults(DataRequest):
                     filenames.append(key_name)
 
         return filenames
+
+
+class AwsBatchProcessResults:
+    """A utility class for downloading results of Batch Process API from an S3 bucket.
+
+    Output objects are listed in parallel, one listing per tile prefix, and downloaded with `boto3` managed transfers
+    which split large objects into concurrent ranged GET requests. A manifest of downloaded objects is kept in the
+    data folder so that an interrupted download can be resumed, and objects whose ETag matches the local copy are
+    skipped.
+    """
+
+    MANIFEST_FILENAME = ".batch_manifest.json"
+    # The manifest is saved during download after this many downloaded objects or seconds, whichever comes first
+    MANIFEST_SAVE_INTERVAL = 1000
+    MANIFEST_SAVE_SECONDS = 30.0
+
+    def __init__(
+        self,
+        batch_request: BatchRequestType,
+        *,
+        data_folder: str,
+        config: Optional[SHConfig] = None,
+        max_threads: Optional[int] = None,
+        multipart_threshold: int = 64 * 1024 * 1024,
+        multipart_chunksize: int = 16 * 1024 * 1024,
+        boto_params: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        :param batch_request: Info about a batch request - either an instance of `BatchProcessRequest` or a
+            batch ID or a raw payload of the batch response.
+        :param data_folder: Directory to which the files should be saved. The structure of the bucket below the
+            output path is preserved.
+        :param config: A config object that contains AWS credentials to access the S3 bucket with results.
+        :param max_threads: Maximum number of threads used for listing and for downloading objects in parallel.
+        :param multipart_threshold: Objects larger than this number of bytes are downloaded with concurrent ranged
+            GET requests.
+        :param multipart_chunksize: Size of each ranged GET request in bytes.
+        :param boto_params: A dictionary of extra parameters that will be propagated to S3 client calls. E.g.
+            `{"RequestPayer": "requester"}`.
+        """
+        self.config = config or SHConfig()
+        self.batch_request = self._parse_batch_request(batch_request, self.config)
+        self.data_folder = data_folder
+        self.max_threads = max_threads
+        self.boto_params = boto_params or {}
+
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_threads or 10,
+        )
+        self.bucket_name, self.prefix = self._get_output_location(self.batch_request)
+
+    @staticmethod
+    def _parse_batch_request(batch_request: BatchRequestType, config: SHConfig) -> BatchProcessRequest:
+        """In case a batch request is not defined with an instance of `BatchProcessRequest` it will make sure that
+        such an instance is created."""
+        if isinstance(batch_request, BatchProcessRequest):
+            return batch_request
+
+        if isinstance(batch_request, dict):
+            return BatchProcessRequest.from_dict(batch_request)
+
+        batch_client = BatchProcessClient(config=config)
+        return batch_client.get_request(batch_request)
+
+    @staticmethod
+    def _get_output_location(batch_request: BatchProcessRequest) -> Tuple[str, str]:
+        """Provides a bucket name and a static key prefix of the output delivery path. Any template parts of the path,
+        e.g. `<tileName>`, and everything following them are removed."""
+        s3_url = batch_request.request["output"]["delivery"]["s3"]["url"]
+        if not s3_url.startswith("s3://"):
+            raise ValueError(f"Batch request output is expected to be delivered to an S3 bucket, got {s3_url}")
+
+        _, _, bucket_name, *key = s3_url.split("/", 3)
+        url_key = key[0] if key else ""
+        if "<" in url_key:
+            url_key = url_key[: url_key.index("<")]
+            url_key = url_key[: url_key.rfind("/") + 1]
+        elif url_key and not url_key.endswith("/"):
+            url_key = f"{url_key}/"
+
+        return bucket_name, url_key
+
+    def get_manifest_path(self) -> str:
+        """Provides a path to the local manifest of downloaded objects."""
+        return os.path.join(self.data_folder, self.MANIFEST_FILENAME)
+
+    def list_objects(self) -> List[Dict[str, Any]]:
+        """Lists all result objects under the output path. The top level of the output path is listed first and then
+        each subfolder, e.g. one per tile, is listed in a separate thread.
+
+        :return: A list of dictionaries with `Key`, `ETag` and `Size` of each object, sorted by key.
+        """
+        s3_client = AwsDownloadClient.get_s3_client(self.config)
+
+        objects, prefixes = self._list_prefix(s3_client, self.prefix, delimiter="/")
+
+        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+            for prefix_objects, _ in executor.map(lambda prefix: self._list_prefix(s3_client, prefix), prefixes):
+                objects.extend(prefix_objects)
+
+        objects = [
+            {"Key": item["Key"], "ETag": item["ETag"], "Size": item["Size"]}
+            for item in objects
+            if not item["Key"].endswith("/")
+        ]
+        return sorted(objects, key=lambda item: item["Key"])
+
+    def _list_prefix(
+        self, s3_client: Any, prefix: str, delimiter: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Lists all objects and common prefixes under a given key prefix."""
+        objects: List[Dict[str, Any]] = []
+        prefixes: List[str] = []
+
+        params = dict(Bucket=self.bucket_name, Prefix=prefix, **self.boto_params)
+        if delimiter is not None:
+            params["Delimiter"] = delimiter
+
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**params):
+            objects.extend(page.get("Contents", []))
+            prefixes.extend(item["Prefix"] for item in page.get("CommonPrefixes", []))
+
+        return objects, prefixes
+
+    def download(self, *, redownload: bool = False, show_progress: bool = False) -> List[str]:
+        """Downloads all result objects into the data folder. Objects which were already downloaded and whose ETag
+        matches the remote one are skipped.
+
+        :param redownload: If `True` all objects will be downloaded again regardless of the local manifest.
+        :param show_progress: Whether a progress bar should be displayed while downloading.
+        :return: A list of local paths of all result objects.
+        """
+        objects = self.list_objects()
+        manifest = {} if redownload else self._load_manifest()
+        manifest_lock = Lock()
+
+        s3_client = AwsDownloadClient.get_s3_client(self.config)
+        paths = [self._get_local_path(item["Key"]) for item in objects]
+        to_download = [
+            (item, path) for item, path in zip(objects, paths) if not self._is_downloaded(item, path, manifest)
+        ]
+        LOGGER.debug("Skipping %d objects which are already downloaded", len(objects) - len(to_download))
+
+        def _download_object(item: Dict[str, Any], path: str) -> None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            s3_client.download_file(
+                self.bucket_name, item["Key"], path, ExtraArgs=self.boto_params or None, Config=self.transfer_config
+            )
+            with manifest_lock:
+                manifest[item["Key"]] = {"etag": item["ETag"], "size": item["Size"]}
+
+        def _save_manifest_snapshot() -> None:
+            with manifest_lock:
+                manifest_snapshot = dict(manifest)
+            self._save_manifest(manifest_snapshot)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                futures = [executor.submit(_download_object, item, path) for item, path in to_download]
+                last_save_time = time.monotonic()
+
+                progress_context = tqdm(total=len(futures)) if show_progress else nullcontext()
+                with progress_context as progress_bar:
+                    for completed_count, future in enumerate(as_completed(futures), start=1):
+                        future.result()
+                        if progress_bar:
+                            progress_bar.update(1)
+
+                        is_save_due = time.monotonic() - last_save_time > self.MANIFEST_SAVE_SECONDS
+                        if completed_count % self.MANIFEST_SAVE_INTERVAL == 0 or is_save_due:
+                            _save_manifest_snapshot()
+                            last_save_time = time.monotonic()
+        finally:
+            _save_manifest_snapshot()
+
+        return paths
+
+    def _get_local_path(self, key: str) -> str:
+        """Provides a local path of an object, relative to the output path on the bucket."""
+        return os.path.join(self.data_folder, *key[len(self.prefix) :].split("/"))
+
+    @staticmethod
+    def _is_downloaded(item: Dict[str, Any], path: str, manifest: Dict[str, Dict[str, Any]]) -> bool:
+        """Checks if an object has already been downloaded to a given local path. For objects which are not in the
+        manifest, but exist locally, it compares an MD5 hash of the local file with a single-part ETag."""
+        if not os.path.exists(path) or os.path.getsize(path) != item["Size"]:
+            return False
+
+        manifest_item = manifest.get(item["Key"])
+        if manifest_item is not None:
+            return manifest_item["etag"] == item["ETag"]
+
+        etag = item["ETag"].strip('"')
+        if "-" in etag:  # ETag of a multipart upload is not an MD5 hash of the object
+            return False
+
+        md5_hash = hashlib.md5()  # noqa: S324
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                md5_hash.update(chunk)
+
+        if md5_hash.hexdigest() != etag:
+            return False
+
+        manifest[item["Key"]] = {"etag": item["ETag"], "size": item["Size"]}
+        return True
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Loads a manifest of already downloaded objects if it exists."""
+        manifest_path = self.get_manifest_path()
+        if not os.path.exists(manifest_path):
+            return {}
+        return read_data(manifest_path, data_format=MimeType.JSON)
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """Saves the manifest into a temporary file and then moves it into place so that the manifest can't be
+        corrupted by an interruption."""
+        manifest_path = self.get_manifest_path()
+        temporary_path = f"{manifest_path}.tmp"
+        write_data(temporary_path, manifest, data_format=MimeType.JSON)
+        os.replace(temporary_path, manifest_path)
@@ -5,12 +5,19 @@ Implementation of base interface classes of this package.
 from __future__ import annotations
 
 import copy
+import json
 import os
+import tempfile
 from abc import ABCMeta, abstractmethod
-from typing import Any, Callable, Generic, Iterable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Generic, Iterable, Literal, TypeVar, overload
+
+import numpy as np
 
 from .config import SHConfig
+from .decoding import decode_image
 from .download import DownloadClient, DownloadRequest
+from .download.models import DownloadResponse
 from .types import JsonDict
 
 _T = TypeVar("_T")
@@ -76,6 +83,7 @@ class DataRequest(metaclass=ABCMeta):
             isinstance(request, DownloadRequest) for request in self.download_list
         )
 
+    @overload
     def get_data(
         self,
         *,
@@ -86,7 +94,38 @@ class DataRequest(metaclass=ABCMeta):
         decode_data: bool = True,
         raise_download_errors: bool = True,
         show_progress: bool = False,
-    ) -> list[Any]:
+        lazy_tar: bool = False,
+        stack_into: None = None,
+    ) -> list[Any]: ...
+
+    @overload
+    def get_data(
+        self,
+        *,
+        save_data: bool = False,
+        redownload: bool = False,
+        data_filter: list[int] | None = None,
+        max_threads: int | None = None,
+        decode_data: bool = True,
+        raise_download_errors: bool = True,
+        show_progress: bool = False,
+        lazy_tar: bool = False,
+        stack_into: np.ndarray,
+    ) -> np.ndarray: ...
+
+    def get_data(
+        self,
+        *,
+        save_data: bool = False,
+        redownload: bool = False,
+        data_filter: list[int] | None = None,
+        max_threads: int | None = None,
+        decode_data: bool = True,
+        raise_download_errors: bool = True,
+        show_progress: bool = False,
+        lazy_tar: bool = False,
+        stack_into: np.ndarray | None = None,
+    ) -> list[Any] | np.ndarray:
         """Get requested data either by downloading it or by reading it from the disk (if it
         was previously downloaded and saved).
 
@@ -105,18 +144,40 @@ class DataRequest(metaclass=ABCMeta):
             ``DownloadFailedException``. If `False` failed downloads will only raise warnings and the method will
             return list with `None` values in places where the results of failed download requests should be.
         :param show_progress: Whether a progress bar should be displayed while downloading.
+        :param lazy_tar: If `True`, TAR responses, e.g. of requests with multiple outputs, are returned as read-only
+            `TarData` mappings, which decode files only when they are accessed. By default, they are returned as
+            dictionaries of all decoded files.
+        :param stack_into: A preallocated array into which images will be decoded, e.g. an array of shape
+            ``[time, height, width, channels]``. The i-th image is written into ``stack_into[i]``, therefore the length
+            of the array has to match the number of requested images. This way images don't have to be stacked
+            together after they are decoded. Items of failed downloads are left unchanged.
         :return: requested images as numpy arrays, where each array corresponds to a single acquisition and has
-            shape ``[height, width, channels]``.
+            shape ``[height, width, channels]``. If `stack_into` is given, the same array is returned instead.
         """
+        if stack_into is None:
+            self._preprocess_request(save_data, True)
+            return self._execute_data_download(
+                data_filter,
+                redownload,
+                max_threads,
+                raise_download_errors,
+                decode_data=decode_data,
+                show_progress=show_progress,
+                lazy_tar=lazy_tar,
+            )
+
+        if not decode_data:
+            raise ValueError("Parameter stack_into can only be used if decode_data=True")
+        data_count = len(self.download_list) if data_filter is None else len(data_filter)
+        if len(stack_into) != data_count:
+            raise ValueError(f"Array stack_into has length {len(stack_into)} but {data_count} images were requested")
+
         self._preprocess_request(save_data, True)
-        return self._execute_data_download(
-            data_filter,
-            redownload,
-            max_threads,
-            raise_download_errors,
-            decode_data=decode_data,
-            show_progress=show_progress,
+        responses = self._execute_data_download(
+            data_filter, redownload, max_threads, raise_download_errors, decode_data=False, show_progress=show_progress
         )
+        self._decode_images_into(responses, stack_into, max_threads)
+        return stack_into
 
     def save_data(
         self,
@@ -151,6 +212,7 @@ class DataRequest(metaclass=ABCMeta):
         raise_download_errors: bool = False,
         decode_data: bool = True,
         show_progress: bool = False,
+        lazy_tar: bool = False,
     ) -> list[Any]:
         """Calls download module and executes the download process
 
@@ -164,6 +226,7 @@ class DataRequest(metaclass=ABCMeta):
         :param decode_data: If `True` (default) it decodes data (e.g., returns image as an array of numbers);
             if `False` it returns binary data.
         :param show_progress: Whether a progress bar should be displayed while downloading.
+        :param lazy_tar: If `True`, TAR responses are decoded into `TarData` mappings instead of dictionaries.
         :return: List of data obtained from download
         """
         is_repeating_filter = False
@@ -181,7 +244,7 @@ class DataRequest(metaclass=ABCMeta):
             raise ValueError("data_filter parameter must be a list of indices")
 
         client = self.download_client_class(
-            redownload=redownload, raise_download_errors=raise_download_errors, config=self.config
+            redownload=redownload, raise_download_errors=raise_download_errors, lazy_tar=lazy_tar, config=self.config
         )
         data_list = client.download(
             filtered_download_list, max_threads=max_threads, decode_data=decode_data, show_progress=show_progress
@@ -192,6 +255,23 @@ class DataRequest(metaclass=ABCMeta):
 
         return data_list
 
+    @staticmethod
+    def _decode_images_into(
+        responses: list[DownloadResponse | None], stack_into: np.ndarray, max_threads: int | None
+    ) -> None:
+        """Decodes images from responses into consecutive items of a preallocated array. Images are decoded in
+        parallel, each one in a single thread."""
+        for response in responses:
+            if response is not None and not response.response_type.is_image_format():
+                raise ValueError(f"Only images can be decoded into stack_into, but got {response.response_type}")
+
+        def decode_into(index: int, response: DownloadResponse | None) -> None:
+            if response is not None:
+                decode_image(response.content, response.response_type, out=stack_into[index], maxworkers=1)
+
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            list(executor.map(decode_into, range(len(responses)), responses))
+
     @staticmethod
     def _filter_repeating_items(download_list: list[DownloadRequest]) -> tuple[list[DownloadRequest], list[int]]:
         """Because of data_filter some requests in download list might be the same. In order not to download them again
@@ -242,16 +322,33 @@ class FeatureIterator(Generic[_T], metaclass=ABCMeta):
     Main functionalities:
 
     - The iterator will load only as many features as needed at any moment
-    - It will keep downloaded features in memory so that iterating over it again will not have to download the same
-      features again.
+    - By default, it will keep downloaded features in memory so that iterating over it again will not have to download
+      the same features again. Alternatively, features can be kept in a temporary file on disk or not kept at all.
     """
 
-    def __init__(self, client: DownloadClient, url: str, params: JsonDict | None = None):
+    def __init__(
+        self,
+        client: DownloadClient,
+        url: str,
+        params: JsonDict | None = None,
+        *,
+        feature_storage: Literal["memory", "disk", "none"] = "memory",
+        storage_folder: str | None = None,
+    ):
         """
         :param client: An instance of a download client object
         :param url: A URL where requests will be made
         :param params: Parameters to be sent with each request
+        :param feature_storage: Where to keep features that were already obtained. With `"memory"` all features are
+            kept in memory. With `"disk"` only the latest page of features is kept in memory and all features are
+            written into a temporary JSON lines file from which they are read when the iterator is iterated over
+            again. With `"none"` features are not kept and the iterator can be iterated over only once.
+        :param storage_folder: A folder where a temporary file is created if `feature_storage="disk"`. By default, the
+            system temporary folder is used.
         """
+        if feature_storage not in ("memory", "disk", "none"):
+            raise ValueError(f"Parameter feature_storage should be 'memory', 'disk' or 'none', got {feature_storage}")
+
         self.client = client
         self.url = url
         self.params = params or {}
@@ -260,12 +357,23 @@ class FeatureIterator(Generic[_T], metaclass=ABCMeta):
         self.features: list[_T] = []
         self.finished = False
 
+        self.feature_storage = feature_storage
+        self.storage_folder = storage_folder
+        self._features_offset = 0
+        self._storage_file: IO[bytes] | None = None
+        self._storage_read_position = 0
+        self._storage_write_position = 0
+
     def __iter__(self) -> FeatureIterator[_T]:
         """Method called at the beginning of a new iteration
 
         :return: It returns the iterator class itself
         """
+        if self.feature_storage == "none" and self.index > 0:
+            raise RuntimeError("Features are not being stored, therefore the iterator can be iterated only once")
+
         self.index = 0
+        self._storage_read_position = 0
         return self
 
     def __next__(self) -> _T:
@@ -273,16 +381,56 @@ class FeatureIterator(Generic[_T], metaclass=ABCMeta):
 
         :return: the next feature
         """
-        while self.index >= len(self.features) and not self.finished:
+        if self.index < self._features_offset:
+            self.index += 1
+            return self._read_stored_feature()
+
+        while self.index >= self._features_offset + len(self.features) and not self.finished:
             new_features = self._fetch_features()
-            self.features.extend(new_features)
+            self._add_features(new_features)
 
-        if self.index < len(self.features):
+        if self.index < self._features_offset + len(self.features):
             self.index += 1
-            return self.features[self.index - 1]
+            return self.features[self.index - self._features_offset - 1]
 
         raise StopIteration
 
+    def _add_features(self, new_features: Iterable[_T]) -> None:
+        """Adds newly fetched features. Unless features are stored in memory, features that were already iterated over
+        are removed from memory."""
+        if self.feature_storage == "memory":
+            self.features.extend(new_features)
+            return
+
+        new_features = list(new_features)
+        if self.feature_storage == "disk":
+            self._write_stored_features(new_features)
+
+        consumed_count = max(self.index - self._features_offset, 0)
+        self._features_offset += consumed_count
+        self.features = [*self.features[consumed_count:], *new_features]
+
+    def _write_stored_features(self, features: list[_T]) -> None:
+        """Appends features to the temporary storage file"""
+        if self._storage_file is None:
+            self._storage_file = tempfile.TemporaryFile(dir=self.storage_folder, suffix=".jsonl")
+
+        self._storage_file.seek(self._storage_write_position)
+        for feature in features:
+            self._storage_file.write(json.dumps(feature).encode())
+            self._storage_file.write(b"\n")
+        self._storage_write_position = self._storage_file.tell()
+
+    def _read_stored_feature(self) -> _T:
+        """Reads the next feature from the temporary storage file"""
+        if self._storage_file is None:
+            raise RuntimeError("Features are not being stored, therefore the iterator can be iterated only once")
+
+        self._storage_file.seek(self._storage_read_position)
+        line = self._storage_file.readline()
+        self._storage_read_position = self._storage_file.tell()
+        return json.loads(line)
+
     @abstractmethod
     def _fetch_features(self) -> Iterable[_T]:
         """Collects and returns more features from the service"""
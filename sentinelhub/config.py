@@ -5,10 +5,11 @@ Module for managing configuration data from `config.toml`
 from __future__ import annotations
 
 import copy
+import functools
 import json
 import os
 import warnings
-from dataclasses import asdict, dataclass
+from dataclasses import FrozenInstanceError, asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -126,7 +127,7 @@ class SHConfig(_SHConfig):
             env_kwargs = {k: v for k, v in env_kwargs.items() if v is not None}
 
             # load from config.toml
-            loaded_kwargs = SHConfig.load(profile=profile).to_dict(mask_credentials=False)
+            loaded_kwargs = self._load_profile_params(profile)
 
             kwargs = {**loaded_kwargs, **env_kwargs, **kwargs}  # precedence: init params > env > loaded
 
@@ -152,18 +153,23 @@ class SHConfig(_SHConfig):
 
         :param profile: Which profile to load from the configuration file.
         """
-        profile = cls._get_profile(profile)
-        filename = cls.get_config_location()
-        if not os.path.exists(filename):
-            cls(use_defaults=True).save()  # store default configuration to standard location
+        return cls(use_defaults=True, **cls._load_profile_params(cls._get_profile(profile)))
 
-        with open(filename, "rb") as cfg_file:
-            configurations_dict = tomli.load(cfg_file)
+    @classmethod
+    def _load_profile_params(cls, profile: str) -> dict[str, Any]:
+        """Provides parameters of a profile from the config file. The parsed file is cached per process, therefore
+        the file is parsed again only after it changes."""
+        filename = cls.get_config_location()
+        try:
+            configurations_dict = _load_config_file(filename)
+        except FileNotFoundError:
+            SHConfig(use_defaults=True).save()  # store default configuration to standard location
+            configurations_dict = _load_config_file(filename)
 
         if profile not in configurations_dict:
             raise KeyError(f"Profile `{profile}` not found in configuration file.")
 
-        return cls(use_defaults=True, **configurations_dict[profile])
+        return dict(configurations_dict[profile])
 
     def save(self, profile: str | None = None) -> None:
         """Saves configuration parameters to the config file at `SHConfig.get_config_location()`.
@@ -183,6 +189,7 @@ class SHConfig(_SHConfig):
         current_configuration[profile] = self._get_dict_of_diffs_from_defaults()
         with open(file_path, "wb") as cfg_file:
             tomli_w.dump(current_configuration, cfg_file)
+        _parse_config_file.cache_clear()
 
     def _get_dict_of_diffs_from_defaults(self) -> dict[str, str | float]:
         """Returns a dictionary containing key: value pairs for parameters that have values different from defaults."""
@@ -194,6 +201,10 @@ class SHConfig(_SHConfig):
         """Makes a copy of an instance of `SHConfig`"""
         return copy.copy(self)
 
+    def freeze(self) -> FrozenSHConfig:
+        """Makes an immutable and hashable snapshot of the configuration."""
+        return FrozenSHConfig(use_defaults=True, **asdict(self))
+
     def to_dict(self, mask_credentials: bool = True) -> dict[str, str | float]:
         """Get a dictionary representation of the `SHConfig` class.
 
@@ -218,3 +229,48 @@ class SHConfig(_SHConfig):
         """Returns the default location of the user configuration file on disk."""
         config_folder = os.getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
         return os.path.join(config_folder, "sentinelhub", "config.toml")
+
+
+class FrozenSHConfig(SHConfig):
+    """An immutable and hashable snapshot of a sentinelhub-py package configuration.
+
+    It can be used anywhere instead of `SHConfig`, e.g. as a key of a cache. It is initialized in the same way as
+    `SHConfig` or obtained with `SHConfig.freeze()`. Its copy is a mutable `SHConfig` object.
+    """
+
+    def __init__(self, profile: str | None = None, *, use_defaults: bool = False, **kwargs: Any):
+        super().__init__(profile, use_defaults=use_defaults, **kwargs)
+        object.__setattr__(self, "_hash", hash(tuple(asdict(self).values())))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if "_hash" in self.__dict__:
+            raise FrozenInstanceError(f"Cannot assign to field {name!r} of {self.__class__.__name__}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"Cannot delete field {name!r} of {self.__class__.__name__}")
+
+    def __hash__(self) -> int:
+        return self.__dict__["_hash"]
+
+    def copy(self) -> SHConfig:
+        """Makes a mutable copy of the configuration"""
+        return SHConfig(use_defaults=True, **asdict(self))
+
+    def freeze(self) -> FrozenSHConfig:
+        """The configuration is already immutable, therefore the same object is returned."""
+        return self
+
+
+def _load_config_file(filename: str) -> dict[str, Any]:
+    """Provides parsed content of a config file. It is parsed only if it changed since the last time it was parsed."""
+    file_stat = os.stat(filename)
+    return _parse_config_file(filename, (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(filename: str, file_stamp: tuple[int, int, int]) -> dict[str, Any]:  # noqa: ARG001
+    """Parses a config file. Results are cached by the file path and a stamp of file modification time, size, and
+    inode, which changes whenever the file changes. The returned dictionary is shared and must not be modified."""
+    with open(filename, "rb") as cfg_file:
+        return tomli.load(cfg_file)
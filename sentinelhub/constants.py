@@ -6,19 +6,23 @@ from __future__ import annotations
 
 import functools
 import mimetypes
+import os
 import re
+import threading
 import warnings
+from collections import OrderedDict
 from enum import Enum, EnumMeta
-from typing import Callable, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Iterable, NamedTuple, TypeVar
 
 import numpy as np
-import pyproj
-import utm
 from aenum import extend_enum
 
 from ._version import __version__
 from .exceptions import SHUserWarning
 
+if TYPE_CHECKING:
+    import pyproj
+
 
 class ServiceUrl:
     """Most commonly used Sentinel Hub service URLs"""
@@ -67,11 +71,101 @@ class MosaickingOrder(Enum):
     LEAST_CC = "leastCC"
 
 
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, in the same form as provided by `functools.lru_cache`"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ThreadLocalCache(Generic[T]):
+    """A bounded least-recently-used cache of function results, which is kept separately for each thread.
+
+    Objects such as `pyproj.Transformer` must not be shared between threads, therefore each thread creates and caches
+    its own. All caches are emptied in a child process after a fork. Hits and misses are counted per thread.
+    """
+
+    def __init__(self, function: Callable[..., T], maxsize: int):
+        """
+        :param function: A function with hashable parameters
+        :param maxsize: The maximal number of results cached by each thread. It can be changed at any time.
+        """
+        functools.update_wrapper(self, function)
+        self._function = function
+        self.maxsize = maxsize
+
+        self._local = threading.local()
+        self._generation = 0
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.cache_clear)
+
+    def __get__(self, instance: object, owner: type | None = None) -> Callable[..., T]:
+        """Binds the cache to an instance in the same way as a function is bound to become a method"""
+        if instance is None:
+            return self
+        return functools.partial(self, instance)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        """Returns a cached result or calls the function and caches its result"""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.cache, local.hits, local.misses = OrderedDict(), 0, 0
+            local.generation = self._generation
+
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        if key in local.cache:
+            local.hits += 1
+            local.cache.move_to_end(key)
+            return local.cache[key]
+
+        local.misses += 1
+        result = self._function(*args, **kwargs)
+        local.cache[key] = result
+        while len(local.cache) > max(self.maxsize, 0):
+            local.cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Provides statistics of the cache of the current thread"""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            return CacheInfo(0, 0, self.maxsize, 0)
+        return CacheInfo(local.hits, local.misses, self.maxsize, len(local.cache))
+
+    def cache_clear(self) -> None:
+        """Empties caches of all threads and resets their statistics"""
+        self._generation += 1
+
+
+def thread_local_cache(maxsize: int) -> Callable[[Callable[..., T]], ThreadLocalCache[T]]:
+    """A decorator that wraps a function or a method into a `ThreadLocalCache`
+
+    :param maxsize: The maximal number of results cached by each thread
+    """
+
+    def decorator(function: Callable[..., T]) -> ThreadLocalCache[T]:
+        return ThreadLocalCache(function, maxsize)
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _get_unsupported_crs() -> pyproj.CRS:
+    """Provides a CRS with lat-lng coordinate order, which is not supported. The `pyproj` package is imported only
+    when it is needed, which keeps importing this module fast."""
+    import pyproj  # pylint: disable=import-outside-toplevel
+
+    return pyproj.CRS(4326)
+
+
 class CRSMeta(EnumMeta):
     """Metaclass used for building CRS Enum class"""
 
-    _UNSUPPORTED_CRS = pyproj.CRS(4326)
-
     def __new__(mcs, cls, bases, classdict):  # type: ignore[no-untyped-def] # noqa: N804
         """This is executed at the beginning of runtime when CRS class is created"""
         for direction, direction_value in [("N", "6"), ("S", "7")]:
@@ -104,7 +198,7 @@ class CRSMeta(EnumMeta):
         if isinstance(value, dict) and "init" in value:
             value = value["init"]
         if hasattr(value, "to_epsg"):
-            if value == CRSMeta._UNSUPPORTED_CRS:
+            if value == _get_unsupported_crs():
                 message = (
                     "sentinelhub-py supports only WGS 84 coordinate reference system with "
                     "coordinate order lng-lat. Given pyproj.CRS(4326) has coordinate order lat-lng. Be careful "
@@ -200,35 +294,41 @@ class CRS(Enum, metaclass=CRSMeta):
         """
         return self.name.startswith("UTM")
 
-    @functools.lru_cache(maxsize=128)
+    @thread_local_cache(maxsize=128)
     def projection(self) -> pyproj.Proj:
         """Returns a projection in form of pyproj class.
 
-        For better time performance this method will cache `128` most recent results. Cache can be released with
-        `CRS.projection.cache_clear()`.
+        For better time performance this method will cache `128` most recent results in each thread. Cache can be
+        released with `CRS.projection.cache_clear()`.
 
         :return: pyproj projection class
         """
+        import pyproj  # pylint: disable=import-outside-toplevel
+
         return pyproj.Proj(self._get_pyproj_projection_def(), preserve_units=True)
 
-    @functools.lru_cache(maxsize=128)
+    @thread_local_cache(maxsize=128)
     def pyproj_crs(self) -> pyproj.CRS:
         """Returns a pyproj CRS class.
 
-        For better time performance this method will cache `128` most recent results. Cache can be released with
-        `CRS.pyproj_crs.cache_clear()`.
+        For better time performance this method will cache `128` most recent results in each thread. Cache can be
+        released with `CRS.pyproj_crs.cache_clear()`.
 
         :return: pyproj CRS class
         """
+        import pyproj  # pylint: disable=import-outside-toplevel
+
         return pyproj.CRS(self._get_pyproj_projection_def())
 
-    @functools.lru_cache(maxsize=512)
+    @thread_local_cache(maxsize=512)
     def get_transform_function(self, other: CRS, always_xy: bool = True) -> Callable[..., tuple]:
         """Returns a function for transforming geometrical objects from one CRS to another. The function will support
         transformations between any objects that pyproj supports.
 
-        For better time performance this method will cache results. Cache can be released with
-        `CRS.get_transform_function.cache_clear()`.
+        For better time performance this method will cache `512` most recent results in each thread, because pyproj
+        transformers must not be shared between threads. Cache can be released with
+        `CRS.get_transform_function.cache_clear()` and its statistics are given by
+        `CRS.get_transform_function.cache_info()`.
 
         :param self: Initial CRS
         :param other: Target CRS
@@ -236,8 +336,29 @@ class CRS(Enum, metaclass=CRSMeta):
             transformation. The default value `True` is in most cases the correct one.
         :return: A projection function obtained from pyproj package
         """
+        import pyproj  # pylint: disable=import-outside-toplevel
+
         return pyproj.Transformer.from_proj(self.projection(), other.projection(), always_xy=always_xy).transform
 
+    @staticmethod
+    def warm_up_transform_functions(crs_list: Iterable[CRS] | None = None, always_xy: bool = True) -> None:
+        """Creates and caches transform functions between WGS84 and given CRS, in both directions. Because caches are
+        kept per thread, this has to be called in each thread, e.g. as an initializer of a thread pool.
+
+        :param crs_list: Coordinate reference systems to prepare. By default, these are Popular Web Mercator and all
+            UTM zones.
+        :param always_xy: Parameter that is passed to `pyproj.Transformer` object and defines axis order for
+            transformation.
+        """
+        if crs_list is None:
+            crs_list = [CRS.POP_WEB, *(crs for crs in CRS if crs.is_utm())]
+
+        for crs in crs_list:
+            crs = CRS(crs)
+            if crs is not CRS.WGS84:
+                CRS.WGS84.get_transform_function(crs, always_xy=always_xy)
+                crs.get_transform_function(CRS.WGS84, always_xy=always_xy)
+
     @staticmethod
     def get_utm_from_wgs84(lng: float, lat: float) -> CRS:
         """Convert from WGS84 to UTM coordinate system
@@ -246,9 +367,19 @@ class CRS(Enum, metaclass=CRSMeta):
         :param lat: Latitude
         :return: UTM coordinates
         """
-        _, _, zone, _ = utm.from_latlon(lat, lng)
-        direction = "N" if lat >= 0 else "S"
-        return CRS[f"UTM_{zone}{direction}"]
+        zone = _get_utm_zone(lng, lat)
+        return _UTM_CRS_TABLE[(32600 if lat >= 0 else 32700) + zone]
+
+    @staticmethod
+    def get_utm_epsg_codes_from_wgs84(lngs: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """A vectorised version of `get_utm_from_wgs84`, which provides EPSG codes of UTM zones
+
+        :param lngs: An array of longitudes
+        :param lats: An array of latitudes
+        :return: An integer array of EPSG codes of UTM zones
+        """
+        lngs, lats = np.asarray(lngs, dtype=np.float64), np.asarray(lats, dtype=np.float64)
+        return np.where(lats >= 0, 32600, 32700) + _get_utm_zones(lngs, lats)
 
     def _get_pyproj_projection_def(self) -> str:
         """Returns a pyproj crs definition
@@ -258,6 +389,41 @@ class CRS(Enum, metaclass=CRSMeta):
         return "+proj=longlat +ellps=WGS84 +datum=WGS84 +no_defs" if self is CRS.WGS84 else self.ogc_string()
 
 
+_UTM_CRS_TABLE = {crs.epsg: crs for crs in CRS if crs.is_utm()}
+
+
+def _get_utm_zone(lng: float, lat: float) -> int:
+    """Calculates the number of a UTM zone containing a point, including the exceptions for Norway and Svalbard."""
+    if not -80 <= lat <= 84:
+        raise ValueError(f"Latitude {lat} out of range, it must be between 80 deg S and 84 deg N")
+    if not -180 <= lng <= 180:
+        raise ValueError(f"Longitude {lng} out of range, it must be between 180 deg W and 180 deg E")
+
+    lng = (lng % 360 + 540) % 360 - 180
+    if 56 <= lat < 64 and 3 <= lng < 12:
+        return 32
+    if lat >= 72 and 0 <= lng < 42:
+        return 31 if lng < 9 else 33 if lng < 21 else 35 if lng < 33 else 37
+    return int((lng + 180) / 6) + 1
+
+
+def _get_utm_zones(lngs: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """A vectorised version of `_get_utm_zone`."""
+    if np.any((lats < -80) | (lats > 84)):
+        raise ValueError("Latitudes out of range, they must be between 80 deg S and 84 deg N")
+    if np.any((lngs < -180) | (lngs > 180)):
+        raise ValueError("Longitudes out of range, they must be between 180 deg W and 180 deg E")
+
+    lngs = (lngs % 360 + 540) % 360 - 180
+    zones = np.floor((lngs + 180) / 6).astype(np.int64) + 1
+
+    zones[(lats >= 56) & (lats < 64) & (lngs >= 3) & (lngs < 12)] = 32
+    svalbard_mask = lats >= 72
+    for min_lng, max_lng, zone in [(0, 9, 31), (9, 21, 33), (21, 33, 35), (33, 42, 37)]:
+        zones[svalbard_mask & (lngs >= min_lng) & (lngs < max_lng)] = zone
+    return zones
+
+
 class MimeType(Enum):
     """Enum class to represent supported file formats
 
@@ -4,10 +4,12 @@ Module defining data collections
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field, fields
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from aenum import extend_enum
+from aenum import NoAlias, extend_enum
 
 from .constants import ServiceUrl
 from .data_collections_bands import Band, Bands, MetaBands
@@ -119,10 +121,17 @@ class _DataCollectionMeta(EnumMeta):
     def __call__(cls, value, *args, **kwargs):  # type: ignore[no-untyped-def] # noqa: N805
         """This is executed whenever `DataCollection('something')` is called
 
-        This solves a problem of pickling a custom DataCollection and unpickling it in another process
+        This solves a problem of pickling a custom DataCollection and unpickling it in another process. Definitions are
+        looked up directly in the value map, which is much faster than the generic enum lookup.
         """
-        if isinstance(value, DataCollectionDefinition) and value not in cls._value2member_map_ and value._name:
-            cls._try_add_data_collection(value._name, value)
+        if isinstance(value, DataCollectionDefinition) and not args and not kwargs:
+            member = cls._value2member_map_.get(value)
+            if member is not None:
+                return member
+
+            if value._name:
+                cls._try_add_data_collection(value._name, value)
+                return cls._value2member_map_[value]
 
         return super().__call__(value, *args, **kwargs)
 
@@ -163,6 +172,20 @@ class DataCollectionDefinition:
         if isinstance(self.metabands, list):
             object.__setattr__(self, "metabands", tuple(self.metabands))
 
+    def __hash__(self) -> int:
+        """Caches the hash because it is expensive to compute over bands and is needed on every lookup"""
+        cached_hash = self.__dict__.get("_hash")
+        if cached_hash is None:
+            cached_hash = hash(tuple(getattr(self, field.name) for field in fields(self) if field.compare))
+            object.__setattr__(self, "_hash", cached_hash)
+        return cached_hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        """A cached hash is not pickled because hashes of strings differ between Python processes"""
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
     def __repr__(self) -> str:
         """A nicer representation of parameters that define a data collection"""
         valid_params = {name: value for name, value in _shallow_asdict(self).items() if value is not None}
@@ -182,6 +205,10 @@ class DataCollectionDefinition:
         return DataCollectionDefinition(**derived_params)
 
 
+_DEFINITION_FIELD_NAMES = frozenset(field.name for field in fields(DataCollectionDefinition) if field.compare)
+_DEFINE_LOCK = threading.Lock()
+
+
 class DataCollection(Enum, metaclass=_DataCollectionMeta):
     """An enum class for data collections
 
@@ -506,16 +533,17 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
         anything. However, if either a name or a definition has already been matched with another name or definition
         then it will raise an error.
         """
-        is_name_defined = name in cls.__members__
-        is_enum_defined = is_name_defined and cls.__members__[name].value == definition
-        is_definition_defined = definition in cls._value2member_map_
+        with _DEFINE_LOCK:
+            is_name_defined = name in cls._member_map_
+            is_enum_defined = is_name_defined and cls._member_map_[name].value == definition
+            is_definition_defined = definition in cls._value2member_map_
 
-        if is_enum_defined:
-            return
+            if is_enum_defined:
+                return
 
-        if not is_name_defined and not is_definition_defined:
-            extend_enum(cls, name, definition)
-            return
+            if not is_name_defined and not is_definition_defined:
+                cls._extend_enum(name, definition)
+                return
 
         if is_name_defined:
             raise ValueError(f"Data collection name `{name}` is already taken by another data collection")
@@ -526,6 +554,19 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
             "DataCollection enums cannot have the same definition."
         )
 
+    @classmethod
+    def _extend_enum(cls, name: str, definition: DataCollectionDefinition) -> None:
+        """Adds a new enum member. Because the name and the definition have already been checked to be unique,
+        `aenum` doesn't have to search for aliases among all existing members, which would make adding a member take
+        linear time.
+        """
+        settings = cls._settings_  # type: ignore[attr-defined]
+        cls._settings_ = settings | {NoAlias}  # type: ignore[attr-defined]
+        try:
+            extend_enum(cls, name, definition)
+        finally:
+            cls._settings_ = settings  # type: ignore[attr-defined]
+
     @classmethod
     def define_byoc(cls, collection_id: str, **params: Any) -> DataCollection:
         """Defines a BYOC data collection
@@ -558,7 +599,7 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
         params["collection_id"] = collection_id
         return cls.define(**params)
 
-    @property
+    @cached_property
     def api_id(self) -> str:
         """Provides a Sentinel Hub Process API identifier or raises an error if it is not defined
 
@@ -569,7 +610,7 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
             raise ValueError(f"Data collection {self.name} is missing a Sentinel Hub Process API identifier")
         return self.value.api_id
 
-    @property
+    @cached_property
     def catalog_id(self) -> str:
         """Provides a Sentinel Hub Catalog API identifier or raises an error if it is not defined
 
@@ -583,7 +624,7 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
             return self.value.api_id
         raise ValueError(f"Data collection {self.name} is missing a Sentinel Hub Catalog API identifier")
 
-    @property
+    @cached_property
     def wfs_id(self) -> str:
         """Provides a Sentinel Hub WFS identifier or raises an error if it is not defined
 
@@ -594,7 +635,7 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
             raise ValueError(f"Data collection {self.name} is missing a Sentinel Hub WFS identifier")
         return self.value.wfs_id
 
-    @property
+    @cached_property
     def bands(self) -> tuple[Band, ...]:
         """Provides band information available for the data collection
 
@@ -605,7 +646,7 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
             raise ValueError(f"Data collection {self.name} does not define bands")
         return self.value.bands
 
-    @property
+    @cached_property
     def metabands(self) -> tuple[Band, ...]:
         """Provides metaband information available for the data collection
 
@@ -620,10 +661,11 @@ class DataCollection(Enum, metaclass=_DataCollectionMeta):
         """The following insures that any attribute from DataCollectionDefinition, which is already not a
         property or an attribute of DataCollection, becomes an attribute of DataCollection
         """
-        if not item.startswith("_") and hasattr(self, "value") and isinstance(self.value, DataCollectionDefinition):
-            definition_dict = _shallow_asdict(self.value)
-            if item in definition_dict:
-                return definition_dict[item]
+        if item in _DEFINITION_FIELD_NAMES:
+            value = getattr(self._value_, item)
+            # Definitions are immutable, therefore values can be stored on the member to skip this method next time
+            self.__dict__[item] = value
+            return value
 
         return super().__getattribute__(item)
 
@@ -4,13 +4,18 @@ Module for data decoding
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shutil
 import struct
 import tarfile
+import tempfile
+import threading
 import warnings
 from io import BytesIO
 from json import JSONDecodeError
-from typing import IO, Any
+from typing import IO, Any, Iterable, Iterator, Literal, Mapping, NamedTuple, overload
 from xml.etree import ElementTree
 
 import numpy as np
@@ -20,6 +25,13 @@ from requests import Response
 
 from .constants import MimeType
 from .exceptions import ImageDecodingError
+from .json_utils import json_loads
+
+# A JPEG2000 codestream starts with SOC and SIZ markers, the bit depth of the first component is the last byte of a
+# SIZ segment prefix of this length
+_J2K_CODESTREAM_START = b"\xff\x4f\xff\x51"
+_J2K_SIZ_LENGTH = 43
+_GLYMUR_OPTIONS_LOCK = threading.Lock()
 
 
 def decode_data(response_content: bytes, data_type: MimeType) -> Any:
@@ -31,10 +43,9 @@ def decode_data(response_content: bytes, data_type: MimeType) -> Any:
     :raises: ValueError
     """
     if data_type is MimeType.JSON:
-        response_text = response_content.decode("utf-8")
-        if not response_text:
-            return response_text
-        return json.loads(response_text)
+        if not response_content:
+            return ""
+        return json_loads(response_content)
     if data_type is MimeType.TAR:
         return decode_tar(response_content)
     if MimeType.is_image_format(data_type):
@@ -52,18 +63,26 @@ def decode_data(response_content: bytes, data_type: MimeType) -> Any:
         raise ValueError(f"Decoding data format {data_type} is not supported") from exception
 
 
-def decode_image(data: bytes, image_type: MimeType) -> np.ndarray:
+def decode_image(
+    data: bytes, image_type: MimeType, *, out: np.ndarray | None = None, maxworkers: int | None = None
+) -> np.ndarray:
     """Decodes the image provided in various formats, i.e. png, 16-bit float tiff, 32-bit float tiff, jp2
     and returns it as a numpy array
 
     :param data: image in its original format
     :param image_type: expected image format
-    :return: image as numpy array
+    :param out: A preallocated array into which the image will be written, e.g. a slice of a larger array into which
+        multiple images are stacked. It must have the same shape as the image, up to dimensions of size 1, and a dtype
+        to which image values can be safely cast. If it is C-contiguous and has the same dtype as a TIFF image, the
+        image is decoded directly into it. Otherwise, the image is decoded first and then copied into it.
+    :param maxworkers: Maximum number of threads used by `tifffile` to decode segments of a TIFF image. By default,
+        `tifffile` decides on its own. It has no effect for other image formats.
+    :return: image as numpy array. If `out` is given, the same array is returned.
     :raises: ImageDecodingError
     """
     bytes_data = BytesIO(data)
     if image_type is MimeType.TIFF:
-        image = tiff.imread(bytes_data)
+        image = _decode_tiff(bytes_data, out=out, maxworkers=maxworkers)
     elif image_type is MimeType.JP2:
         image = decode_jp2_image(bytes_data)
     else:
@@ -71,7 +90,78 @@ def decode_image(data: bytes, image_type: MimeType) -> np.ndarray:
 
     if image is None:
         raise ImageDecodingError("Unable to decode image")
-    return image
+    if out is None:
+        return image
+
+    if not np.shares_memory(image, out):
+        if not _is_matching_shape(image.shape, out.shape):
+            raise ValueError(f"Image of shape {image.shape} cannot be written into an array of shape {out.shape}")
+        np.copyto(out, image.reshape(out.shape), casting="safe")
+    return out
+
+
+def _is_matching_shape(image_shape: tuple[int, ...], out_shape: tuple[int, ...]) -> bool:
+    """Checks if an image can be written into an output array without changing the order of pixels, i.e. if shapes
+    differ only in dimensions of size 1
+    """
+    return [size for size in image_shape if size != 1] == [size for size in out_shape if size != 1]
+
+
+def _decode_tiff(stream: IO, out: np.ndarray | None, maxworkers: int | None) -> np.ndarray:
+    """Decodes a TIFF image, directly into the output array if its shape, dtype and memory layout allow it."""
+    with tiff.TiffFile(stream) as tif:
+        series = tif.series[0]
+        if (
+            out is not None
+            and out.flags.c_contiguous
+            and series.dtype == out.dtype
+            and _is_matching_shape(series.shape, out.shape)
+        ):
+            # tifffile reshapes the given output array, therefore it gets a view of it
+            return tif.asarray(out=out.view(), maxworkers=maxworkers)
+        return tif.asarray(maxworkers=maxworkers)
+
+
+class ImageInfo(NamedTuple):
+    """Shape and dtype of an image, the same as of an array obtained by decoding the image"""
+
+    shape: tuple[int, ...]
+    dtype: np.dtype
+
+
+def probe_image(data: bytes | str, image_type: MimeType | None = None) -> ImageInfo:
+    """Provides shape and dtype of an image by reading only its headers, without decoding the image.
+
+    TIFF images are probed by reading their IFDs with `tifffile`, other formats by reading headers with `Pillow`,
+    e.g. IHDR chunk of PNG images and the header boxes of JPEG2000 images. Obtained values are the same as the ones of
+    an array returned by `decode_image` or `read_data`.
+
+    :param data: Image in its original format or a path to an image file. Only headers are read from a file.
+    :param image_type: An image format. If not given, it is guessed from the extension of a file path.
+    :return: Shape and dtype of the image
+    """
+    if image_type is None:
+        if not isinstance(data, str):
+            raise ValueError("Parameter image_type has to be given if image is not given as a path to a file")
+        image_type = get_data_format(data)
+
+    stream: IO | str = BytesIO(data) if isinstance(data, bytes) else data
+    if image_type is MimeType.TIFF:
+        with tiff.TiffFile(stream) as tif:
+            series = tif.series[0]
+            return ImageInfo(tuple(series.shape), series.dtype)
+
+    with Image.open(stream) as image:
+        width, height = image.size
+        band_shape, dtype = _get_pillow_mode_layout(image.mode)
+    return ImageInfo((height, width, *band_shape), dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pillow_mode_layout(mode: str) -> tuple[tuple[int, ...], np.dtype]:
+    """Provides a shape of bands and a dtype of an array which `numpy` creates from a `Pillow` image of a given mode."""
+    pixel = np.array(Image.new(mode, (1, 1)))
+    return pixel.shape[2:], pixel.dtype
 
 
 def decode_image_with_pillow(stream: IO | str) -> np.ndarray:
@@ -85,30 +175,105 @@ def decode_image_with_pillow(stream: IO | str) -> np.ndarray:
         return np.array(Image.open(stream))
 
 
-def decode_jp2_image(stream: IO) -> np.ndarray:
-    """Tries to decode a JPEG2000 image using the `Pillow` package.
+def decode_jp2_image(
+    stream: IO | str, *, backend: Literal["pillow", "glymur"] = "pillow", num_threads: int | None = None
+) -> np.ndarray:
+    """Decodes a JPEG2000 image. The bit depth of the image is parsed from its header before the image is decoded.
+
+    The default backend is the `Pillow` package, which incorrectly reads images with 15-bit encoding, therefore values
+    of such images are corrected in place after decoding. The `glymur` backend uses OpenJPEG library directly and
+    can decode tiles of large images, e.g. bands of Sentinel-2 tiles from AWS, in multiple threads. It requires the
+    package `glymur` to be installed separately, e.g. with `pip install sentinelhub[jp2]`. Because `glymur` reads
+    only from files, an image given as a binary stream is first written into a temporary file.
 
-    :param stream: A binary stream format.
+    :param stream: A binary stream format or a filename.
+    :param backend: A package used to decode the image, either `"pillow"` or `"glymur"`.
+    :param num_threads: A number of threads used by OpenJPEG to decode the image. It is used only by the `glymur`
+        backend. It temporarily overrides the process-wide `glymur` option `lib.num_threads`, therefore decodings
+        with this parameter don't run concurrently with each other. By default, the `glymur` option is used, which
+        is a single thread unless configured otherwise.
     :return: A numpy array representing an image of shape (height, width) or (height, width, channels).
     """
-    image = decode_image_with_pillow(stream)
+    if backend == "glymur":
+        return _decode_jp2_with_glymur(stream, num_threads)
+    if backend != "pillow":
+        raise ValueError(f"Unsupported JPEG2000 decoding backend {backend}, use either 'pillow' or 'glymur'")
+
+    if isinstance(stream, str):
+        with open(stream, "rb") as file_stream:
+            return decode_jp2_image(file_stream)
+
     bit_depth = get_jp2_bit_depth(stream)
+    if bit_depth not in (8, 15, 16):
+        raise ValueError(
+            f"Bit depth {bit_depth} of jp2 image is currently not supported. Please raise an issue on package Github"
+            " page"
+        )
 
+    stream.seek(0)
+    image = decode_image_with_pillow(stream)
     return fix_jp2_image(image, bit_depth)
 
 
-def decode_tar(data: bytes | BytesIO) -> dict[str, object]:
+def _decode_jp2_with_glymur(stream: IO | str, num_threads: int | None) -> np.ndarray:
+    """Decodes a JPEG2000 image with `glymur` package, in multiple threads if OpenJPEG supports it."""
+    try:
+        import glymur  # pylint: disable=import-outside-toplevel
+    except ImportError as exception:
+        raise ImportError(
+            "Package `glymur` is required to decode JPEG2000 images with the glymur backend."
+        ) from exception
+
+    if isinstance(stream, str):
+        return _read_with_glymur(glymur, stream, num_threads)
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        filename = os.path.join(temp_folder, "image.jp2")
+        with open(filename, "wb") as file_stream:
+            stream.seek(0)
+            shutil.copyfileobj(stream, file_stream)
+        return _read_with_glymur(glymur, filename, num_threads)
+
+
+def _read_with_glymur(glymur: Any, filename: str, num_threads: int | None) -> np.ndarray:
+    """Reads a JPEG2000 file with `glymur`. The number of OpenJPEG threads is a process-wide `glymur` option,
+    therefore it is changed only for the time of decoding, under a lock, and then the previous value is restored."""
+    if num_threads is None:
+        return glymur.Jp2k(filename)[:]
+
+    with _GLYMUR_OPTIONS_LOCK:
+        previous_num_threads = glymur.get_option("lib.num_threads")
+        if previous_num_threads != num_threads:
+            glymur.set_option("lib.num_threads", num_threads)
+        try:
+            return glymur.Jp2k(filename)[:]
+        finally:
+            if previous_num_threads != num_threads:
+                glymur.set_option("lib.num_threads", previous_num_threads)
+
+
+@overload
+def decode_tar(data: bytes | BytesIO | str, *, lazy: Literal[False] = False) -> dict[str, Any]: ...
+
+
+@overload
+def decode_tar(data: bytes | BytesIO | str, *, lazy: Literal[True]) -> TarData: ...
+
+
+def decode_tar(data: bytes | BytesIO | str, *, lazy: bool = False) -> dict[str, Any] | TarData:
     """A decoder to convert response bytes into a dictionary of {filename: value}
 
-    :param data: Data to decode
-    :return: A dictionary of decoded files from a tar file
+    :param data: Data to decode or a path to a TAR file
+    :param lazy: If `True`, a read-only `TarData` mapping is returned instead of a dictionary. It decodes files only
+        when they are accessed.
+    :return: A dictionary or a mapping of decoded files from a tar file
     """
-    if isinstance(data, bytes):
-        data = BytesIO(data)
+    if lazy:
+        return TarData(data)
 
-    with tarfile.open(fileobj=data) as tar:
+    with _open_tar(data) as tar:
         decoded_files = {}
-        for member in tar.getmembers():
+        for member in tar:
             file = tar.extractfile(member)
             if file is not None:
                 decoded_files[member.name] = decode_data(file.read(), get_data_format(member.name))
@@ -116,6 +281,105 @@ def decode_tar(data: bytes | BytesIO) -> dict[str, object]:
         return decoded_files
 
 
+def _open_tar(source: bytes | BytesIO | str) -> tarfile.TarFile:
+    """Opens a TAR archive from bytes, a binary stream, or a path to a file"""
+    if isinstance(source, str):
+        return tarfile.open(source)
+    if isinstance(source, bytes):
+        return tarfile.open(fileobj=BytesIO(source))
+    source.seek(0)
+    return tarfile.open(fileobj=source)
+
+
+class TarData(Mapping[str, Any]):
+    """A read-only mapping of {filename: value} for files in a TAR archive.
+
+    Only headers of archive members are read at initialization. Each file is decoded when it is accessed for the first
+    time and the decoded value is then kept. If the archive is given as a path to a file, it is never loaded into
+    memory as a whole, only the accessed files are read from it. Such a file must not change while the mapping is
+    used, otherwise reading from it raises an error.
+    """
+
+    def __init__(self, data: bytes | BytesIO | str):
+        """
+        :param data: Bytes of a TAR archive, a binary stream with a TAR archive, or a path to a TAR file
+        """
+        self._source = data
+        self._file_stamp = self._get_file_stamp()
+        with self._open() as tar:
+            self._members = {member.name: member for member in tar if member.isfile()}
+        self._decoded_files: dict[str, Any] = {}
+
+    def _get_file_stamp(self) -> tuple[int, int, int] | None:
+        """Provides modification time, size, and inode of a TAR file, which identify the version of the file"""
+        if not isinstance(self._source, str):
+            return None
+        file_stat = os.stat(self._source)
+        return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def _open(self) -> tarfile.TarFile:
+        """Opens the archive. A new archive object is opened every time, therefore reading from it doesn't interfere
+        with other readers."""
+        if isinstance(self._source, str) and self._get_file_stamp() != self._file_stamp:
+            raise ValueError(f"TAR file {self._source} has changed since its members were read")
+        return _open_tar(self._source)
+
+    def __getitem__(self, filename: str) -> Any:
+        if filename not in self._decoded_files:
+            self._decoded_files[filename] = decode_data(self.read_bytes(filename), get_data_format(filename))
+        return self._decoded_files[filename]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._members)})"
+
+    def read_bytes(self, filename: str) -> bytes:
+        """Reads a file from the archive without decoding it.
+
+        :param filename: A name of a file in the archive
+        :return: Raw content of the file
+        """
+        member = self._members[filename]
+        with self._open() as tar:
+            file = tar.extractfile(member)
+            if file is None:
+                raise ValueError(f"Failed to extract {filename} from a TAR archive")
+            return file.read()
+
+    def extract(self, folder: str, filenames: Iterable[str] | None = None) -> list[str]:
+        """Extracts files from the archive into a folder without decoding them. Each file is streamed from the
+        archive to disk in parts, therefore entire files are never held in memory.
+
+        :param folder: A folder into which files will be extracted. Paths of files in the archive are kept relative
+            to this folder.
+        :param filenames: Names of files to extract. By default, all files are extracted.
+        :return: Paths of extracted files
+        """
+        members = [self._members[filename] for filename in (self._members if filenames is None else filenames)]
+        paths = []
+        with self._open() as tar:
+            for member in members:
+                path = os.path.normpath(os.path.join(folder, member.name))
+                if os.path.isabs(member.name) or os.path.relpath(path, folder).startswith(os.pardir):
+                    raise ValueError(f"File {member.name} in a TAR archive would be extracted outside of {folder}")
+
+                file = tar.extractfile(member)
+                if file is None:
+                    raise ValueError(f"Failed to extract {member.name} from a TAR archive")
+
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with file, open(path, "wb") as output_file:
+                    shutil.copyfileobj(file, output_file)
+                paths.append(path)
+
+        return paths
+
+
 def decode_sentinelhub_err_msg(response: Response) -> str:
     """Decodes error message from Sentinel Hub service
 
@@ -152,28 +416,49 @@ def decode_sentinelhub_err_msg(response: Response) -> str:
 def get_jp2_bit_depth(stream: IO) -> int:
     """Reads a bit encoding depth of jpeg2000 file in binary stream format
 
+    The depth is read from the Image Header Box of a JP2 file or, for a raw J2K codestream, from its SIZ marker
+    segment. Only boxes preceding the Image Header Box are traversed and their contents are skipped.
+
     :param stream: binary stream format
     :return: bit depth
     """
+    stream.seek(0)
+    read_buffer = stream.read(_J2K_SIZ_LENGTH)
+    if read_buffer.startswith(_J2K_CODESTREAM_START):
+        if len(read_buffer) < _J2K_SIZ_LENGTH:
+            raise ValueError("SIZ marker segment of JPEG2000 codestream is incomplete")
+        return (read_buffer[-1] & 0x7F) + 1
+
     stream.seek(0)
     while True:
         read_buffer = stream.read(8)
         if len(read_buffer) < 8:
             raise ValueError("Image Header Box not found in JPEG2000 file")
 
-        _, box_id = struct.unpack(">I4s", read_buffer)
+        box_length, box_id = struct.unpack(">I4s", read_buffer)
+        header_length = 8
+        if box_length == 1:
+            (box_length,) = struct.unpack(">Q", stream.read(8))
+            header_length = 16
 
         if box_id == b"ihdr":
             read_buffer = stream.read(14)
             params = struct.unpack(">IIHBBBB", read_buffer)
             return (params[3] & 0x7F) + 1
 
+        if box_id == b"jp2h":
+            # JP2 Header Box is a superbox, the Image Header Box is the first box inside it
+            continue
+        if box_length == 0:
+            raise ValueError("Image Header Box not found in JPEG2000 file")
+        stream.seek(box_length - header_length, os.SEEK_CUR)
+
 
 def fix_jp2_image(image: np.ndarray, bit_depth: int) -> np.ndarray:
     """Because Pillow library incorrectly reads JPEG 2000 images with 15-bit encoding this function corrects the
-    values in image.
+    values in image. The correction is done in place.
 
-    :param image: image read by opencv library
+    :param image: image read by Pillow library
     :param bit_depth: A bit depth of jp2 image encoding
     :return: corrected image
     """
@@ -181,7 +466,7 @@ def fix_jp2_image(image: np.ndarray, bit_depth: int) -> np.ndarray:
         return image
     if bit_depth == 15:
         try:
-            return image >> 1
+            return np.right_shift(image, 1, out=image)
         except TypeError as exception:
             raise OSError(
                 "Failed to read JPEG2000 image correctly. Most likely reason is that Pillow did not "
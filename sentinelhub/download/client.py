@@ -4,7 +4,6 @@ Module implementing the main download client class
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import warnings
@@ -13,11 +12,13 @@ from contextlib import nullcontext
 from typing import Any, Iterable
 from xml.etree import ElementTree
 
+import numpy as np
 import requests
 from tqdm.auto import tqdm
 
 from ..config import SHConfig
 from ..constants import MimeType, RequestType
+from ..decoding import decode_tar
 from ..exceptions import (
     DownloadFailedException,
     HashedNameCollisionException,
@@ -25,13 +26,16 @@ from ..exceptions import (
     SHDeprecationWarning,
     SHRuntimeWarning,
 )
-from ..io_utils import read_data
+from ..io_utils import read_chunked_array, read_data, write_chunked_array
+from ..json_utils import json_dumps, json_loads
 from ..types import JsonDict
 from .handlers import fail_user_errors, retry_temporary_errors
 from .models import DownloadRequest, DownloadResponse
 
 LOGGER = logging.getLogger(__name__)
 
+DECODED_CACHE_FILENAME = "decoded.shchunk"
+
 
 class DownloadClient:
     """A basic download client object
@@ -44,17 +48,34 @@ class DownloadClient:
     - reads and writes locally stored/cached data
     """
 
-    def __init__(self, *, redownload: bool = False, raise_download_errors: bool = True, config: SHConfig | None = None):
+    def __init__(
+        self,
+        *,
+        redownload: bool = False,
+        raise_download_errors: bool = True,
+        cache_decoded: bool = False,
+        lazy_tar: bool = False,
+        config: SHConfig | None = None,
+    ):
         """
         :param redownload: If `True` the data will always be downloaded again. By default, this is set to `False` and
             the data that has already been downloaded and saved to an expected location will be read from the
             location instead of being downloaded again.
         :param raise_download_errors: If `True` any error in download process will be raised as
             `DownloadFailedException`. If `False` failed downloads will only raise warnings.
+        :param cache_decoded: If `True`, decoded images of requests which are saved to disk are additionally stored
+            next to saved responses in a chunked and compressed array format. Repeated downloads of such requests are
+            then read from these arrays, without decoding images again. The cache is used only for requests with
+            image data types whose responses are stored under hashed names of requests. Cached arrays older than a
+            stored response or unreadable ones are ignored and replaced.
+        :param lazy_tar: If `True`, TAR responses are decoded into read-only `TarData` mappings, which decode files
+            only when they are accessed, instead of dictionaries of all decoded files.
         :param config: An instance of configuration class
         """
         self.redownload = redownload
         self.raise_download_errors = raise_download_errors
+        self.cache_decoded = cache_decoded
+        self.lazy_tar = lazy_tar
 
         self.config = config or SHConfig()
 
@@ -112,9 +133,82 @@ class DownloadClient:
         return results
 
     def _single_download_decoded(self, request: DownloadRequest) -> Any:
-        """Downloads a response and decodes it into data. By decoding a single response"""
+        """Downloads a response and decodes it into data. By decoding a single response
+
+        A TAR response which is already stored locally is decoded directly from the stored file, without reading the
+        entire file into memory. If caching of decoded data is enabled, images are read from and saved to the cache.
+        """
+        local_tar_path = self._get_local_tar_path(request)
+        if local_tar_path is not None:
+            LOGGER.debug("Reading locally stored TAR data from %s instead of downloading", local_tar_path)
+            if self.lazy_tar:
+                return decode_tar(local_tar_path, lazy=True)
+            return read_data(local_tar_path, MimeType.TAR)
+
+        decoded_cache_path = self._get_decoded_cache_path(request)
+        if (
+            decoded_cache_path is not None
+            and not self.redownload
+            and self._is_decoded_cache_valid(decoded_cache_path, request)
+        ):
+            LOGGER.debug("Reading locally cached decoded data from %s instead of downloading", decoded_cache_path)
+            self._check_cached_request_is_matching(request, request.get_storage_paths()[0])
+            try:
+                return read_chunked_array(decoded_cache_path)
+            except ValueError:
+                LOGGER.warning("Cached decoded data in %s is corrupted, data will be decoded again", decoded_cache_path)
+
         response = self._single_download(request)
-        return None if response is None else response.decode()
+        if response is None:
+            return None
+
+        if self.lazy_tar and response.response_type is MimeType.TAR:
+            return decode_tar(response.content, lazy=True)
+
+        data = response.decode()
+        if decoded_cache_path is not None and isinstance(data, np.ndarray):
+            write_chunked_array(decoded_cache_path, data)
+            LOGGER.debug("Saved decoded data to %s", decoded_cache_path)
+        return data
+
+    def _get_decoded_cache_path(self, request: DownloadRequest) -> str | None:
+        """Provides a path to a cached decoded image of a request, keyed by the hashed name of the request."""
+        if not (self.cache_decoded and request.save_response and request.return_data):
+            return None
+        if not request.data_type.is_image_format():
+            return None
+
+        request.raise_if_invalid()
+        request_path, _ = request.get_storage_paths()
+        if request_path is None:
+            return None
+        return os.path.join(os.path.dirname(request_path), DECODED_CACHE_FILENAME)
+
+    @staticmethod
+    def _is_decoded_cache_valid(decoded_cache_path: str, request: DownloadRequest) -> bool:
+        """Checks that cached decoded data exists and is not older than the stored response, which could have been
+        saved again by another client or process.
+        """
+        if not os.path.exists(decoded_cache_path):
+            return False
+
+        _, response_path = request.get_storage_paths()
+        if response_path is None or not os.path.exists(response_path):
+            return True
+        return os.path.getmtime(decoded_cache_path) >= os.path.getmtime(response_path)
+
+    def _get_local_tar_path(self, request: DownloadRequest) -> str | None:
+        """Provides a path to a locally stored TAR response if it can be decoded directly from disk."""
+        if self.redownload or not request.return_data or request.data_type is not MimeType.TAR:
+            return None
+
+        request.raise_if_invalid()
+        request_path, response_path = request.get_storage_paths()
+        if response_path is None or not os.path.exists(response_path):
+            return None
+
+        self._check_cached_request_is_matching(request, request_path)
+        return response_path
 
     def _single_download(self, request: DownloadRequest) -> DownloadResponse | None:
         """Method for downloading a single request."""
@@ -188,7 +282,7 @@ class DownloadClient:
 
         current_request_info = request.get_request_params(include_metadata=False)
         # Saved request was jsonified
-        current_request_info_json = json.loads(json.dumps(current_request_info))
+        current_request_info_json = json_loads(json_dumps(current_request_info))
 
         if cached_request_info != current_request_info_json:
             raise HashedNameCollisionException(
@@ -20,6 +20,7 @@ from ..constants import MimeType, RequestType
 from ..decoding import decode_data
 from ..exceptions import SHRuntimeWarning
 from ..io_utils import read_data, write_data
+from ..json_utils import json_dumps
 from ..types import JsonDict
 
 
@@ -229,7 +230,7 @@ class DownloadResponse:
                 "elapsed": self.elapsed,
             },
         }
-        write_data(request_path, info, data_format=MimeType.JSON)
+        write_data(request_path, json_dumps(info), data_format=MimeType.RAW)
 
     @property
     def response_type(self) -> MimeType:
@@ -6,11 +6,11 @@ from __future__ import annotations
 
 import concurrent.futures
 import copy
-import json
 import logging
 from typing import Any
 
 from ..exceptions import DownloadFailedException
+from ..json_utils import json_dumps
 from ..types import JsonDict
 from .models import DownloadRequest, DownloadResponse
 from .sentinelhub_client import SentinelHubDownloadClient
@@ -61,7 +61,7 @@ class SentinelHubStatisticalDownloadClient(SentinelHubDownloadClient):
         if n_succeeded_intervals == 0:
             return response
 
-        new_content = json.dumps(stats_response).encode("utf-8")
+        new_content = json_dumps(stats_response)
         return response.derive(content=new_content)
 
     def _download_per_interval(self, request: DownloadRequest, time_intervals: dict[int, Any]) -> dict:
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import functools
 import warnings
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 
 class BaseSentinelHubException(Exception):
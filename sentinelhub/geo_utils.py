@@ -4,37 +4,69 @@ Module for manipulation of geographical information
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Iterable, Sequence, Tuple, cast, overload
 
+import numpy as np
 from typing_extensions import deprecated
 
 from .constants import CRS
 from .exceptions import SHDeprecationWarning
 
 if TYPE_CHECKING:
-    from .geometry import BBox
+    from .geometry import BBox, BBoxArray
 
 ERR = 0.1
 
 
-def bbox_to_dimensions(bbox: BBox, resolution: float | tuple[float, float]) -> tuple[int, int]:
+@overload
+def bbox_to_dimensions(bbox: BBox, resolution: float | tuple[float, float]) -> tuple[int, int]: ...
+
+
+@overload
+def bbox_to_dimensions(bbox: BBoxArray, resolution: float | tuple[float, float]) -> np.ndarray: ...
+
+
+def bbox_to_dimensions(bbox: BBox | BBoxArray, resolution: float | tuple[float, float]) -> tuple[int, int] | np.ndarray:
     """Calculates width and height in pixels for a given bbox of a given pixel resolution (in meters). The result is
     rounded to the nearest integers.
 
-    :param bbox: bounding box
+    :param bbox: bounding box or a collection of bounding boxes
     :param resolution: Resolution of desired image in meters. It can be a single number or a tuple of two numbers -
         resolution in horizontal and resolution in vertical direction.
-    :return: width and height in pixels for given bounding box and pixel resolution
+    :return: width and height in pixels for given bounding box and pixel resolution. For a collection of bounding boxes
+        an integer array of shape `(n, 2)` is returned.
     """
-    utm_bbox = to_utm_bbox(bbox)
+    resx, resy = resolution if isinstance(resolution, tuple) else (resolution, resolution)
+
+    if _is_bbox_array(bbox):
+        utm_bbox_array = to_utm_bbox(cast("BBoxArray", bbox))
+        widths = np.round(np.abs(utm_bbox_array.max_x - utm_bbox_array.min_x) / resx)
+        heights = np.round(np.abs(utm_bbox_array.max_y - utm_bbox_array.min_y) / resy)
+        return np.column_stack((widths, heights)).astype(np.int64)
+
+    utm_bbox = to_utm_bbox(cast("BBox", bbox))
     east1, north1 = utm_bbox.lower_left
     east2, north2 = utm_bbox.upper_right
 
-    resx, resy = resolution if isinstance(resolution, tuple) else (resolution, resolution)
-
     return round(abs(east2 - east1) / resx), round(abs(north2 - north1) / resy)
 
 
+def bbox_to_dimensions_many(bboxes: Iterable[BBox] | BBoxArray, resolution: float | tuple[float, float]) -> np.ndarray:
+    """Calculates widths and heights in pixels for multiple bounding boxes of a given pixel resolution (in meters).
+    Bounding boxes are transformed into UTM zones in batches, therefore this is much faster than calling
+    `bbox_to_dimensions` for each bounding box separately.
+
+    :param bboxes: An iterable of bounding boxes or a collection of bounding boxes
+    :param resolution: Resolution of desired image in meters. It can be a single number or a tuple of two numbers -
+        resolution in horizontal and resolution in vertical direction.
+    :return: An integer array of shape `(n, 2)` with widths and heights in pixels
+    """
+    from .geometry import BBoxArray  # pylint: disable=import-outside-toplevel
+
+    bbox_array = bboxes if isinstance(bboxes, BBoxArray) else BBoxArray.from_bboxes(bboxes, crs=CRS.WGS84)
+    return bbox_to_dimensions(bbox_array, resolution)
+
+
 def bbox_to_resolution(bbox: BBox, width: int, height: int, meters: bool = True) -> tuple[float, float]:
     """Calculates pixel resolution for a given bbox of a given width and height. By default, it returns result in
     meters.
@@ -72,12 +104,25 @@ def get_image_dimension(bbox: BBox, width: int | None = None, height: int | None
     raise ValueError("At least one of the parameters `width` and `height` must be given.")
 
 
-def to_utm_bbox(bbox: BBox) -> BBox:
+@overload
+def to_utm_bbox(bbox: BBox) -> BBox: ...
+
+
+@overload
+def to_utm_bbox(bbox: BBoxArray) -> BBoxArray: ...
+
+
+def to_utm_bbox(bbox: BBox | BBoxArray) -> BBox | BBoxArray:
     """Transform bbox into UTM CRS
 
-    :param bbox: bounding box
+    :param bbox: bounding box or a collection of bounding boxes. Each bounding box of a collection is transformed into
+        the UTM CRS of its own middle point.
     :return: bounding box in UTM CRS
     """
+    if _is_bbox_array(bbox):
+        return _to_utm_bbox_array(cast("BBoxArray", bbox))
+
+    bbox = cast("BBox", bbox)
     if CRS.is_utm(bbox.crs):
         return bbox
     lng, lat = bbox.middle
@@ -85,6 +130,28 @@ def to_utm_bbox(bbox: BBox) -> BBox:
     return bbox.transform(utm_crs)
 
 
+def _to_utm_bbox_array(bbox_array: BBoxArray) -> BBoxArray:
+    """Transforms each bounding box of a collection into the UTM CRS of its middle point."""
+    epsg_codes = bbox_array.epsg_codes
+    utm_codes = [epsg_code for epsg_code in np.unique(epsg_codes) if CRS(int(epsg_code)).is_utm()]
+    non_utm_mask = ~np.isin(epsg_codes, utm_codes)
+
+    target_codes = epsg_codes.copy()
+    if np.any(non_utm_mask):
+        middle = bbox_array.middle[non_utm_mask]
+        target_codes[non_utm_mask] = get_utm_crs_array(middle[:, 0], middle[:, 1], epsg_codes[non_utm_mask])
+
+    return bbox_array.transform(target_codes)
+
+
+def _is_bbox_array(bbox: object) -> bool:
+    """Checks if an object is a collection of bounding boxes. The `geometry` module depends on this module, therefore
+    the class is imported only when needed."""
+    from .geometry import BBoxArray  # pylint: disable=import-outside-toplevel
+
+    return isinstance(bbox, BBoxArray)
+
+
 @deprecated("The function `get_utm_bbox` has been deprecated.", category=SHDeprecationWarning)
 def get_utm_bbox(img_bbox: Sequence[float], transform: Sequence[float]) -> list[float]:
     """Get UTM coordinates given a bounding box in pixels and a transform
@@ -192,6 +259,23 @@ def get_utm_crs(lng: float, lat: float, source_crs: CRS = CRS.WGS84) -> CRS:
     return CRS.get_utm_from_wgs84(lng, lat)
 
 
+def get_utm_crs_array(
+    lngs: Sequence[float] | np.ndarray,
+    lats: Sequence[float] | np.ndarray,
+    source_crs: CRS | Sequence[CRS] | np.ndarray = CRS.WGS84,
+) -> np.ndarray:
+    """Vectorised version of `get_utm_crs`. It uses the same UTM zone definition, including exceptions for Norway and
+    Svalbard.
+
+    :param lngs: An array of longitudes, or x coordinates in case of a different source CRS
+    :param lats: An array of latitudes, or y coordinates in case of a different source CRS
+    :param source_crs: Either a common source CRS or a sequence of source CRS, one for each point
+    :return: An integer array of EPSG codes of UTM zones containing the points
+    """
+    lngs, lats = transform_points(lngs, lats, source_crs, CRS.WGS84)
+    return CRS.get_utm_epsg_codes_from_wgs84(lngs, lats)
+
+
 def transform_point(
     point: tuple[float, float], source_crs: CRS, target_crs: CRS, always_xy: bool = True
 ) -> tuple[float, float]:
@@ -208,3 +292,73 @@ def transform_point(
         return point
     transform_function = CRS.get_transform_function(source_crs, target_crs, always_xy=always_xy)
     return cast(Tuple[float, float], transform_function(*point))
+
+
+def transform_points(
+    xs: Sequence[float] | np.ndarray,
+    ys: Sequence[float] | np.ndarray,
+    source_crs: CRS | Sequence[CRS] | np.ndarray,
+    target_crs: CRS | Sequence[CRS] | np.ndarray,
+    always_xy: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised version of `transform_point`. Points are grouped by pairs of source and target CRS and each group is
+    transformed with a single call of a `pyproj` transformer.
+
+    :param xs: An array of x coordinates
+    :param ys: An array of y coordinates of the same shape
+    :param source_crs: Either a common source CRS or a sequence of source CRS, one for each point. An integer array of
+        EPSG codes can also be given.
+    :param target_crs: Either a common target CRS or a sequence of target CRS, one for each point.
+    :param always_xy: Parameter that is passed to `pyproj.Transformer` object and defines axis order for
+        transformation. The default value `True` is in most cases the correct one.
+    :return: Arrays of transformed x and y coordinates
+    """
+    xs, ys = np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)
+    if xs.shape != ys.shape:
+        raise ValueError(f"Arrays of coordinates must have the same shape, got {xs.shape} and {ys.shape}")
+    shape = xs.shape
+    xs, ys = xs.ravel(), ys.ravel()
+
+    common_source_crs, source_codes = parse_crs_array(source_crs, xs.size)
+    common_target_crs, target_codes = parse_crs_array(target_crs, xs.size)
+
+    if common_source_crs and common_target_crs:
+        crs_groups = [(common_source_crs.epsg, common_target_crs.epsg)]
+    else:
+        crs_groups = np.unique(np.column_stack((source_codes, target_codes)), axis=0).tolist()
+
+    for source_code, target_code in crs_groups:
+        if source_code == target_code:
+            continue
+        transform_function = CRS.get_transform_function(CRS(source_code), CRS(target_code), always_xy=always_xy)
+
+        mask: slice | np.ndarray = slice(None)
+        if not (common_source_crs and common_target_crs):
+            mask = (source_codes == source_code) & (target_codes == target_code)
+        xs[mask], ys[mask] = transform_function(xs[mask], ys[mask])
+
+    return xs.reshape(shape), ys.reshape(shape)
+
+
+def parse_crs_array(crs: CRS | Sequence[CRS] | np.ndarray, size: int) -> tuple[CRS | None, np.ndarray]:
+    """Parses a parameter describing either a common CRS or one CRS for each item of an array.
+
+    :param crs: A single CRS, a sequence of CRS or an integer array of EPSG codes
+    :param size: The number of items
+    :return: A common CRS of all items, or `None` if there isn't one, and an integer array of EPSG codes of all items
+    """
+    if isinstance(crs, np.ndarray) and np.issubdtype(crs.dtype, np.integer):
+        epsg_codes = crs.astype(np.int64).ravel()
+        for epsg_code in np.unique(epsg_codes):
+            CRS(int(epsg_code))
+    elif isinstance(crs, (list, tuple, np.ndarray)):
+        epsg_codes = np.array([CRS(item).epsg for item in crs], dtype=np.int64)
+    else:
+        common_crs = CRS(crs)
+        return common_crs, np.full(size, common_crs.epsg, dtype=np.int64)
+
+    if len(epsg_codes) != size:
+        raise ValueError(f"Expected {size} coordinate reference systems, got {len(epsg_codes)}")
+    if size and np.all(epsg_codes == epsg_codes[0]):
+        return CRS(int(epsg_codes[0])), epsg_codes
+    return None, epsg_codes
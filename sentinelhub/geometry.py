@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import warnings
 from abc import ABCMeta, abstractmethod
 from math import ceil
-from typing import Callable, Dict, Iterator, Tuple, TypeVar, Union
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Tuple, TypeVar, Union, overload
 
+import numpy as np
+import shapely
 import shapely.geometry
 import shapely.geometry.base
-import shapely.ops
 import shapely.wkt
 from shapely.errors import GeometryTypeError
 from shapely.geometry import MultiPolygon, Polygon
@@ -18,9 +20,10 @@ from typing_extensions import TypeAlias
 
 from .constants import CRS
 from .exceptions import SHDeprecationWarning
-from .geo_utils import transform_point
+from .geo_utils import parse_crs_array, transform_point, transform_points
 
 Self = TypeVar("Self", bound="_BaseGeometry")
+GeometryType = TypeVar("GeometryType", Polygon, MultiPolygon, np.ndarray)
 BBoxInputType: TypeAlias = Union[
     Tuple[float, float, float, float], Tuple[Tuple[float, float], Tuple[float, float]], Dict[str, float]
 ]
@@ -395,12 +398,7 @@ class BBox(_BaseGeometry):
         :param size_y: Physical dimension of BBox along northing coordinate
         :return: Two-dimensional list of smaller bounding boxes. Their location is
         """
-        if (num_x is not None and num_y is not None) and (size_x is None and size_y is None):
-            size_x, size_y = (self.max_x - self.min_x) / num_x, (self.max_y - self.min_y) / num_y
-        elif (size_x is not None and size_y is not None) and (num_x is None and num_y is None):
-            num_x, num_y = ceil((self.max_x - self.min_x) / size_x), ceil((self.max_y - self.min_y) / size_y)
-        else:
-            raise ValueError("Not supported partition. Either (num_x, num_y) or (size_x, size_y) must be specified")
+        num_x, num_y, size_x, size_y = _get_partition_params(self, num_x, num_y, size_x, size_y)
 
         return [
             [
@@ -439,6 +437,306 @@ class BBox(_BaseGeometry):
         raise TypeError(f"Resolution should be a float, got resolution of type {type(res)}")
 
 
+def _get_partition_params(
+    bbox: BBox,
+    num_x: int | None = None,
+    num_y: int | None = None,
+    size_x: float | None = None,
+    size_y: float | None = None,
+) -> tuple[int, int, float, float]:
+    """Calculates the number and the size of parts in both directions from the parameters of `BBox.get_partition`."""
+    if (num_x is not None and num_y is not None) and (size_x is None and size_y is None):
+        return num_x, num_y, (bbox.max_x - bbox.min_x) / num_x, (bbox.max_y - bbox.min_y) / num_y
+    if (size_x is not None and size_y is not None) and (num_x is None and num_y is None):
+        return ceil((bbox.max_x - bbox.min_x) / size_x), ceil((bbox.max_y - bbox.min_y) / size_y), size_x, size_y
+    raise ValueError("Not supported partition. Either (num_x, num_y) or (size_x, size_y) must be specified")
+
+
+class BBoxArray:
+    """A collection of bounding boxes stored in a single `numpy` array of shape `(n, 4)`.
+
+    Each row of the array is of the form `(min_x, min_y, max_x, max_y)`. All bounding boxes in the collection can
+    either share a single CRS or each of them can have its own CRS. Operations are vectorised over the entire
+    collection and `BBox` objects are created only when items of the collection are accessed.
+    """
+
+    def __init__(self, bounds: Iterable[Sequence[float]] | np.ndarray, crs: CRS | Sequence[CRS] | np.ndarray):
+        """
+        :param bounds: An array-like object of shape `(n, 4)` with rows `(min_x, min_y, max_x, max_y)`. Coordinates
+            in each row are ordered in the same way as in `BBox`.
+        :param crs: Either a single coordinate reference system of all bounding boxes or a sequence of `n` coordinate
+            reference systems, one for each bounding box. Instead of a sequence, an integer array of EPSG codes can also
+            be given.
+        """
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        self.bounds = np.column_stack(
+            (
+                np.minimum(bounds[:, 0], bounds[:, 2]),
+                np.minimum(bounds[:, 1], bounds[:, 3]),
+                np.maximum(bounds[:, 0], bounds[:, 2]),
+                np.maximum(bounds[:, 1], bounds[:, 3]),
+            )
+        )
+        self._crs, self._epsg_codes = parse_crs_array(crs, len(self.bounds))
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Iterable[BBox], crs: CRS | None = None) -> BBoxArray:
+        """Collects bounding boxes into a new collection.
+
+        :param bboxes: An iterable of bounding boxes
+        :param crs: A CRS of the collection in case there are no bounding boxes in the iterable.
+        :return: A collection of bounding boxes
+        """
+        bbox_list = list(bboxes)
+        if not bbox_list:
+            if crs is None:
+                raise ValueError("A CRS has to be provided in order to create an empty collection of bounding boxes")
+            return cls(np.zeros((0, 4)), crs)
+        return cls([tuple(bbox) for bbox in bbox_list], [bbox.crs for bbox in bbox_list])
+
+    @classmethod
+    def from_partition(
+        cls,
+        bbox: BBox,
+        num_x: int | None = None,
+        num_y: int | None = None,
+        size_x: float | None = None,
+        size_y: float | None = None,
+        *,
+        column_range: range | None = None,
+    ) -> BBoxArray:
+        """Partitions a bounding box in the same way as `BBox.get_partition` but without creating `BBox` objects.
+
+        :param bbox: A bounding box to partition
+        :param num_x: Number of parts BBox will be horizontally divided into.
+        :param num_y: Number of parts BBox will be vertically divided into.
+        :param size_x: Physical dimension of BBox along easting coordinate
+        :param size_y: Physical dimension of BBox along northing coordinate
+        :param column_range: If given, only parts in this range of horizontal indices are created. This way a large
+            partition can be created in multiple pieces.
+        :return: A collection of `num_x * num_y` bounding boxes. A part with horizontal index `i` and vertical index `j`
+            is at the position `i * num_y + j`, counted from the start of `column_range`.
+        """
+        columns, rows, part_size_x, part_size_y = _get_partition_params(bbox, num_x, num_y, size_x, size_y)
+        if column_range is None:
+            column_range = range(columns)
+        column_indices = np.arange(columns)[column_range.start : column_range.stop : column_range.step]
+        index_x, index_y = np.repeat(column_indices, rows), np.tile(np.arange(rows), len(column_indices))
+
+        bounds = np.column_stack(
+            (
+                bbox.min_x + index_x * part_size_x,
+                bbox.min_y + index_y * part_size_y,
+                bbox.min_x + (index_x + 1) * part_size_x,
+                bbox.min_y + (index_y + 1) * part_size_y,
+            )
+        )
+        return cls(bounds, bbox.crs)
+
+    @classmethod
+    def concatenate(cls, bbox_arrays: Iterable[BBoxArray], crs: CRS | None = None) -> BBoxArray:
+        """Joins multiple collections of bounding boxes into one.
+
+        :param bbox_arrays: Collections of bounding boxes
+        :param crs: A CRS of the collection in case there are no collections to join.
+        :return: A collection of bounding boxes
+        """
+        bbox_arrays = list(bbox_arrays)
+        if not bbox_arrays:
+            if crs is None:
+                raise ValueError("A CRS has to be provided in order to create an empty collection of bounding boxes")
+            return cls(np.zeros((0, 4)), crs)
+
+        bounds = np.concatenate([bbox_array.bounds for bbox_array in bbox_arrays])
+        epsg_codes = np.concatenate([bbox_array.epsg_codes for bbox_array in bbox_arrays])
+        return cls(bounds, epsg_codes)
+
+    def __len__(self) -> int:
+        """Number of bounding boxes in the collection"""
+        return len(self.bounds)
+
+    @overload
+    def __getitem__(self, index: int) -> BBox: ...
+
+    @overload
+    def __getitem__(self, index: slice | Sequence[int] | np.ndarray) -> BBoxArray: ...
+
+    def __getitem__(self, index: int | slice | Sequence[int] | np.ndarray) -> BBox | BBoxArray:
+        """Provides a single bounding box for an integer index and a sub-collection for slices, index arrays and
+        boolean masks."""
+        if isinstance(index, (int, np.integer)):
+            crs = self._crs or CRS(int(self._epsg_codes[index]))
+            return BBox(tuple(self.bounds[index]), crs=crs)
+        return BBoxArray(self.bounds[index], self._crs or self._epsg_codes[index])
+
+    def __iter__(self) -> Iterator[BBox]:
+        """Lazily iterates over bounding boxes in the collection"""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Class representation"""
+        crs_repr = repr(self._crs) if self._crs else "multiple CRS"
+        return f"{self.__class__.__name__}({len(self)} bounding boxes, {crs_repr})"
+
+    def __eq__(self, other: object) -> bool:
+        """Collections are equal if they have the same coordinates and the same CRS of all bounding boxes."""
+        if isinstance(other, BBoxArray):
+            return np.array_equal(self.bounds, other.bounds) and np.array_equal(self._epsg_codes, other.epsg_codes)
+        return False
+
+    @property
+    def crs(self) -> CRS:
+        """Returns the common coordinate reference system of all bounding boxes in the collection
+
+        :return: Coordinate reference system Enum
+        :raises: ValueError if bounding boxes have different CRS
+        """
+        if self._crs is None:
+            raise ValueError("Bounding boxes in the collection don't have a common CRS, check `epsg_codes` instead.")
+        return self._crs
+
+    @property
+    def epsg_codes(self) -> np.ndarray:
+        """Returns an array of EPSG codes of coordinate reference systems of bounding boxes"""
+        return self._epsg_codes
+
+    @property
+    def min_x(self) -> np.ndarray:
+        """An array of minimal x coordinates"""
+        return self.bounds[:, 0]
+
+    @property
+    def min_y(self) -> np.ndarray:
+        """An array of minimal y coordinates"""
+        return self.bounds[:, 1]
+
+    @property
+    def max_x(self) -> np.ndarray:
+        """An array of maximal x coordinates"""
+        return self.bounds[:, 2]
+
+    @property
+    def max_y(self) -> np.ndarray:
+        """An array of maximal y coordinates"""
+        return self.bounds[:, 3]
+
+    @property
+    def middle(self) -> np.ndarray:
+        """Returns middle points of bounding boxes
+
+        :return: An array of shape `(n, 2)`
+        """
+        return np.column_stack(((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2))
+
+    @property
+    def geometries(self) -> np.ndarray:
+        """Returns polygons of bounding boxes in the same form as `BBox.geometry`
+
+        :return: An array of shapely polygons
+        """
+        return shapely.box(self.min_x, self.min_y, self.max_x, self.max_y, ccw=False)
+
+    def to_list(self) -> list[BBox]:
+        """Creates `BBox` objects from all bounding boxes in the collection
+
+        :return: A list of bounding boxes
+        """
+        return list(self)
+
+    def reverse(self) -> BBoxArray:
+        """Returns a new collection where x and y coordinates are switched"""
+        return BBoxArray(self.bounds[:, [1, 0, 3, 2]], self._crs or self._epsg_codes)
+
+    def transform(self, crs: CRS | Sequence[CRS] | np.ndarray, always_xy: bool = True) -> BBoxArray:
+        """Transforms bounding boxes in the same way as `BBox.transform`. Points are transformed in batches, one for
+        each pair of source and target CRS.
+
+        :param crs: Target CRS, either a common one or one for each bounding box, given in the same way as in the
+            constructor.
+        :param always_xy: Parameter that is passed to `pyproj.Transformer` object and defines axis order for
+            transformation. The default value `True` is in most cases the correct one.
+        :return: A collection of bounding boxes in target CRS
+        """
+        target_crs, target_codes = parse_crs_array(crs, len(self))
+
+        corner_xs, corner_ys = transform_points(
+            np.concatenate((self.min_x, self.max_x)),
+            np.concatenate((self.min_y, self.max_y)),
+            self._crs or np.tile(self._epsg_codes, 2),
+            target_crs or np.tile(target_codes, 2),
+            always_xy=always_xy,
+        )
+        min_xs, max_xs = np.split(corner_xs, 2)
+        min_ys, max_ys = np.split(corner_ys, 2)
+
+        return BBoxArray(np.column_stack((min_xs, min_ys, max_xs, max_ys)), target_crs or target_codes)
+
+    def buffer(self, buffer: float | tuple[float, float], *, relative: bool = True) -> BBoxArray:
+        """Changes sizes of all bounding boxes in the same way as `BBox.buffer`.
+
+        :param buffer: A single number or a tuple of 2 numbers, one for buffer in horizontal direction and one for
+            buffer in vertical direction.
+        :param relative: If `True` the buffer is relative to sizes of bounding boxes, otherwise it is absolute.
+        :return: A new collection of buffered bounding boxes
+        """
+        if isinstance(buffer, tuple):
+            buffer_x, buffer_y = buffer
+        elif isinstance(buffer, (int, float)):
+            buffer_x, buffer_y = buffer, buffer
+        else:
+            raise ValueError(f"Buffer should be a number or a tuple of 2 numbers, got {type(buffer)}")
+
+        size_x, size_y = self.max_x - self.min_x, self.max_y - self.min_y
+        buffers_x, buffers_y = np.full(len(self), float(buffer_x)), np.full(len(self), float(buffer_y))
+
+        if relative:
+            buffers_x = buffers_x * size_x / 2
+            buffers_y = buffers_y * size_y / 2
+
+        for absolute_buffers, sizes, direction in [(buffers_x, size_x, "horizontal"), (buffers_y, size_y, "vertical")]:
+            if np.any(2 * absolute_buffers + sizes <= 0):
+                raise ValueError(
+                    f"Negative buffer is too large, cannot reduce the bounding box to nothing in {direction} direction"
+                )
+
+        bounds = np.column_stack(
+            (self.min_x - buffers_x, self.min_y - buffers_y, self.max_x + buffers_x, self.max_y + buffers_y)
+        )
+        return BBoxArray(bounds, self._crs or self._epsg_codes)
+
+    def get_transform_vector(self, resx: float, resy: float) -> np.ndarray:
+        """Given resolution it returns transformation vectors of all bounding boxes
+
+        :param resx: Resolution in x direction
+        :param resy: Resolution in y direction
+        :return: An array of shape `(n, 6)` where each row is a transformation vector, as in `BBox.get_transform_vector`
+        """
+        resx, resy = BBox._parse_resolution(resx), BBox._parse_resolution(resy)  # noqa: SLF001
+        zeros = np.zeros(len(self))
+        return np.column_stack(
+            (self.min_x, np.full(len(self), resx), zeros, self.max_y, zeros, np.full(len(self), -resy))
+        )
+
+    def intersects(self, geometry: _BaseGeometry | shapely.geometry.base.BaseGeometry) -> np.ndarray:
+        """Checks which bounding boxes intersect the given geometry.
+
+        :param geometry: A geometry object. If it is a shapely geometry it is assumed that it is in the same CRS as all
+            bounding boxes. Otherwise, bounding boxes are first transformed into the CRS of the geometry. Tests are
+            made with a prepared geometry. A given shapely geometry is not modified. If it isn't prepared yet, a
+            prepared copy of it is used. To avoid copying, prepare it beforehand with `shapely.prepare`.
+        :return: A boolean array
+        """
+        bbox_array = self
+        if isinstance(geometry, _BaseGeometry):
+            bbox_array = self.transform(geometry.crs)
+            geometry = geometry.geometry
+        if not shapely.is_prepared(geometry):
+            geometry = copy.copy(geometry)
+            shapely.prepare(geometry)
+        return shapely.intersects(geometry, bbox_array.geometries)
+
+
 class Geometry(_BaseGeometry):
     """A class that combines shapely geometry with coordinate reference system. It currently supports polygons and
     multipolygons.
@@ -477,7 +775,7 @@ class Geometry(_BaseGeometry):
 
         :return: New Geometry object with switched coordinates
         """
-        return Geometry(shapely.ops.transform(lambda x, y: (y, x), self.geometry), crs=self.crs)
+        return Geometry(shapely.transform(self.geometry, lambda coords: coords[:, ::-1]), crs=self.crs)
 
     def transform(self, crs: CRS, always_xy: bool = True) -> Geometry:
         """Transforms Geometry from current CRS to target CRS
@@ -492,13 +790,13 @@ class Geometry(_BaseGeometry):
         geometry = self.geometry
         if new_crs is not self.crs:
             transform_function = self.crs.get_transform_function(new_crs, always_xy=always_xy)
-            geometry = shapely.ops.transform(transform_function, geometry)
+            geometry = _transform_coordinates(geometry, transform_function)
 
         return Geometry(geometry, crs=new_crs)
 
     def apply(self, operation: Callable[[float, float], tuple[float, float]]) -> Geometry:
         """Applies a function to each pair of vertex coordinates of the geometry to create a new geometry."""
-        return Geometry(shapely.ops.transform(operation, self.geometry), crs=self.crs)
+        return Geometry(_apply_to_coordinates(self.geometry, operation), crs=self.crs)
 
     @classmethod
     def from_geojson(cls, geojson: dict, crs: CRS | None = None) -> Geometry:
@@ -541,6 +839,8 @@ class Geometry(_BaseGeometry):
         :return: Shapely polygon or multipolygon
         :raises TypeError
         """
+        if isinstance(geometry, (Polygon, MultiPolygon)):
+            return copy.copy(geometry)
         if isinstance(geometry, str):
             geometry = shapely.wkt.loads(geometry)
         else:
@@ -553,3 +853,148 @@ class Geometry(_BaseGeometry):
             raise ValueError(f"Supported geometry types are polygon and multipolygon, got {type(geometry)}")
 
         return geometry
+
+
+class GeometryArray:
+    """A collection of polygons and multipolygons in a common CRS, stored in a `numpy` array of `shapely` geometries.
+
+    Operations are applied to coordinates of all geometries at once and `Geometry` objects are created only when items
+    of the collection are accessed.
+    """
+
+    def __init__(self, geometries: Iterable[Polygon | MultiPolygon | dict | str] | np.ndarray, crs: CRS):
+        """
+        :param geometries: Polygons or multipolygons in any representation supported by `Geometry`
+        :param crs: Coordinate reference system of all geometries
+        """
+        geometry_list = [
+            geometry if isinstance(geometry, (Polygon, MultiPolygon)) else Geometry(geometry, crs).geometry
+            for geometry in geometries
+        ]
+        self.geometries = np.empty(len(geometry_list), dtype=object)
+        self.geometries[:] = geometry_list
+        self._crs = CRS(crs)
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable[Geometry], crs: CRS | None = None) -> GeometryArray:
+        """Collects `Geometry` objects into a new collection. Geometries are transformed into a common CRS.
+
+        :param geometries: An iterable of geometries
+        :param crs: A CRS of the collection. If not given, the CRS of the first geometry is used.
+        :return: A collection of geometries
+        """
+        geometry_list = list(geometries)
+        if crs is None:
+            if not geometry_list:
+                raise ValueError("A CRS has to be provided in order to create an empty collection of geometries")
+            crs = geometry_list[0].crs
+        return cls([geometry.transform(crs).geometry for geometry in geometry_list], crs)
+
+    def __len__(self) -> int:
+        """Number of geometries in the collection"""
+        return len(self.geometries)
+
+    @overload
+    def __getitem__(self, index: int) -> Geometry: ...
+
+    @overload
+    def __getitem__(self, index: slice | Sequence[int] | np.ndarray) -> GeometryArray: ...
+
+    def __getitem__(self, index: int | slice | Sequence[int] | np.ndarray) -> Geometry | GeometryArray:
+        """Provides a single geometry for an integer index and a sub-collection for slices, index arrays and boolean
+        masks."""
+        if isinstance(index, (int, np.integer)):
+            return Geometry(self.geometries[index], crs=self._crs)
+        return GeometryArray(self.geometries[index], self._crs)
+
+    def __iter__(self) -> Iterator[Geometry]:
+        """Lazily iterates over geometries in the collection"""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Class representation"""
+        return f"{self.__class__.__name__}({len(self)} geometries, crs={self._crs!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Collections are equal if they have the same CRS and equal geometries in the same order."""
+        if isinstance(other, GeometryArray):
+            return (
+                self.crs is other.crs and len(self) == len(other) and bool(np.all(self.geometries == other.geometries))
+            )
+        return False
+
+    @property
+    def crs(self) -> CRS:
+        """Returns the coordinate reference system of all geometries
+
+        :return: Coordinate reference system Enum
+        """
+        return self._crs
+
+    @property
+    def bboxes(self) -> BBoxArray:
+        """Returns bounding boxes of all geometries
+
+        :return: A collection of bounding boxes, with same CRS
+        """
+        return BBoxArray(shapely.bounds(self.geometries).reshape(-1, 4), self._crs)
+
+    def to_list(self) -> list[Geometry]:
+        """Creates `Geometry` objects from all geometries in the collection
+
+        :return: A list of geometries
+        """
+        return list(self)
+
+    def reverse(self) -> GeometryArray:
+        """Returns a new collection where x and y coordinates are switched"""
+        return GeometryArray(shapely.transform(self.geometries, lambda coords: coords[:, ::-1]), self._crs)
+
+    def transform(self, crs: CRS, always_xy: bool = True) -> GeometryArray:
+        """Transforms all geometries to target CRS with a single call of a `pyproj` transformer.
+
+        :param crs: target CRS
+        :param always_xy: Parameter that is passed to `pyproj.Transformer` object and defines axis order for
+            transformation. The default value `True` is in most cases the correct one.
+        :return: A collection of geometries in target CRS
+        """
+        new_crs = CRS(crs)
+
+        geometries = self.geometries
+        if new_crs is not self._crs:
+            transform_function = self._crs.get_transform_function(new_crs, always_xy=always_xy)
+            geometries = _transform_coordinates(geometries, transform_function)
+
+        return GeometryArray(geometries, new_crs)
+
+    def apply(self, operation: Callable[[float, float], tuple[float, float]]) -> GeometryArray:
+        """Applies a function to each pair of vertex coordinates of all geometries, in the same way as
+        `Geometry.apply`."""
+        return GeometryArray(_apply_to_coordinates(self.geometries, operation), self._crs)
+
+
+def _transform_coordinates(
+    geometry: GeometryType, transform_function: Callable[[np.ndarray, np.ndarray], tuple]
+) -> GeometryType:
+    """Transforms coordinates of a geometry or an array of geometries with a single call of a function that accepts
+    arrays of x and y coordinates. Z coordinates of 3D geometries are kept unchanged."""
+
+    def _transform(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack([*transform_function(coords[:, 0], coords[:, 1]), coords[:, 2:]])
+
+    return shapely.transform(geometry, _transform, include_z=True)
+
+
+def _apply_to_coordinates(
+    geometry: GeometryType, operation: Callable[[float, float], tuple[float, float]]
+) -> GeometryType:
+    """Applies a function of a single point to coordinates of a geometry or an array of geometries. The function is
+    called for each point separately, because it isn't guaranteed to give the same results for arrays of coordinates,
+    but all coordinates are collected and set back at once. Z coordinates of 3D geometries are kept unchanged."""
+
+    def _apply_operation(coords: np.ndarray) -> np.ndarray:
+        new_coords = np.array([operation(x, y) for x, y in coords[:, :2].tolist()], dtype=np.float64)
+        return np.column_stack([new_coords.reshape(-1, 2), coords[:, 2:]])
+
+    return shapely.transform(geometry, _apply_operation, include_z=True)
@@ -338,6 +338,7 @@ class GeopediaFeatureIterator(FeatureIterator[JsonDict]):
         offset: int = 0,
         gpd_session: GeopediaSession | None = None,
         config: SHConfig | None = None,
+        feature_storage: Literal["memory", "disk", "none"] = "memory",
     ):
         """
         :param layer: Geopedia layer which contains requested data
@@ -349,6 +350,8 @@ class GeopediaFeatureIterator(FeatureIterator[JsonDict]):
             credentials. This can be used for accessing private Geopedia layers. By default, it is set to `None` and a
             basic Geopedia session without credentials will be created.
         :param config: A custom instance of config class to override parameters from the saved configuration.
+        :param feature_storage: Where to keep features that were already obtained, either in `"memory"`, in a
+            temporary file on `"disk"` or `"none"`. Check `FeatureIterator` for more info.
         """
         self.layer = _parse_geopedia_layer(layer)
         self.config = config or SHConfig()
@@ -358,7 +361,7 @@ class GeopediaFeatureIterator(FeatureIterator[JsonDict]):
         url = f"{self.config.geopedia_rest_url}/data/v2/search/tables/{self.layer}/features"
         params = self._build_request_params(bbox, query_filter)
 
-        super().__init__(client, url, params)
+        super().__init__(client, url, params, feature_storage=feature_storage)
         self.next = f"{url}?offset={offset}&limit={self.MAX_FEATURES_PER_REQUEST}"
 
         self.layer_size: int | None = None
@@ -422,6 +425,6 @@ class GeopediaFeatureIterator(FeatureIterator[JsonDict]):
         """
         if self.layer_size is None:
             new_features = self._fetch_features()
-            self.features.extend(new_features)
+            self._add_features(new_features)
 
         return self.layer_size  # type: ignore[return-value]
@@ -5,10 +5,15 @@ Utility functions to read/write image data from/to file
 from __future__ import annotations
 
 import csv
+import functools
 import json
 import logging
 import os
-from typing import IO, Any, Callable, Literal
+import struct
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Iterable, Literal, Sequence
 from xml.etree import ElementTree
 
 import numpy as np
@@ -17,11 +22,15 @@ from PIL import Image
 
 from .constants import MimeType
 from .decoding import decode_image_with_pillow, decode_jp2_image, decode_tar, get_data_format
+from .json_utils import json_loads
 
 LOGGER = logging.getLogger(__name__)
 
 CSV_DELIMITER = ";"
 
+CHUNKED_ARRAY_MAGIC = b"SHCHUNK1"
+CHUNKED_ARRAY_CHUNK_SIZE = 2**20
+
 
 def read_data(filename: str, data_format: MimeType | None = None) -> Any:
     """Read image data from file
@@ -41,8 +50,79 @@ def read_data(filename: str, data_format: MimeType | None = None) -> Any:
     if not isinstance(data_format, MimeType):
         data_format = get_data_format(filename)
 
-    reader = _get_reader(data_format)
-
+    return _read_file(filename, _get_reader(data_format))
+
+
+def read_many(
+    filenames: Iterable[str],
+    data_format: MimeType | None = None,
+    *,
+    max_threads: int | None = None,
+    stack: bool = False,
+    mmap_mode: Literal["r", "r+", "c"] | None = None,
+) -> list[Any] | np.ndarray:
+    """Reads data from multiple files in parallel threads.
+
+    Data formats are guessed once per distinct file extension and files are opened directly, without checking their
+    existence beforehand.
+
+    :param filenames: Filenames to read data from
+    :param data_format: A format of all files. If not specified, the format of each file is guessed from its extension.
+    :param max_threads: Maximum number of threads used to read files. By default, it is decided by
+        `ThreadPoolExecutor`.
+    :param stack: If `True`, arrays read from files are stacked into a single array along a new first axis, as they
+        are read. All arrays must have the same shape.
+    :param mmap_mode: A memory-map mode with which NPY files are loaded, as in `numpy.load`. If data is not stacked,
+        memory-mapped arrays are returned. Otherwise, only the parts of files that are copied into the stacked array
+        are read.
+    :return: A list of data read from files or a stacked array
+    """
+    filenames = list(filenames)
+    readers = [
+        functools.partial(np.load, mmap_mode=mmap_mode) if file_format is MimeType.NPY else _get_reader(file_format)
+        for file_format in _get_data_formats(filenames, data_format)
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        if not stack:
+            return list(executor.map(_read_file, filenames, readers))
+
+        if not filenames:
+            raise ValueError("At least one file is required to create a stacked array")
+        first_array = np.asarray(_read_file(filenames[0], readers[0]))
+        stacked_array = np.empty((len(filenames), *first_array.shape), dtype=first_array.dtype)
+        stacked_array[0] = first_array
+
+        def read_into_stack(index: int) -> None:
+            array = np.asarray(_read_file(filenames[index], readers[index]))
+            if array.shape != first_array.shape:
+                raise ValueError(
+                    f"Data in {filenames[index]} has shape {array.shape} but data in {filenames[0]} has shape "
+                    f"{first_array.shape}, therefore they cannot be stacked"
+                )
+            np.copyto(stacked_array[index], array, casting="safe")
+
+        list(executor.map(read_into_stack, range(1, len(filenames))))
+    return stacked_array
+
+
+def _get_data_formats(filenames: list[str], data_format: MimeType | None) -> list[MimeType]:
+    """Provides formats of files, either the given one or the ones guessed once per distinct file extension"""
+    if isinstance(data_format, MimeType):
+        return [data_format] * len(filenames)
+
+    formats_by_extension: dict[str, MimeType] = {}
+    data_formats = []
+    for filename in filenames:
+        extension = filename.split(".")[-1]
+        if extension not in formats_by_extension:
+            formats_by_extension[extension] = get_data_format(filename)
+        data_formats.append(formats_by_extension[extension])
+    return data_formats
+
+
+def _read_file(filename: str, reader: Callable[[str], Any]) -> Any:
+    """Reads a file with a given reader and logs the filename in case of failure"""
     try:
         return reader(filename)
     except BaseException as exception:
@@ -61,11 +141,11 @@ def _get_reader(data_format: MimeType) -> Callable[[str], Any]:
         return decode_image_with_pillow
 
     available_readers: dict[MimeType, Callable[[str], Any]] = {
-        MimeType.TAR: _open_file_and_read(decode_tar, "rb"),  # type: ignore[arg-type]
+        MimeType.TAR: decode_tar,
         MimeType.TXT: _open_file_and_read(lambda file: file.read(), "r"),
         MimeType.RAW: _open_file_and_read(lambda file: file.read(), "rb"),
         MimeType.CSV: _read_csv,
-        MimeType.JSON: _open_file_and_read(json.load, "rb"),
+        MimeType.JSON: _open_file_and_read(lambda file: json_loads(file.read()), "rb"),
         MimeType.XML: ElementTree.parse,
         MimeType.GML: ElementTree.parse,
         MimeType.SAFE: ElementTree.parse,
@@ -97,7 +177,7 @@ def _read_csv(filename: str, delimiter: str = CSV_DELIMITER) -> list:
         return list(csv.reader(file, delimiter=delimiter))
 
 
-def write_data(  # noqa: C901
+def write_data(
     filename: str, data: Any, data_format: MimeType | None = None, compress: bool = False, add: bool = False
 ) -> None:
     """Write image data to file
@@ -118,6 +198,51 @@ def write_data(  # noqa: C901
     if not isinstance(data_format, MimeType):
         data_format = get_data_format(filename)
 
+    _write_data(filename, data, data_format, compress=compress, add=add)
+
+
+def write_many(
+    filenames: Sequence[str],
+    data: Iterable[Any],
+    data_format: MimeType | None = None,
+    *,
+    compress: bool = False,
+    max_threads: int | None = None,
+) -> None:
+    """Writes data into multiple files in parallel threads.
+
+    Parent folders are created once per distinct folder and data formats are guessed once per distinct file extension.
+
+    :param filenames: Filenames to write data to
+    :param data: Data to write into each file, e.g. a list of arrays or a stacked array, which is split along its
+        first axis
+    :param data_format: A format of all files. If not specified, the format of each file is guessed from its extension.
+    :param compress: Compress data. Default is `False`
+    :param max_threads: Maximum number of threads used to write files. By default, it is decided by
+        `ThreadPoolExecutor`.
+    """
+    data = list(data)
+    if len(data) != len(filenames):
+        raise ValueError(f"Got {len(filenames)} filenames but {len(data)} data items to write")
+
+    for folder in {os.path.dirname(filename) for filename in filenames}:
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    data_formats = _get_data_formats(list(filenames), data_format)
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        list(
+            executor.map(
+                functools.partial(_write_data, compress=compress),
+                filenames,
+                data,
+                data_formats,
+            )
+        )
+
+
+def _write_data(filename: str, data: Any, data_format: MimeType, compress: bool = False, add: bool = False) -> None:
+    """Writes data in a given format into a file in an existing folder"""
     if data_format is MimeType.TIFF:
         tiff.imwrite(filename, data, compression=("lzma" if compress else None))
 
@@ -156,3 +281,98 @@ def _create_parent_folder(filename: str) -> None:
     path = os.path.dirname(filename)
     if path != "":
         os.makedirs(path, exist_ok=True)
+
+
+def write_chunked_array(
+    filename: str,
+    array: np.ndarray,
+    *,
+    chunk_size: int = CHUNKED_ARRAY_CHUNK_SIZE,
+    compress_level: int = 1,
+    max_threads: int | None = None,
+) -> None:
+    """Writes an array into a file in a chunked and compressed format, which can be read without any image decoding.
+
+    The file starts with a magic string and a JSON header with array shape, dtype, and sizes of compressed chunks. It
+    is followed by chunks of array memory, each compressed separately with `zlib`, which allows compressing and
+    decompressing chunks in parallel threads.
+
+    :param filename: A path to a file to write the array into
+    :param array: An array of any shape and of a numerical or boolean dtype
+    :param chunk_size: A number of bytes of array memory which is compressed into a single chunk
+    :param compress_level: A `zlib` compression level, from 0 to 9. Low levels are the fastest.
+    :param max_threads: Maximum number of threads used to compress chunks. By default, it is decided by
+        `ThreadPoolExecutor`.
+    """
+    if array.dtype.hasobject:
+        raise ValueError("Arrays of objects cannot be written in a chunked format")
+
+    array_bytes = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        chunks = list(
+            executor.map(
+                functools.partial(zlib.compress, level=compress_level),
+                (array_bytes[start : start + chunk_size] for start in range(0, array_bytes.size, chunk_size)),
+            )
+        )
+    header = json.dumps(
+        {"dtype": array.dtype.str, "shape": array.shape, "chunk_size": chunk_size, "chunks": [len(c) for c in chunks]}
+    ).encode()
+
+    _create_parent_folder(filename)
+    # The array is written into a temporary file which then replaces the target, so that a crash cannot leave behind
+    # an incomplete file
+    file_descriptor, temporary_filename = tempfile.mkstemp(dir=os.path.dirname(filename) or None, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(CHUNKED_ARRAY_MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temporary_filename, filename)
+    except BaseException:
+        os.remove(temporary_filename)
+        raise
+
+
+def read_chunked_array(filename: str, max_threads: int | None = None) -> np.ndarray:
+    """Reads an array from a file written by `write_chunked_array`. Chunks are decompressed in parallel threads and
+    written directly into memory of the output array.
+
+    :param filename: A path to a file with a chunked array
+    :param max_threads: Maximum number of threads used to decompress chunks. By default, it is decided by
+        `ThreadPoolExecutor`.
+    :return: The array
+    :raises: ValueError if the file does not contain a complete chunked array
+    """
+    try:
+        return _read_chunked_array(filename, max_threads)
+    except (struct.error, zlib.error, KeyError, TypeError) as exception:
+        raise ValueError(f"File {filename} with a chunked array is corrupted") from exception
+
+
+def _read_chunked_array(filename: str, max_threads: int | None) -> np.ndarray:
+    """Reads an array from a chunked file, see `read_chunked_array`."""
+    with open(filename, "rb") as file:
+        if file.read(len(CHUNKED_ARRAY_MAGIC)) != CHUNKED_ARRAY_MAGIC:
+            raise ValueError(f"File {filename} does not contain a chunked array")
+        (header_length,) = struct.unpack("<I", file.read(4))
+        header = json.loads(file.read(header_length))
+        compressed_chunks = [file.read(compressed_size) for compressed_size in header["chunks"]]
+
+    array = np.empty(header["shape"], dtype=np.dtype(header["dtype"]))
+    array_bytes = array.reshape(-1).view(np.uint8)
+    chunk_size = header["chunk_size"]
+    if len(compressed_chunks) != -(-array_bytes.size // chunk_size) or any(
+        len(chunk) != compressed_size for chunk, compressed_size in zip(compressed_chunks, header["chunks"])
+    ):
+        raise ValueError(f"File {filename} with a chunked array is incomplete")
+
+    def decompress_chunk(index: int) -> None:
+        chunk = zlib.decompress(compressed_chunks[index])
+        array_bytes[index * chunk_size : index * chunk_size + len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        list(executor.map(decompress_chunk, range(len(compressed_chunks))))
+    return array
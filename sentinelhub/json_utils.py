@@ -0,0 +1,145 @@
+"""
+Module implementing a pluggable JSON backend, used for decoding service responses and for writing and reading cached
+JSON data
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Literal
+
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+_AUTO_BACKEND_ORDER: tuple[JsonBackend, ...] = ("orjson", "msgspec", "json")
+
+
+def _get_orjson_functions() -> tuple[Callable[[bytes | str], Any], Callable[[Any, bool], bytes]]:
+    """Provides JSON functions implemented with `orjson` package"""
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    def dumps(data: Any, sort_keys: bool) -> bytes:
+        options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, option=options)
+
+    return orjson.loads, dumps
+
+
+def _get_msgspec_functions() -> tuple[Callable[[bytes | str], Any], Callable[[Any, bool], bytes]]:
+    """Provides JSON functions implemented with `msgspec` package"""
+    import msgspec  # pylint: disable=import-outside-toplevel
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as exception:
+            raise ValueError(str(exception)) from exception
+
+    def dumps(data: Any, sort_keys: bool) -> bytes:
+        try:
+            return msgspec.json.encode(data, order="sorted" if sort_keys else None)
+        except msgspec.EncodeError as exception:
+            raise TypeError(str(exception)) from exception
+
+    return loads, dumps
+
+
+def _stdlib_dumps(data: Any, sort_keys: bool) -> bytes:
+    """Encodes data with the standard `json` package into the same compact form as the other backends"""
+    return json.dumps(data, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _get_stdlib_functions() -> tuple[Callable[[bytes | str], Any], Callable[[Any, bool], bytes]]:
+    """Provides JSON functions implemented with the standard `json` package"""
+    return json.loads, _stdlib_dumps
+
+
+_BACKEND_FUNCTIONS = {
+    "orjson": _get_orjson_functions,
+    "msgspec": _get_msgspec_functions,
+    "json": _get_stdlib_functions,
+}
+
+_backend: JsonBackend = "json"
+_loads, _dumps = _get_stdlib_functions()
+
+
+def set_json_backend(backend: JsonBackend | None = None) -> None:
+    """Sets a package used for encoding and decoding JSON data.
+
+    :param backend: One of `"orjson"`, `"msgspec"`, or `"json"` (the standard library). If not given, the first one of
+        them which is installed is used.
+    """
+    global _backend, _loads, _dumps  # pylint: disable=global-statement
+
+    if backend is not None and backend not in _BACKEND_FUNCTIONS:
+        raise ValueError(f"Unsupported JSON backend {backend}, choose one of {list(_BACKEND_FUNCTIONS)}")
+
+    for candidate in (backend,) if backend else _AUTO_BACKEND_ORDER:
+        try:
+            _loads, _dumps = _BACKEND_FUNCTIONS[candidate]()
+        except ImportError as exception:
+            if backend:
+                raise ImportError(f"Package `{backend}` is required to use it as a JSON backend.") from exception
+            continue
+        _backend = candidate
+        return
+
+
+def get_json_backend() -> JsonBackend:
+    """Provides a name of a package currently used for encoding and decoding JSON data."""
+    return _backend
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decodes JSON data with the current backend.
+
+    Data which the backend refuses to decode, e.g. non-standard `NaN` values, is decoded with the standard library.
+
+    :param data: Encoded JSON data
+    :return: Decoded data
+    """
+    try:
+        return _loads(data)
+    except ValueError:
+        if _backend == "json":
+            raise
+        return json.loads(data)
+
+
+def json_dumps(data: Any, *, sort_keys: bool = False) -> bytes:
+    """Encodes data into compact JSON with the current backend.
+
+    Data which the backend refuses to encode, e.g. integers larger than 64 bits, is encoded with the standard library.
+    The same holds for data with non-finite float values, which `orjson` and `msgspec` backends would encode as
+    `null`, while the standard library encodes them as `NaN`, `Infinity`, and `-Infinity`.
+
+    :param data: Data to encode
+    :param sort_keys: Whether keys of dictionaries should be sorted
+    :return: UTF-8 encoded JSON
+    """
+    if _backend == "json":
+        return _dumps(data, sort_keys)
+
+    try:
+        encoded_data = _dumps(data, sort_keys)
+    except TypeError:
+        return _stdlib_dumps(data, sort_keys)
+
+    if b"null" in encoded_data and _contains_non_finite_float(data):
+        return _stdlib_dumps(data, sort_keys)
+    return encoded_data
+
+
+def _contains_non_finite_float(data: Any) -> bool:
+    """Checks if data contains any NaN or infinite float values"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_contains_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_contains_non_finite_float(value) for value in data)
+    return False
+
+
+set_json_backend()
@@ -10,6 +10,8 @@ from functools import partial
 import dateutil.tz
 import numpy as np
 import pytest
+import shapely
+from pytest_mock import MockerFixture
 
 from sentinelhub import CRS, BBox, DataCollection, Geometry, SentinelHubCatalog, SHConfig, parse_time
 from sentinelhub.api.catalog import CatalogSearchIterator, get_available_timestamps
@@ -143,6 +145,94 @@ def test_search_geometry_and_iterator_methods(catalog: SentinelHubCatalog) -> No
     assert geometries[0].geometry.intersects(search_geometry.geometry)
 
 
+def test_search_prefetch(catalog: SentinelHubCatalog) -> None:
+    """Tests that prefetching of the next pages doesn't change search results"""
+    search_params = dict(collection=DataCollection.SENTINEL2_L1C, time=("2021-01-01", "2021-01-31"), bbox=TEST_BBOX)
+
+    search_iterator = catalog.search(**search_params, limit=3, prefetch=True)
+    results = list(search_iterator)
+
+    assert len(results) > 3
+    assert search_iterator.get_ids() == catalog.search(**search_params).get_ids()
+
+
+def test_search_prefetch_requests(catalog: SentinelHubCatalog, mocker: MockerFixture) -> None:
+    """Tests that a prefetching iterator requests each page exactly once and in the right order"""
+    pages = [
+        {"features": [{"id": f"{page}-{index}"} for index in range(2)], "context": {"next": page + 1}}
+        for page in range(3)
+    ]
+    pages[-1]["context"] = {}
+    request_mock = mocker.patch.object(catalog.client, "get_json_dict", side_effect=pages)
+
+    search_iterator = catalog.search(collection=DataCollection.SENTINEL2_L1C, prefetch=True)
+    assert next(search_iterator) == {"id": "0-0"}
+    assert [feature["id"] for feature in search_iterator] == [
+        f"{page}-{index}" for page in range(3) for index in range(2)
+    ]
+
+    assert [call.kwargs["post_values"].get("next") for call in request_mock.call_args_list] == [None, 1, 2]
+
+
+def test_search_parallel(catalog: SentinelHubCatalog) -> None:
+    """Tests that a search split over time windows and parts of a bounding box gives the same unique results"""
+    search_params = dict(collection=DataCollection.SENTINEL2_L1C, time=("2021-01-01", "2021-01-31"), bbox=TEST_BBOX)
+
+    features = catalog.search_parallel(
+        **search_params, time_split=dt.timedelta(days=7), bbox_split=(2, 2), max_threads=4, limit=10
+    )
+    feature_ids = [feature["id"] for feature in features]
+
+    assert len(feature_ids) == len(set(feature_ids))
+    assert set(feature_ids) == set(catalog.search(**search_params).get_ids())
+
+
+def test_search_to_arrays(catalog: SentinelHubCatalog) -> None:
+    """Tests that columnar accessors match the per-feature iterator methods"""
+    search_iterator = catalog.search(
+        collection=DataCollection.SENTINEL2_L1C, time=("2021-01-01", "2021-01-15"), bbox=TEST_BBOX, limit=5
+    )
+    arrays = search_iterator.to_arrays(properties=["eo:cloud_cover"])
+
+    assert list(arrays["ids"]) == search_iterator.get_ids()
+    assert arrays["timestamps"].dtype == np.dtype("datetime64[ms]")
+    assert [
+        timestamp.replace(tzinfo=dateutil.tz.tzutc()) for timestamp in arrays["timestamps"].astype(dt.datetime)
+    ] == search_iterator.get_timestamps()
+    geometries = search_iterator.get_geometries()
+    assert all(geometry.equals(geo.geometry) for geometry, geo in zip(arrays["geometries"], geometries))
+    assert arrays["eo:cloud_cover"].dtype == np.float64
+
+
+def test_to_arrays_parsing(catalog: SentinelHubCatalog, mocker: MockerFixture) -> None:
+    """Tests parsing of features into arrays on mocked features"""
+    features = [
+        {
+            "id": "first",
+            "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+            "properties": {"datetime": "2021-01-01T10:00:00.123Z", "proj:bbox": [0, 0, 1, 1], "platform": "a"},
+        },
+        {
+            "id": "second",
+            "geometry": None,
+            "properties": {"datetime": "2021-01-02T12:00:00+02:00", "proj:bbox": [0, 0, 1, 1, 2, 2]},
+        },
+    ]
+    mocker.patch.object(catalog.client, "get_json_dict", return_value={"features": features, "context": {}})
+
+    arrays = catalog.search(DataCollection.SENTINEL2_L1C).to_arrays(properties=["proj:bbox", "platform"])
+
+    assert list(arrays["ids"]) == ["first", "second"]
+    assert list(arrays["timestamps"]) == [
+        np.datetime64("2021-01-01T10:00:00.123"),
+        np.datetime64("2021-01-02T10:00:00.000"),
+    ]
+    assert arrays["geometries"][0].equals(shapely.Point(1, 2))
+    assert arrays["geometries"][1] is None
+    assert arrays["proj:bbox"].shape == (2,)
+    assert list(arrays["platform"]) == ["a", None]
+
+
 @pytest.mark.parametrize(
     ("data_collection", "feature_id"),
     [
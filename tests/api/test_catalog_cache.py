@@ -0,0 +1,135 @@
+"""
+Tests for the local cache of Catalog API search results
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+from typing import Any
+
+import pytest
+import shapely
+import shapely.geometry
+from pytest_mock import MockerFixture
+
+from sentinelhub import CRS, BBox, CatalogCache, DataCollection, SentinelHubCatalog, parse_time
+from sentinelhub.types import JsonDict
+
+FEATURES = [
+    {
+        "id": f"feature-{day}-{column}",
+        "geometry": json.loads(shapely.to_geojson(shapely.geometry.box(column, 0, column + 1, 1))),
+        "properties": {"datetime": f"2021-01-{day:02d}T10:00:00Z"},
+    }
+    for day in range(1, 31)
+    for column in range(3)
+]
+
+
+def _mocked_search(_url: str, post_values: JsonDict, **_: Any) -> JsonDict:
+    """Mocks Catalog API search by filtering features by time and bbox of the payload. If any fields are specified,
+    only IDs of features are returned."""
+    start_time, end_time = (parse_time(time, force_datetime=True) for time in post_values["datetime"].split("/"))
+    search_box = shapely.geometry.box(*post_values["bbox"])
+    features = [
+        feature
+        for feature in FEATURES
+        if start_time <= parse_time(feature["properties"]["datetime"], force_datetime=True) <= end_time
+        and shapely.geometry.shape(feature["geometry"]).intersects(search_box)
+    ]
+    if "fields" in post_values:
+        features = [{"id": feature["id"]} for feature in features]
+    return {"features": features, "context": {}}
+
+
+@pytest.fixture(name="catalog")
+def catalog_fixture(mocker: MockerFixture) -> SentinelHubCatalog:
+    catalog = SentinelHubCatalog()
+    mocker.patch.object(catalog.client, "get_json_dict", side_effect=_mocked_search)
+    return catalog
+
+
+def _get_requested_intervals(catalog: SentinelHubCatalog) -> list[str]:
+    return [call.kwargs["post_values"]["datetime"] for call in catalog.client.get_json_dict.call_args_list]
+
+
+def test_catalog_cache(catalog: SentinelHubCatalog, output_folder: str) -> None:
+    cache_path = os.path.join(output_folder, "catalog.sqlite")
+    cache = CatalogCache(cache_path)
+    search_params: dict[str, Any] = dict(
+        collection=DataCollection.SENTINEL2_L1C, bbox=BBox((0.5, 0, 1.5, 1), CRS.WGS84)
+    )
+
+    features = list(catalog.search(**search_params, time=("2021-01-05", "2021-01-20"), cache=cache))
+    assert features == list(catalog.search(**search_params, time=("2021-01-05", "2021-01-20")))
+    assert len(features) == 2 * 16
+    assert _get_requested_intervals(catalog) == ["2021-01-05T00:00:00Z/2021-01-20T23:59:59Z"] * 2
+
+    catalog.client.get_json_dict.reset_mock()
+    smaller_bbox = BBox((1.1, 0.2, 1.2, 0.3), CRS.WGS84)
+    search_iterator = catalog.search(
+        DataCollection.SENTINEL2_L1C, bbox=smaller_bbox, time=("2021-01-10", "2021-01-12"), cache=cache
+    )
+    assert search_iterator.get_ids() == [f"feature-{day}-1" for day in range(10, 13)]
+    assert catalog.client.get_json_dict.call_count == 0
+
+    cache.close()
+    cache = CatalogCache(cache_path)
+    features = list(catalog.search(**search_params, time=("2021-01-01", "2021-01-25"), cache=cache))
+    assert len(features) == 2 * 25
+    assert _get_requested_intervals(catalog) == [
+        "2021-01-01T00:00:00Z/2021-01-05T00:00:00Z",
+        "2021-01-20T23:59:59Z/2021-01-25T23:59:59Z",
+    ]
+
+    catalog.client.get_json_dict.reset_mock()
+    catalog.search(**search_params, time=("2021-01-01", "2021-01-25"), filter="eo:cloud_cover < 10", cache=cache)
+    assert catalog.client.get_json_dict.call_count == 1
+    cache.close()
+
+
+def test_catalog_cache_fields(catalog: SentinelHubCatalog) -> None:
+    cache = CatalogCache()
+    search_params: dict[str, Any] = dict(
+        collection=DataCollection.SENTINEL2_L1C,
+        bbox=BBox((0.5, 0, 1.5, 1), CRS.WGS84),
+        time=("2021-01-05", "2021-01-06"),
+    )
+
+    full_features = list(catalog.search(**search_params, cache=cache))
+    id_features = list(catalog.search(**search_params, fields={"include": ["id"]}, cache=cache))
+    assert catalog.client.get_json_dict.call_count == 2
+    assert id_features == [{"id": feature["id"]} for feature in full_features]
+
+    assert list(catalog.search(**search_params, fields={"include": ["id"]}, cache=cache)) == id_features
+    assert list(catalog.search(**search_params, cache=cache)) == full_features
+    assert catalog.client.get_json_dict.call_count == 2
+
+
+def test_catalog_cache_staleness(catalog: SentinelHubCatalog) -> None:
+    cache = CatalogCache(staleness=dt.timedelta(days=3))
+    now = dt.datetime.now(tz=dt.timezone.utc).replace(microsecond=0)
+    search_params: dict[str, Any] = dict(
+        collection=DataCollection.SENTINEL2_L1C,
+        bbox=BBox((0, 0, 1, 1), CRS.WGS84),
+        time=(now - dt.timedelta(days=10), now),
+    )
+
+    catalog.search(**search_params, cache=cache)
+    catalog.search(**search_params, cache=cache)
+
+    first_request, second_request = _get_requested_intervals(catalog)
+    assert first_request.split("/")[0] == f"{(now - dt.timedelta(days=10)).isoformat()}".replace("+00:00", "Z")
+    assert parse_time(second_request.split("/")[0], force_datetime=True) < now - dt.timedelta(days=2)
+
+
+def test_catalog_cache_not_cacheable(catalog: SentinelHubCatalog) -> None:
+    cache = CatalogCache()
+    search_iterator = catalog.search(DataCollection.SENTINEL2_L1C, bbox=BBox((0, 0, 1, 1), CRS.WGS84), cache=cache)
+    assert catalog.client.get_json_dict.call_count == 0
+
+    catalog.client.get_json_dict.side_effect = [{"features": [], "context": {}}]
+    assert list(search_iterator) == []
+    assert not cache.is_cacheable(catalog.client.get_json_dict.call_args.kwargs["post_values"])
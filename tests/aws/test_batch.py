@@ -5,6 +5,7 @@ Tests for AWS batch module
 from __future__ import annotations
 
 import json
+import os
 from enum import Enum
 from typing import Sequence
 
@@ -13,9 +14,9 @@ import pytest
 from moto import mock_aws
 from pytest_mock import MockerFixture
 
-from sentinelhub import BatchRequestStatus, BatchStatisticalRequest, SHConfig
+from sentinelhub import BatchProcessRequest, BatchRequestStatus, BatchStatisticalRequest, SHConfig
 from sentinelhub.api.batch.statistical import BatchStatisticalRequestType
-from sentinelhub.aws import AwsBatchStatisticalResults
+from sentinelhub.aws import AwsBatchProcessResults, AwsBatchStatisticalResults
 from sentinelhub.types import JsonDict
 
 
@@ -93,3 +94,69 @@ def test_aws_batch_results(
     downloaded_data = results.get_data(show_progress=show_progress)
 
     assert downloaded_data == data
+
+
+@mock_aws
+@pytest.mark.parametrize(
+    ("delivery_url", "expected_prefix"),
+    [
+        ("s3://bucket/path/to/outputs/<tileName>/<outputId>.<format>", "path/to/outputs/"),
+        ("s3://bucket/path/to/outputs", "path/to/outputs/"),
+        ("s3://bucket/out/result.zarr/", "out/result.zarr/"),
+        ("s3://bucket/<tileName>.tiff", ""),
+    ],
+)
+def test_aws_batch_process_results_location(delivery_url: str, expected_prefix: str, output_folder: str) -> None:
+    batch_request = {
+        "id": "fake-batch-id",
+        "domainAccountId": "fake-account",
+        "status": "DONE",
+        "request": {"output": {"delivery": {"s3": {"url": delivery_url}}}},
+    }
+    results = AwsBatchProcessResults(batch_request, data_folder=output_folder)
+
+    assert results.bucket_name == "bucket"
+    assert results.prefix == expected_prefix
+
+
+@mock_aws
+def test_aws_batch_process_results(output_folder: str, mocker: MockerFixture) -> None:
+    """Mocks an S3 bucket with tiles of Batch Process outputs, downloads them and checks that a repeated download
+    skips objects that are already downloaded."""
+    bucket_name = "mocked-test-bucket"
+    prefix = "path/to/outputs/"
+    paths = [f"{prefix}tile_{tile_index}/B0{band}.tif" for tile_index in range(4) for band in range(1, 3)]
+    data = [{"tile": path} for path in paths]
+    _create_mocked_bucket_and_upload_data(bucket_name, [*paths, "path/to/other/file.json"], [*data, {}])
+
+    batch_request = BatchProcessRequest(
+        request_id="fake-batch-id",
+        domain_account_id="fake-account",
+        status=BatchRequestStatus.DONE,
+        request={"output": {"delivery": {"s3": {"url": f"s3://{bucket_name}/{prefix}<tileName>/<outputId>.tif"}}}},
+    )
+    results = AwsBatchProcessResults(batch_request, data_folder=output_folder, max_threads=3)
+
+    assert [item["Key"] for item in results.list_objects()] == sorted(paths)
+
+    mocker.patch.object(AwsBatchProcessResults, "MANIFEST_SAVE_INTERVAL", 3)
+    save_manifest_spy = mocker.spy(results, "_save_manifest")
+    local_paths = results.download()
+    assert save_manifest_spy.call_count == 3
+    assert local_paths == [os.path.join(output_folder, *path[len(prefix) :].split("/")) for path in sorted(paths)]
+    for path, data_dict in zip(paths, data):
+        with open(os.path.join(output_folder, path[len(prefix) :])) as file:
+            assert json.load(file) == data_dict
+
+    with open(results.get_manifest_path()) as file:
+        assert sorted(json.load(file)) == sorted(paths)
+
+    os.remove(results.get_manifest_path())
+    os.remove(local_paths[0])
+    with open(local_paths[1], "w") as file:
+        file.write("corrupted")
+
+    mocked_download = mocker.patch("boto3.s3.transfer.S3Transfer.download_file")
+    results.download()
+    downloaded_keys = sorted(call.kwargs["key"] for call in mocked_download.call_args_list)
+    assert downloaded_keys == sorted(paths)[:2]
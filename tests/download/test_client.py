@@ -4,12 +4,17 @@ Unit tests for download utilities
 
 import copy
 import os
+import shutil
 
+import numpy as np
 import pytest
 
 from sentinelhub import DownloadClient, DownloadRequest, MimeType, write_data
+from sentinelhub.decoding import TarData
+from sentinelhub.download.client import DECODED_CACHE_FILENAME
 from sentinelhub.download.models import DownloadResponse
 from sentinelhub.exceptions import HashedNameCollisionException, SHRuntimeWarning
+from sentinelhub.io_utils import read_chunked_array
 
 
 @pytest.fixture(name="download_request")
@@ -112,3 +117,69 @@ def test_check_cached_request_is_matching(download_request: DownloadRequest) ->
 
     # pylint: disable=protected-access
     client._check_cached_request_is_matching(download_request, request_path)  # noqa: SLF001
+
+
+@pytest.mark.parametrize("lazy_tar", [False, True])
+def test_download_cached_tar(input_folder: str, output_folder: str, lazy_tar: bool) -> None:
+    request = DownloadRequest(
+        url="http://localhost:0/not-available",
+        data_type=MimeType.TAR,
+        save_response=True,
+        data_folder=output_folder,
+        filename="response.tar",
+        return_data=True,
+    )
+    _, response_path = request.get_storage_paths()
+    assert response_path is not None
+    os.makedirs(output_folder, exist_ok=True)
+    shutil.copyfile(os.path.join(input_folder, "img.tar"), response_path)
+
+    (tar_data,) = DownloadClient(redownload=False, lazy_tar=lazy_tar).download([request])
+
+    assert isinstance(tar_data, TarData if lazy_tar else dict)
+    assert set(tar_data) == {"default.tif", "userdata.json"}
+    assert tar_data["default.tif"].shape == (856, 512, 3)
+
+
+def test_download_cached_decoded(output_folder: str) -> None:
+    request = DownloadRequest(
+        url="http://localhost:0/not-available",
+        data_type=MimeType.TIFF,
+        save_response=True,
+        data_folder=output_folder,
+        return_data=True,
+    )
+    request_path, response_path = request.get_storage_paths()
+    assert request_path is not None
+    assert response_path is not None
+    image = np.arange(200, dtype=np.float32).reshape(10, 20)
+    write_data(response_path, image)
+    with open(response_path, "rb") as tiff_file:
+        DownloadResponse(request=request, content=tiff_file.read()).to_local()
+
+    client = DownloadClient(cache_decoded=True)
+    (data,) = client.download([request])
+    decoded_cache_path = os.path.join(os.path.dirname(request_path), DECODED_CACHE_FILENAME)
+    assert os.path.exists(decoded_cache_path)
+    assert np.array_equal(read_chunked_array(decoded_cache_path), image)
+
+    os.remove(response_path)
+    (cached_data,) = client.download([request])
+    assert np.array_equal(data, image)
+    assert np.array_equal(cached_data, image)
+    assert cached_data.dtype == image.dtype
+
+    new_image = image + 1
+    write_data(response_path, new_image)
+    cache_time = os.path.getmtime(decoded_cache_path)
+    os.utime(response_path, (cache_time + 10, cache_time + 10))
+    (redecoded_data,) = client.download([request])
+    assert np.array_equal(redecoded_data, new_image)
+    assert np.array_equal(read_chunked_array(decoded_cache_path), new_image)
+
+    with open(decoded_cache_path, "r+b") as cache_file:
+        cache_file.truncate(os.path.getsize(decoded_cache_path) // 2)
+    os.utime(response_path, (cache_time, cache_time))
+    (redecoded_data,) = client.download([request])
+    assert np.array_equal(redecoded_data, new_image)
+    assert np.array_equal(read_chunked_array(decoded_cache_path), new_image)
@@ -2,6 +2,8 @@
 Tests for the module with a special download client for Statistical API
 """
 
+import math
+
 import pytest
 from requests_mock import Mocker
 
@@ -33,7 +35,7 @@ def test_statistical_client_download_per_interval(download_request: DownloadRequ
                     "data": [
                         {"interval": {"from": "2020-01-05", "to": "2020-01-05"}, "error": {"type": "EXECUTION_ERROR"}},
                         {"interval": {"from": "2020-01-10", "to": "2020-01-10"}, "error": {"type": "BAD_REQUEST"}},
-                        {"interval": {"from": "2020-01-15", "to": "2020-01-15"}},
+                        {"interval": {"from": "2020-01-15", "to": "2020-01-15"}, "mean": math.nan},
                     ]
                 }
             },
@@ -48,6 +50,7 @@ def test_statistical_client_download_per_interval(download_request: DownloadRequ
 
     data = client.download([download_request])
 
+    assert math.isnan(data[0]["data"][2].pop("mean"))
     assert data[0] == {
         "data": [
             {"interval": {"from": "2020-01-05", "to": "2020-01-05"}, "outputs": 0},
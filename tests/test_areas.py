@@ -4,23 +4,29 @@ import itertools
 import os
 from typing import Any
 
+import numpy as np
 import pytest
 import shapely.geometry
+from pytest_mock import MockerFixture
 
+import sentinelhub.areas
 from sentinelhub import (
     CRS,
     BBox,
+    BBoxArray,
     BBoxSplitter,
     CustomGridSplitter,
     DataCollection,
     Geometry,
     OsmSplitter,
+    TileGrid,
+    TileGridSplitter,
     TileSplitter,
     UtmGridSplitter,
     UtmZoneSplitter,
     read_data,
 )
-from sentinelhub.areas import AreaSplitter
+from sentinelhub.areas import AreaSplitter, BaseUtmSplitter
 from sentinelhub.testing_utils import get_input_folder
 
 geojson = read_data(os.path.join(get_input_folder(__file__), "cies_islands.json"))
@@ -77,6 +83,10 @@ def test_return_type(constructor: type[AreaSplitter], args: list, kwargs: dict[s
         for return_item in return_list:
             assert isinstance(return_item, item_type)
 
+    bbox_array = splitter.get_bbox_array(buffer=0.2)
+    assert isinstance(bbox_array, BBoxArray)
+    assert bbox_array.to_list() == splitter.get_bbox_list(buffer=0.2)
+
 
 @pytest.mark.parametrize(
     ("args", "kwargs", "bbox_len"),
@@ -91,3 +101,120 @@ def test_bbox_splitter_by_size(args: list, kwargs: dict[str, Any], bbox_len: int
     splitter = BBoxSplitter(*args, **kwargs)
     assert len(splitter.get_geometry_list()) == bbox_len
     assert all(splitter.crs == bbox.crs for bbox in splitter.get_bbox_list())
+
+
+def test_splitter_does_not_prepare_given_shapes() -> None:
+    polygon = shapely.geometry.shape(geojson)
+    geometry = Geometry(shapely.geometry.shape(geojson), CRS.WGS84)
+    BBoxSplitter([polygon, geometry], CRS.WGS84, 2)
+
+    assert not shapely.is_prepared(polygon)
+    assert not shapely.is_prepared(geometry.geometry)
+
+
+def test_intersects_area_array() -> None:
+    shapes = [BBox((x / 10, 42.2, (x + 1) / 10 - 0.05, 42.25), CRS.WGS84).geometry for x in range(-90, -87)]
+    splitter = BBoxSplitter(shapes, CRS.WGS84, split_shape=1)
+    bbox_array = BBoxArray.from_bboxes(BBOX_GRID)
+
+    expected = [any(shape.intersects(bbox.geometry) for shape in shapes) for bbox in BBOX_GRID]
+    assert splitter._intersects_area_array(bbox_array).tolist() == expected  # noqa: SLF001
+    assert any(expected)
+    assert not all(expected)
+
+
+@pytest.mark.parametrize(
+    ("splitter", "kwargs"),
+    [
+        (BBoxSplitter([AREA], CRS.WGS84, 5, reduce_bbox_sizes=True), dict(buffer=0.2)),
+        (BBoxSplitter([REPROJECTED_AREA], CRS("32629"), split_size=(1000, 2000)), dict(crs=CRS.WGS84)),
+        (OsmSplitter([AREA], CRS.WGS84, 15), dict(reduce_bbox_sizes=True)),
+        (CustomGridSplitter([AREA], CRS.WGS84, BBOX_GRID, bbox_split_shape=(3, 4)), {}),
+        (UtmZoneSplitter([AREA], CRS.WGS84, bbox_size=(1200, 1200)), dict(buffer=0.1)),
+    ],
+)
+def test_iter_split(splitter: AreaSplitter, kwargs: dict[str, Any]) -> None:
+    lazy_split = list(splitter.iter_split(**kwargs))
+    expected_split = list(zip(splitter.get_bbox_list(**kwargs), splitter.get_info_list()))
+
+    assert lazy_split == expected_split
+    assert list(splitter.iter_split(**kwargs)) == expected_split
+
+
+def test_bbox_splitter_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    splitter = BBoxSplitter([REPROJECTED_AREA], CRS("32629"), split_size=(100, 200))
+    expected_bboxes, expected_infos = splitter.get_bbox_list(), splitter.get_info_list()
+
+    monkeypatch.setattr("sentinelhub.areas._SPLIT_CHUNK_SIZE", 7)
+    splitter = BBoxSplitter([REPROJECTED_AREA], CRS("32629"), split_size=(100, 200))
+    assert splitter.get_bbox_list() == expected_bboxes
+    assert splitter.get_info_list() == expected_infos
+
+
+@pytest.mark.parametrize("constructor", [UtmGridSplitter, UtmZoneSplitter])
+def test_utm_grid_is_shared(constructor: type[BaseUtmSplitter]) -> None:
+    splitter1 = constructor([AREA], CRS.WGS84, bbox_size=5000)
+    splitter2 = constructor([AREA], CRS.WGS84, bbox_size=10000)
+
+    assert all(cell1[0] is cell2[0] for cell1, cell2 in zip(splitter1.utm_grid, splitter2.utm_grid))
+
+    splitter1.utm_grid[0][1]["zone"] = -1
+    assert splitter2.utm_grid[0][1]["zone"] != -1
+    assert constructor([AREA], CRS.WGS84, bbox_size=5000).utm_grid[0][1]["zone"] != -1
+
+
+@pytest.mark.parametrize("constructor", [UtmGridSplitter, UtmZoneSplitter])
+def test_utm_splitter_threads(constructor: type[BaseUtmSplitter]) -> None:
+    area = shapely.geometry.Point(-8.9, 42.2).buffer(4)
+    splitter = constructor([area], CRS.WGS84, bbox_size=50000)
+    parallel_splitter = constructor([area], CRS.WGS84, bbox_size=50000, max_threads=4)
+
+    assert len({info["crs"] for info in splitter.get_info_list()}) > 1
+    assert parallel_splitter.get_bbox_list() == splitter.get_bbox_list()
+    assert parallel_splitter.get_info_list() == splitter.get_info_list()
+
+
+@pytest.mark.parametrize("max_threads", [1, 2])
+def test_utm_splitter_threads_are_lazy(max_threads: int, mocker: MockerFixture) -> None:
+    area = shapely.geometry.Point(10, 20).buffer(30)
+    splitter = UtmGridSplitter([area], CRS.WGS84, bbox_size=500000, max_threads=max_threads)
+    executor_spy = mocker.spy(sentinelhub.areas, "ThreadPoolExecutor")
+    split_spy = mocker.spy(splitter, "_split_utm_cell")
+
+    first_split = next(splitter.iter_split())
+    assert executor_spy.call_count == (0 if max_threads == 1 else 1)
+    # Only a limited window of cells is split ahead of the consumer
+    assert split_spy.call_count <= 2 * max_threads + 1
+
+    split_spy.reset_mock()
+    assert first_split == next(zip(splitter.get_bbox_list(), splitter.get_info_list()))
+    assert split_spy.call_count > 2 * max_threads + 1
+
+
+@pytest.mark.parametrize("zoom_level", [0, 3, 9])
+def test_tile_grid_splitter(zoom_level: int) -> None:
+    tile_grid = TileGrid.wgs84_quad()
+    splitter = TileGridSplitter([AREA], CRS.WGS84, tile_grid, zoom_level)
+
+    num_x, num_y = 2 ** (zoom_level + 1), 2**zoom_level
+    all_tiles = BBoxArray.from_partition(tile_grid.bbox, num_x=num_x, num_y=num_y)
+    tile_indices = np.flatnonzero(all_tiles.intersects(AREA))
+    expected_tiles = {(index // num_y, num_y - 1 - index % num_y) for index in tile_indices}
+
+    info_list = splitter.get_info_list()
+    assert {(info["index_x"], info["index_y"]) for info in info_list} == expected_tiles
+    assert all(info["zoom_level"] == zoom_level for info in info_list)
+
+    for bbox, info in zip(splitter.get_bbox_list(), info_list):
+        expected_bbox = all_tiles[int(info["index_x"]) * num_y + num_y - 1 - int(info["index_y"])]
+        assert bbox.crs is CRS.WGS84
+        assert np.allclose(list(bbox), list(expected_bbox))
+
+
+def test_tile_grid_splitter_outside_grid() -> None:
+    tile_grid = TileGrid(BBox((0, 0, 10, 10), CRS.WGS84))
+    with pytest.raises(ValueError):
+        TileGridSplitter([AREA], CRS.WGS84, tile_grid, 1)
+
+    with pytest.raises(ValueError):
+        OsmSplitter([shapely.geometry.box(0, 80, 1, 87)], CRS.WGS84, 5)
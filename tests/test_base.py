@@ -5,11 +5,27 @@ Tests for sh_utils.py module
 from __future__ import annotations
 
 import math
+import os
+from typing import Any
 
+import numpy as np
 import pytest
-
-from sentinelhub import DownloadClient
-from sentinelhub.base import FeatureIterator
+from pytest_mock import MockerFixture
+
+from sentinelhub import (
+    CRS,
+    BBox,
+    DataCollection,
+    DownloadClient,
+    DownloadRequest,
+    MimeType,
+    SentinelHubDownloadClient,
+    SentinelHubRequest,
+    write_data,
+)
+from sentinelhub.base import DataRequest, FeatureIterator
+from sentinelhub.decoding import TarData
+from sentinelhub.download.models import DownloadResponse
 
 
 class DummyIterator(FeatureIterator):
@@ -55,3 +71,117 @@ def test_feature_iterator(total: int, limit: int) -> None:
     for idx in range(8):
         value = next(iterator)
         assert value == idx
+
+
+class DummyPageIterator(FeatureIterator):
+    """As features it generates dictionaries with integer values and counts the number of fetches"""
+
+    def __init__(self, total: int, limit: int, **kwargs: Any):
+        self.total = total
+        self.limit = limit
+
+        self.fetched_count = 0
+        self.feature_fetch_count = 0
+        super().__init__(client=DownloadClient(), url="", **kwargs)
+
+    def _fetch_features(self) -> list[dict]:
+        new_features = [
+            {"value": value} for value in range(self.fetched_count, min(self.fetched_count + self.limit, self.total))
+        ]
+        self.fetched_count += len(new_features)
+        self.feature_fetch_count += 1
+        self.finished = self.fetched_count == self.total
+        return new_features
+
+
+@pytest.mark.parametrize(("total", "limit"), [(100, 1000), (100, 10), (100, 7), (0, 10)])
+def test_feature_iterator_disk_storage(total: int, limit: int, output_folder: str) -> None:
+    iterator = DummyPageIterator(total, limit, feature_storage="disk", storage_folder=output_folder)
+    expected_features = [{"value": value} for value in range(total)]
+
+    for _ in range(3):
+        assert list(iterator) == expected_features
+        assert iterator.feature_fetch_count == max(math.ceil(total / limit), 1)
+        assert len(iterator.features) <= limit
+
+    iterator = iter(iterator)
+    assert [next(iterator) for _ in range(total)] == expected_features
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_feature_iterator_no_storage() -> None:
+    iterator = DummyPageIterator(100, 7, feature_storage="none")
+
+    assert [next(iterator) for _ in range(10)] == [{"value": value} for value in range(10)]
+    assert len(iterator.features) == 7
+    assert [next(iterator) for _ in range(90)] == [{"value": value} for value in range(10, 100)]
+    assert len(iterator.features) == 2
+    assert iterator.feature_fetch_count == 15
+
+    with pytest.raises(RuntimeError):
+        iter(iterator)
+
+
+class DummyLocalRequest(DataRequest):
+    """A request for TIFF images which are already stored in a data folder"""
+
+    def __init__(self, filenames: list[str], data_folder: str):
+        self.filenames = filenames
+        super().__init__(DownloadClient, data_folder=data_folder)
+
+    def create_request(self) -> None:
+        self.download_list = [
+            DownloadRequest(data_type=MimeType.TIFF, data_folder=self.data_folder, filename=filename)
+            for filename in self.filenames
+        ]
+
+
+def test_get_data_stack_into(output_folder: str) -> None:
+    rng = np.random.default_rng(42)
+    images = [rng.random((10, 12, 3), dtype=np.float32) for _ in range(4)]
+    filenames = [f"image{index}.tiff" for index in range(len(images))]
+    for filename, image in zip(filenames, images):
+        write_data(os.path.join(output_folder, filename), image)
+    request = DummyLocalRequest(filenames, output_folder)
+
+    stack = np.zeros((4, 10, 12, 3), dtype=np.float32)
+    result = request.get_data(stack_into=stack, max_threads=2)
+    assert result is stack
+    assert np.array_equal(stack, np.stack(images))
+    assert np.array_equal(stack, np.stack(request.get_data()))
+
+    filtered_stack = request.get_data(data_filter=[3, 0, 3], stack_into=np.zeros((3, 10, 12, 3)))
+    assert np.array_equal(filtered_stack, np.stack([images[3], images[0], images[3]]))
+
+    with pytest.raises(ValueError):
+        request.get_data(stack_into=np.zeros((3, 10, 12, 3)))
+    with pytest.raises(ValueError):
+        request.get_data(stack_into=stack, decode_data=False)
+
+
+@pytest.mark.parametrize("lazy_tar", [False, True])
+def test_get_data_multiple_outputs(input_folder: str, mocker: MockerFixture, lazy_tar: bool) -> None:
+    with open(os.path.join(input_folder, "img.tar"), "rb") as tar_file:
+        tar_content = tar_file.read()
+    mocker.patch.object(
+        SentinelHubDownloadClient,
+        "_execute_download",
+        side_effect=lambda request: DownloadResponse(request=request, content=tar_content),
+    )
+    request = SentinelHubRequest(
+        evalscript="",
+        input_data=[SentinelHubRequest.input_data(data_collection=DataCollection.SENTINEL2_L1C)],
+        responses=[
+            SentinelHubRequest.output_response("default", MimeType.TIFF),
+            SentinelHubRequest.output_response("userdata", MimeType.JSON),
+        ],
+        bbox=BBox((46.16, -16.15, 46.51, -15.58), CRS.WGS84),
+        size=(512, 856),
+    )
+
+    (tar_data,) = request.get_data(lazy_tar=lazy_tar)
+
+    assert isinstance(tar_data, TarData if lazy_tar else dict)
+    assert set(tar_data) == {"default.tif", "userdata.json"}
+    assert tar_data["default.tif"].shape == (856, 512, 3)
@@ -4,12 +4,21 @@ Unit tests for config.py module
 
 import os
 import shutil
+from dataclasses import FrozenInstanceError
 from typing import Generator
 
 import pytest
+import tomli
+from pytest_mock import MockerFixture
 
 from sentinelhub import SHConfig
-from sentinelhub.config import DEFAULT_PROFILE, SH_CLIENT_ID_ENV_VAR, SH_CLIENT_SECRET_ENV_VAR, SH_PROFILE_ENV_VAR
+from sentinelhub.config import (
+    DEFAULT_PROFILE,
+    SH_CLIENT_ID_ENV_VAR,
+    SH_CLIENT_SECRET_ENV_VAR,
+    SH_PROFILE_ENV_VAR,
+    FrozenSHConfig,
+)
 
 
 @pytest.fixture(autouse=True, scope="module")
@@ -234,3 +243,52 @@ def test_transformation_to_dict(hide_credentials: bool) -> None:
     else:
         assert config_dict["sh_client_secret"] == config.sh_client_secret
         assert config_dict["aws_secret_access_key"] == config.aws_secret_access_key
+
+
+@pytest.mark.dependency(depends=["test_user_config_is_masked"])
+@pytest.mark.usefixtures("_restore_config_file")
+def test_parsed_config_is_cached(mocker: MockerFixture) -> None:
+    SHConfig()
+    parse_spy = mocker.spy(tomli, "load")
+
+    for _ in range(5):
+        SHConfig()
+    assert parse_spy.call_count == 0
+
+    config = SHConfig()
+    config.instance_id = "cached"
+    config.save()
+    assert SHConfig().instance_id == "cached"
+
+    with open(SHConfig.get_config_location()) as file:
+        content = file.read()
+    with open(SHConfig.get_config_location(), "w") as file:
+        file.write(content.replace('"cached"', '"changed outside"'))
+    assert SHConfig().instance_id == "changed outside"
+
+
+@pytest.mark.dependency(depends=["test_user_config_is_masked"])
+def test_frozen_config(dummy_config: SHConfig) -> None:
+    frozen_config = dummy_config.freeze()
+    assert isinstance(frozen_config, FrozenSHConfig)
+    assert isinstance(frozen_config, SHConfig)
+    assert frozen_config.to_dict(mask_credentials=False) == dummy_config.to_dict(mask_credentials=False)
+    assert frozen_config.freeze() is frozen_config
+
+    with pytest.raises(FrozenInstanceError):
+        frozen_config.instance_id = "new"
+    with pytest.raises(FrozenInstanceError):
+        del frozen_config.instance_id
+
+    assert hash(frozen_config) == hash(dummy_config.freeze())
+    assert frozen_config == dummy_config.freeze()
+    assert {frozen_config: 1}[dummy_config.freeze()] == 1
+    assert frozen_config != SHConfig(use_defaults=True).freeze()
+
+    copied_config = frozen_config.copy()
+    assert type(copied_config) is SHConfig
+    assert copied_config == dummy_config
+    copied_config.instance_id = "new"
+    assert frozen_config.instance_id == "fake_instance_id"
+
+    assert FrozenSHConfig() == SHConfig().freeze()
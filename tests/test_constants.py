@@ -2,12 +2,15 @@
 Tests for constants.py module
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pyproj
 import pytest
 
 from sentinelhub import CRS, MimeType
-from sentinelhub.constants import RequestType, ResamplingType
+from sentinelhub.constants import RequestType, ResamplingType, thread_local_cache
 from sentinelhub.exceptions import SHUserWarning
 
 
@@ -19,10 +22,28 @@ from sentinelhub.exceptions import SHUserWarning
         (13, -45, CRS("32733")),
         (13, -0.0001, CRS("32733")),
         (13, -46, CRS("32733")),
+        (180, 10, CRS("32601")),
+        (-180, -10, CRS("32701")),
+        (5, 60, CRS("32632")),
+        (2.9, 60, CRS("32631")),
+        (8, 78, CRS("32631")),
+        (9, 84, CRS("32633")),
+        (32.9, 72, CRS("32635")),
+        (41.9, 80, CRS("32637")),
+        (42, 80, CRS("32638")),
     ],
 )
 def test_utm_from_wgs84(lng: float, lat: float, expected_crs: CRS) -> None:
     assert CRS.get_utm_from_wgs84(lng, lat) is expected_crs
+    assert CRS.get_utm_epsg_codes_from_wgs84(np.array([lng]), np.array([lat])).tolist() == [expected_crs.epsg]
+
+
+@pytest.mark.parametrize(("lng", "lat"), [(0, 84.1), (0, -80.1), (180.1, 0), (-181, 0)])
+def test_utm_from_wgs84_out_of_range(lng: float, lat: float) -> None:
+    with pytest.raises(ValueError):
+        CRS.get_utm_from_wgs84(lng, lat)
+    with pytest.raises(ValueError):
+        CRS.get_utm_epsg_codes_from_wgs84(np.array([0, lng]), np.array([0, lat]))
 
 
 @pytest.mark.parametrize(
@@ -101,6 +122,57 @@ def test_pyproj_methods(crs: CRS) -> None:
     assert isinstance(crs.pyproj_crs(), pyproj.CRS)
 
 
+def test_thread_local_cache() -> None:
+    calls = []
+
+    @thread_local_cache(maxsize=2)
+    def cached_function(value: int, power: int = 1) -> int:
+        calls.append(value)
+        return value**power
+
+    assert [cached_function(2), cached_function(2), cached_function(3, power=2), cached_function(4)] == [2, 2, 9, 4]
+    assert cached_function.cache_info() == (1, 3, 2, 2)
+    assert cached_function(2) == 2
+    assert calls == [2, 3, 4, 2]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(cached_function, 4).result() == 4
+        assert executor.submit(cached_function.cache_info).result() == (0, 1, 2, 1)
+    assert calls == [2, 3, 4, 2, 4]
+
+    cached_function.cache_clear()
+    assert cached_function.cache_info() == (0, 0, 2, 0)
+
+
+def test_transform_function_cache() -> None:
+    CRS.get_transform_function.cache_clear()
+    CRS.warm_up_transform_functions([CRS.POP_WEB, CRS.UTM_33N])
+    assert CRS.get_transform_function.cache_info().currsize == 4
+
+    transform_function = CRS.get_transform_function(CRS.WGS84, CRS.UTM_33N, always_xy=True)
+    assert CRS.get_transform_function.cache_info().hits == 1
+    assert CRS.WGS84.get_transform_function(CRS.UTM_33N, always_xy=True) is transform_function
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_function = executor.submit(CRS.WGS84.get_transform_function, CRS.UTM_33N, always_xy=True).result()
+    assert other_function is not transform_function
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Forking is not supported on this platform")
+def test_transform_function_cache_after_fork() -> None:
+    CRS.WGS84.get_transform_function(CRS.POP_WEB)
+    assert CRS.get_transform_function.cache_info().currsize > 0
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, str(CRS.get_transform_function.cache_info().currsize).encode())
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 10) == b"0"
+
+
 @pytest.mark.parametrize(
     ("ext", "mime_type"),
     [
@@ -4,11 +4,15 @@ Unit tests for data_collections module
 
 from __future__ import annotations
 
-from typing import Any
+import pickle
+import timeit
+from typing import Any, Callable
 
 import pytest
+from pytest_mock import MockerFixture
 
-from sentinelhub import DataCollection
+import sentinelhub.data_collections
+from sentinelhub import DataCollection, SentinelHubRequest
 from sentinelhub.data_collections import DataCollectionDefinition
 
 
@@ -80,6 +84,17 @@ def test_collection_definitions_not_equal(test_definition: dict[str, Any], equal
     assert def1 != def2
 
 
+def test_collection_definition_hash() -> None:
+    definition = DataCollection.SENTINEL2_L2A.value
+
+    assert hash(definition) == hash(definition.derive(_name="OTHER"))
+    assert hash(definition) != hash(definition.derive(api_id="X"))
+
+    unpickled_definition = pickle.loads(pickle.dumps(definition))
+    assert unpickled_definition == definition
+    assert "_hash" not in unpickled_definition.__dict__
+
+
 def test_define() -> None:
     data_collection = DataCollection.define("NEW", api_id="X", sensor_type="Sensor", bands=("B01",), is_timeless=True)
 
@@ -117,6 +132,22 @@ def test_define_byoc() -> None:
     assert not DataCollection.SENTINEL5P.is_byoc
 
 
+def test_define_many_byoc() -> None:
+    collection_ids = [f"many-byoc-{index}" for index in range(1000)]
+    collections = [DataCollection.define_byoc(collection_id) for collection_id in collection_ids]
+
+    for collection_id, collection in zip(collection_ids, collections):
+        assert DataCollection.define_byoc(collection_id) is collection
+        assert DataCollection(collection.value) is collection
+        assert collection.api_id == f"byoc-{collection_id}"
+        assert collection.collection_id == collection_id
+
+    with pytest.raises(ValueError):
+        DataCollection.define_byoc(collection_ids[0], api_id="byoc-other")
+    with pytest.raises(ValueError):
+        DataCollection.define_byoc(collection_ids[0], name="MANY_BYOC_OTHER")
+
+
 def test_define_batch() -> None:
     batch_id = "0000d273-7e89-4f00-971e-9024f89a0000"
     batch = DataCollection.define_batch(batch_id, name="MY_BATCH")
@@ -141,11 +172,48 @@ def test_attributes_empty_fail() -> None:
     data_collection = DataCollection.define("EMPTY")
 
     for attr_name in ["api_id", "catalog_id", "wfs_id", "bands"]:
-        with pytest.raises(ValueError):
-            getattr(data_collection, attr_name)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                getattr(data_collection, attr_name)
 
     assert data_collection.service_url is None
 
+    with pytest.raises(AttributeError):
+        data_collection.non_existing_attribute  # noqa: B018
+
+
+def test_definition_hash_is_computed_once(mocker: MockerFixture) -> None:
+    data_collection = DataCollection.define_from(DataCollection.SENTINEL2_L2A, "HASH_ONCE", api_id="hash-once")
+    definition = DataCollection.SENTINEL2_L2A.value.derive(api_id="hash-once")
+    fields_spy = mocker.spy(sentinelhub.data_collections, "fields")
+
+    for _ in range(3):
+        assert DataCollection(definition) is data_collection
+        assert hash(definition) == hash(data_collection.value)
+    assert fields_spy.call_count == 1
+
+
+def test_attributes_are_cached(mocker: MockerFixture) -> None:
+    data_collection = DataCollection.define("CACHED_ATTRIBUTES", api_id="cached", collection_type="custom")
+    getattr_spy = mocker.spy(DataCollection, "__getattr__")
+
+    for _ in range(3):
+        assert data_collection.collection_type == "custom"
+        assert data_collection.api_id == "cached"
+    assert getattr_spy.call_count == 1
+    assert data_collection.__dict__["api_id"] == "cached"
+
+
+@pytest.mark.benchmark()
+def test_request_building_throughput(record_property: Callable[[str, object], None]) -> None:
+    data_collection = DataCollection.SENTINEL1_IW_ASC
+    repeats = 1000
+
+    elapsed_time = timeit.timeit(
+        lambda: SentinelHubRequest.input_data(data_collection, maxcc=0.5, mosaicking_order="leastCC"), number=repeats
+    )
+    record_property("input_data_time_us", elapsed_time / repeats * 1e6)
+
 
 @pytest.mark.parametrize(
     ("test_collection", "expected"),
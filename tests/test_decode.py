@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import json
 import os
+import shutil
+import tarfile
+from io import BytesIO
 
 import numpy as np
 import pytest
+import tifffile as tiff
+from PIL import Image
 from requests import Response
 
-from sentinelhub.decoding import decode_sentinelhub_err_msg, decode_tar
+from sentinelhub import MimeType, read_data
+from sentinelhub.decoding import (
+    TarData,
+    decode_image,
+    decode_jp2_image,
+    decode_sentinelhub_err_msg,
+    decode_tar,
+    get_data_format,
+    get_jp2_bit_depth,
+    probe_image,
+)
 
 
 def test_tar(input_folder: str) -> None:
@@ -24,6 +40,68 @@ def test_tar(input_folder: str) -> None:
     assert metadata["norm_factor"] == 0.0001
 
 
+def test_decode_tar_into_dict(input_folder: str) -> None:
+    tar_path = os.path.join(input_folder, "img.tar")
+    tar_data = decode_tar(tar_path)
+
+    assert isinstance(tar_data, dict)
+    assert set(tar_data) == {"default.tif", "userdata.json"}
+    with open(tar_path, "rb") as tar_file:
+        tar_data_from_bytes = decode_tar(tar_file.read())
+    assert np.array_equal(tar_data_from_bytes["default.tif"], tar_data["default.tif"])
+    assert tar_data_from_bytes["userdata.json"] == tar_data["userdata.json"]
+
+
+def test_tar_is_lazy(input_folder: str, output_folder: str) -> None:
+    tar_path = os.path.join(input_folder, "img.tar")
+    tar_data = decode_tar(tar_path, lazy=True)
+
+    assert isinstance(tar_data, TarData)
+    assert len(tar_data) == 2
+    assert set(tar_data) == {"default.tif", "userdata.json"}
+    assert not tar_data._decoded_files  # noqa: SLF001
+
+    assert tar_data["default.tif"] is tar_data["default.tif"]
+    assert list(tar_data._decoded_files) == ["default.tif"]  # noqa: SLF001
+    assert json.loads(tar_data.read_bytes("userdata.json")) == tar_data["userdata.json"]
+
+    with pytest.raises(KeyError):
+        tar_data["missing.tif"]
+
+    extracted_paths = tar_data.extract(output_folder, filenames=["default.tif"])
+    assert extracted_paths == [os.path.join(output_folder, "default.tif")]
+    with open(extracted_paths[0], "rb") as extracted_file:
+        assert extracted_file.read() == tar_data.read_bytes("default.tif")
+
+
+def test_lazy_tar_file_changed(input_folder: str, output_folder: str) -> None:
+    tar_path = os.path.join(output_folder, "changed.tar")
+    os.makedirs(output_folder, exist_ok=True)
+    shutil.copyfile(os.path.join(input_folder, "img.tar"), tar_path)
+    tar_data = decode_tar(tar_path, lazy=True)
+
+    with tarfile.open(tar_path, mode="w") as tar:
+        member = tarfile.TarInfo("userdata.json")
+        member.size = 2
+        tar.addfile(member, BytesIO(b"{}"))
+
+    with pytest.raises(ValueError):
+        tar_data["userdata.json"]
+
+
+def test_tar_extract_outside_folder(output_folder: str) -> None:
+    tar_buffer = BytesIO()
+    with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
+        member = tarfile.TarInfo("../outside.json")
+        member.size = 2
+        tar.addfile(member, BytesIO(b"{}"))
+
+    tar_data = decode_tar(tar_buffer.getvalue(), lazy=True)
+    assert tar_data["../outside.json"] == {}
+    with pytest.raises(ValueError):
+        tar_data.extract(output_folder)
+
+
 HTML_RESPONSE = (
     '<html>\n<head>\n<meta http-equiv="Content-Type" content="text/html;charset=utf-8"/>\n<title>Error 500 Request'
     " failed.</title>\n</head>\n<body><h2>HTTP ERROR 500</h2>\n<p>Problem accessing /oauth/tokeninfo. Reason:\n<pre>"
@@ -49,3 +127,114 @@ def test_decode_sentinelhub_err_msg(content: str | bool | None, expected_message
 
     decoded_message = decode_sentinelhub_err_msg(response)
     assert decoded_message == expected_message
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float32])
+def test_decode_tiff_into_array(dtype: type) -> None:
+    image = np.arange(2 * 3 * 4, dtype=np.uint16).reshape(2, 3, 4)
+    tiff_buffer = BytesIO()
+    tiff.imwrite(tiff_buffer, image, photometric="minisblack", planarconfig="contig")
+
+    stack = np.zeros((3, 2, 3, 4), dtype=dtype)
+    result = decode_image(tiff_buffer.getvalue(), MimeType.TIFF, out=stack[1], maxworkers=1)
+
+    assert result is not None
+    assert np.shares_memory(result, stack)
+    assert result.shape == (2, 3, 4)
+    assert np.array_equal(stack[1], image)
+    assert not stack[0].any()
+    assert not stack[2].any()
+
+    with pytest.raises(ValueError):
+        decode_image(tiff_buffer.getvalue(), MimeType.TIFF, out=np.zeros((2, 3, 5), dtype=dtype))
+    with pytest.raises(ValueError):
+        decode_image(tiff_buffer.getvalue(), MimeType.TIFF, out=np.zeros((3, 2, 4), dtype=dtype))
+
+    expanded_out = np.zeros((1, 2, 3, 4), dtype=dtype)
+    decode_image(tiff_buffer.getvalue(), MimeType.TIFF, out=expanded_out)
+    assert np.array_equal(expanded_out[0], image)
+
+
+def test_decode_jp2_into_array(input_folder: str) -> None:
+    with open(os.path.join(input_folder, "img-8bit.jp2"), "rb") as jp2_file:
+        jp2_bytes = jp2_file.read()
+    image = decode_image(jp2_bytes, MimeType.JP2)
+
+    stack = np.zeros((2, *image.shape), dtype=image.dtype)
+    assert decode_image(jp2_bytes, MimeType.JP2, out=stack[0]) is not None
+    assert np.array_equal(stack[0], image)
+
+
+@pytest.mark.parametrize(("filename", "bit_depth"), [("img-8bit.jp2", 8), ("img-15bit.jp2", 15), ("img-16bit.jp2", 16)])
+def test_decode_jp2_image(input_folder: str, filename: str, bit_depth: int) -> None:
+    path = os.path.join(input_folder, filename)
+    with open(path, "rb") as jp2_file:
+        assert get_jp2_bit_depth(jp2_file) == bit_depth
+
+        image = decode_jp2_image(jp2_file)
+        pillow_image = np.array(Image.open(path))
+        expected_image = pillow_image >> 1 if bit_depth == 15 else pillow_image
+        assert np.array_equal(image, expected_image)
+
+    assert np.array_equal(decode_jp2_image(path), image)
+    with pytest.raises(ValueError):
+        decode_jp2_image(path, backend="opencv")  # type: ignore[arg-type]
+
+
+def test_jp2_codestream_bit_depth() -> None:
+    image = np.arange(64 * 64, dtype=np.uint16).reshape(64, 64)
+    codestream = BytesIO()
+    Image.fromarray(image).save(codestream, format="JPEG2000", no_jp2=True)
+
+    assert codestream.getvalue().startswith(b"\xff\x4f\xff\x51")
+    assert get_jp2_bit_depth(codestream) == 16
+    assert np.array_equal(decode_jp2_image(codestream), image)
+
+
+def test_decode_jp2_image_glymur(input_folder: str) -> None:
+    glymur = pytest.importorskip("glymur")
+    path = os.path.join(input_folder, "img-15bit.jp2")
+    image = decode_jp2_image(path)
+
+    num_threads = glymur.get_option("lib.num_threads")
+    assert np.array_equal(decode_jp2_image(path, backend="glymur", num_threads=num_threads + 1), image)
+    assert glymur.get_option("lib.num_threads") == num_threads
+    with open(path, "rb") as jp2_file:
+        assert np.array_equal(decode_jp2_image(jp2_file, backend="glymur"), image)
+
+
+@pytest.mark.parametrize("filename", ["img-8bit.jp2", "img-15bit.jp2", "img-16bit.jp2", "img.jpg"])
+def test_probe_image_file(input_folder: str, filename: str) -> None:
+    path = os.path.join(input_folder, filename)
+    image = read_data(path)
+
+    assert probe_image(path) == (image.shape, image.dtype)
+
+    with open(path, "rb") as image_file:
+        assert probe_image(image_file.read(), get_data_format(filename)) == (image.shape, image.dtype)
+
+
+@pytest.mark.parametrize(
+    ("image_type", "image"),
+    [
+        (MimeType.TIFF, np.zeros((4, 5, 6), dtype=np.float32)),
+        (MimeType.TIFF, np.zeros((4, 5), dtype=np.uint16)),
+        (MimeType.PNG, np.zeros((4, 5, 3), dtype=np.uint8)),
+        (MimeType.PNG, np.zeros((4, 5), dtype=bool)),
+    ],
+)
+def test_probe_image_bytes(image_type: MimeType, image: np.ndarray) -> None:
+    image_buffer = BytesIO()
+    if image_type is MimeType.TIFF:
+        tiff.imwrite(image_buffer, image, photometric="minisblack", planarconfig="contig")
+    else:
+        Image.fromarray(image).save(image_buffer, format="png")
+    data = image_buffer.getvalue()
+
+    image_info = probe_image(data, image_type)
+    decoded_image = decode_image(data, image_type)
+    assert image_info.shape == decoded_image.shape == image.shape
+    assert image_info.dtype == decoded_image.dtype == image.dtype
+
+    with pytest.raises(ValueError):
+        probe_image(data)
@@ -4,16 +4,23 @@ Test for geo_utils module and correctness of geographical transformations
 
 from __future__ import annotations
 
+import timeit
+from typing import Callable
+
+import numpy as np
 import pytest
 
-from sentinelhub import CRS, BBox
+from sentinelhub import CRS, BBox, BBoxArray
 from sentinelhub.geo_utils import (
     bbox_to_dimensions,
+    bbox_to_dimensions_many,
     bbox_to_resolution,
     get_image_dimension,
     get_utm_crs,
+    get_utm_crs_array,
     pixel_to_utm,
     transform_point,
+    transform_points,
     utm_to_pixel,
 )
 
@@ -39,6 +46,20 @@ def test_get_utm_crs(wgs84_coordinate: tuple[float, float], utm_crs: CRS) -> Non
     assert get_utm_crs(*wgs84_coordinate) is utm_crs
 
 
+def test_get_utm_crs_array() -> None:
+    lngs = [109.988, 49.889, 30, 180, -180, 5, 7, 20, 40, 11.9]
+    lats = [9.988, 49.889, -15, 0, -0.1, 60, 80, 84, 75, 56]
+    expected_codes = [get_utm_crs(lng, lat).epsg for lng, lat in zip(lngs, lats)]
+
+    assert get_utm_crs_array(lngs, lats).tolist() == expected_codes
+
+    pop_web_xs, pop_web_ys = transform_points(lngs, lats, CRS.WGS84, CRS.POP_WEB)
+    assert get_utm_crs_array(pop_web_xs, pop_web_ys, source_crs=CRS.POP_WEB).tolist() == expected_codes
+
+    with pytest.raises(ValueError):
+        get_utm_crs_array([0], [85])
+
+
 @pytest.mark.parametrize(
     ("input_bbox", "resolution", "expected_dimensions"),
     [
@@ -71,6 +92,16 @@ def test_bbox_to_dimensions(
     assert bbox_to_dimensions(input_bbox, resolution) == expected_dimensions
 
 
+def test_bbox_array_to_dimensions() -> None:
+    bboxes = [BBOX_WGS84, BBOX_UTM, BBOX_POP_WEB, BBOX_2, BBOX_3]
+    dimensions = bbox_to_dimensions(BBoxArray.from_bboxes(bboxes), (20, 10))
+
+    assert isinstance(dimensions, np.ndarray)
+    assert dimensions.tolist() == [list(bbox_to_dimensions(bbox, (20, 10))) for bbox in bboxes]
+    assert np.array_equal(bbox_to_dimensions_many(bboxes, (20, 10)), dimensions)
+    assert bbox_to_dimensions_many([], 10).shape == (0, 2)
+
+
 @pytest.mark.parametrize(
     ("input_bbox", "height", "width"),
     [
@@ -113,6 +144,27 @@ def test_transform_point(
     assert transform_point(new_point, target_crs, source_crs) == pytest.approx(point, rel=1e-8)
 
 
+def test_transform_points() -> None:
+    points = [(111.644, 8.655), (360000.0, 4635040.0), (360000.0, 4635040.0), (1475000.0, 5100000.0), (1.0, 2.0)]
+    source_crs_list = [CRS.WGS84, CRS.UTM_31N, CRS.UTM_31N, CRS(2193), CRS.WGS84]
+    target_crs_list = [CRS.POP_WEB, CRS.WGS84, CRS.UTM_30N, CRS.WGS84, CRS.WGS84]
+    xs, ys = zip(*points)
+
+    new_xs, new_ys = transform_points(xs, ys, source_crs_list, target_crs_list)
+    expected_points = [
+        transform_point(point, source_crs, target_crs)
+        for point, source_crs, target_crs in zip(points, source_crs_list, target_crs_list)
+    ]
+    assert list(zip(new_xs, new_ys)) == expected_points
+
+    grid_xs, grid_ys = transform_points(np.full((2, 3), 15.0), np.full((2, 3), 46.0), CRS.WGS84, CRS.UTM_33N)
+    assert grid_xs.shape == grid_ys.shape == (2, 3)
+    assert (grid_xs[0, 0], grid_ys[0, 0]) == transform_point((15.0, 46.0), CRS.WGS84, CRS.UTM_33N)
+
+    with pytest.raises(ValueError):
+        transform_points([1, 2], [1], CRS.WGS84, CRS.POP_WEB)
+
+
 @pytest.mark.parametrize(
     ("coordinate", "expected_pixel"),
     [
@@ -139,3 +191,42 @@ def test_utm_to_pixel(coordinate: tuple[float, float], expected_pixel: tuple[int
 )
 def test_pixel_to_utm(pixel: tuple[int, int], expected_coordinate: tuple[float, float]) -> None:
     assert pixel_to_utm(*pixel, GEOREFERENCING_TRANSFORM) == pytest.approx(expected_coordinate, abs=1)
+
+
+@pytest.mark.benchmark()
+def test_transform_points_throughput(record_property: Callable[[str, object], None]) -> None:
+    rng = np.random.default_rng(42)
+    lngs, lats = rng.uniform(12, 18, 10_000), rng.uniform(40, 50, 10_000)
+    target_crs_list = [CRS.UTM_33N, CRS.UTM_34N] * 5_000
+
+    elapsed_time = timeit.timeit(lambda: transform_points(lngs, lats, CRS.WGS84, target_crs_list), number=5)
+    record_property("transform_points_time_us", elapsed_time / 5 * 1e6)
+
+    elapsed_time = timeit.timeit(
+        lambda: [transform_point(point, CRS.WGS84, crs) for point, crs in zip(zip(lngs, lats), target_crs_list)],
+        number=1,
+    )
+    record_property("transform_point_loop_time_us", elapsed_time * 1e6)
+
+
+@pytest.mark.benchmark()
+def test_get_utm_crs_array_throughput(record_property: Callable[[str, object], None]) -> None:
+    rng = np.random.default_rng(42)
+    lngs, lats = rng.uniform(-180, 180, 10_000), rng.uniform(-80, 80, 10_000)
+
+    elapsed_time = timeit.timeit(lambda: get_utm_crs_array(lngs, lats), number=5)
+    record_property("get_utm_crs_array_time_us", elapsed_time / 5 * 1e6)
+
+    elapsed_time = timeit.timeit(lambda: [get_utm_crs(lng, lat) for lng, lat in zip(lngs, lats)], number=1)
+    record_property("get_utm_crs_loop_time_us", elapsed_time * 1e6)
+
+
+@pytest.mark.benchmark()
+def test_bbox_to_dimensions_many_throughput(record_property: Callable[[str, object], None]) -> None:
+    bboxes = BBoxArray.from_partition(BBox((12, 40, 18, 50), CRS.WGS84), num_x=50, num_y=20)
+
+    elapsed_time = timeit.timeit(lambda: bbox_to_dimensions_many(bboxes, 10), number=5)
+    record_property("bbox_to_dimensions_many_time_us", elapsed_time / 5 * 1e6)
+
+    elapsed_time = timeit.timeit(lambda: [bbox_to_dimensions(bbox, 10) for bbox in bboxes], number=1)
+    record_property("bbox_to_dimensions_loop_time_us", elapsed_time * 1e6)
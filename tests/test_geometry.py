@@ -7,7 +7,7 @@ from typing import Any, TypeVar
 import pytest
 import shapely.geometry
 
-from sentinelhub import CRS, BBox, Geometry, get_utm_crs
+from sentinelhub import CRS, BBox, BBoxArray, Geometry, GeometryArray, get_utm_crs
 from sentinelhub.exceptions import SHDeprecationWarning
 
 GeoType = TypeVar("GeoType", BBox, Geometry)
@@ -189,6 +189,28 @@ def test_transform_geometry(new_crs: CRS, geometry: GeoType) -> None:
     assert geometry.geometry.equals_exact(reconstructed_geometry.geometry, tolerance=1e-6)
 
 
+def test_transform_geometry_keeps_z_coordinates() -> None:
+    geometry = Geometry("POLYGON Z ((15 46 100, 15.1 46 200, 15.1 46.1 300, 15 46 100))", CRS.WGS84)
+
+    new_geometry = geometry.transform(CRS.UTM_33N)
+    assert new_geometry.geometry.has_z
+    assert shapely.get_coordinates(new_geometry.geometry, include_z=True)[:, 2].tolist() == [100, 200, 300, 100]
+
+    reconstructed_geometry = new_geometry.transform(CRS.WGS84)
+    assert geometry.geometry.equals_exact(reconstructed_geometry.geometry, tolerance=1e-6)
+
+    rounded_geometry = geometry.apply(lambda x, y: (round(x), round(y)))
+    assert shapely.get_coordinates(rounded_geometry.geometry, include_z=True)[:, 2].tolist() == [100, 200, 300, 100]
+
+
+def test_geometry_copies_given_shape() -> None:
+    polygon = shapely.geometry.Polygon([(0, 0), (1, 0), (1, 1)])
+    geometry = Geometry(polygon, CRS.WGS84)
+
+    assert geometry.geometry == polygon
+    assert geometry.geometry is not polygon
+
+
 def test_geometry_geojson_parameter_with_crs() -> None:
     expected_without_crs = {
         "type": "Polygon",
@@ -239,3 +261,99 @@ def test_geometry_apply_method(input_geometry: GeoType, expected_output_geometry
 
     assert rounded_geometry is not input_geometry
     assert rounded_geometry == expected_output_geometry
+
+
+BBOX_ARRAY_LIST = [
+    BBox((46.07, 13.23, 46.24, 13.57), CRS.WGS84),
+    BBox((570280, 956083, 576884, 960306), CRS(32649)),
+    BBox((10, 20, 30, 40), CRS.WGS84),
+]
+
+
+def test_bbox_array_init() -> None:
+    bbox_array = BBoxArray([(1, 4, 0, 2), (0, 0, 1, 1)], CRS.WGS84)
+
+    assert len(bbox_array) == 2
+    assert bbox_array.crs is CRS.WGS84
+    assert bbox_array.bounds.tolist() == [[0, 2, 1, 4], [0, 0, 1, 1]]
+    assert bbox_array[0] == BBox((0, 2, 1, 4), CRS.WGS84)
+    assert repr(bbox_array) == "BBoxArray(2 bounding boxes, CRS('4326'))"
+
+    mixed_array = BBoxArray.from_bboxes(BBOX_ARRAY_LIST)
+    assert mixed_array.to_list() == BBOX_ARRAY_LIST
+    assert mixed_array.epsg_codes.tolist() == [4326, 32649, 4326]
+    with pytest.raises(ValueError):
+        _ = mixed_array.crs
+
+    assert mixed_array[[0, 2]].crs is CRS.WGS84
+    assert mixed_array[1:].to_list() == BBOX_ARRAY_LIST[1:]
+    assert mixed_array == BBoxArray(mixed_array.bounds, mixed_array.epsg_codes)
+    assert BBoxArray.concatenate([mixed_array[:1], mixed_array[1:]]) == mixed_array
+
+    with pytest.raises(ValueError):
+        BBoxArray([(0, 0, 1, 1)], [CRS.WGS84, CRS.POP_WEB])
+    with pytest.raises(ValueError):
+        BBoxArray.from_bboxes([])
+    assert len(BBoxArray.from_bboxes([], crs=CRS.WGS84)) == 0
+
+
+def test_bbox_array_matches_bbox() -> None:
+    bbox_array = BBoxArray.from_bboxes(BBOX_ARRAY_LIST)
+
+    assert bbox_array.transform(CRS.POP_WEB).to_list() == [bbox.transform(CRS.POP_WEB) for bbox in BBOX_ARRAY_LIST]
+    assert bbox_array.buffer((0.2, -0.1)).to_list() == [bbox.buffer((0.2, -0.1)) for bbox in BBOX_ARRAY_LIST]
+    assert bbox_array.buffer(1, relative=False).to_list() == [
+        bbox.buffer(1, relative=False) for bbox in BBOX_ARRAY_LIST
+    ]
+    assert bbox_array.reverse().to_list() == [bbox.reverse() for bbox in BBOX_ARRAY_LIST]
+    assert bbox_array.middle.tolist() == [list(bbox.middle) for bbox in BBOX_ARRAY_LIST]
+    assert bbox_array.get_transform_vector(10, "20m").tolist() == [
+        list(bbox.get_transform_vector(10, 20)) for bbox in BBOX_ARRAY_LIST
+    ]
+    assert all(geometry.equals(bbox.geometry) for geometry, bbox in zip(bbox_array.geometries, BBOX_ARRAY_LIST))
+
+    with pytest.raises(ValueError):
+        bbox_array.buffer(-1)
+
+
+@pytest.mark.parametrize("partition_params", [dict(num_x=3, num_y=4), dict(size_x=0.05, size_y=0.03)])
+def test_bbox_array_from_partition(partition_params: dict[str, float]) -> None:
+    bbox = BBOX_ARRAY_LIST[0]
+    bbox_array = BBoxArray.from_partition(bbox, **partition_params)
+
+    assert bbox_array.to_list() == [part for column in bbox.get_partition(**partition_params) for part in column]
+
+
+def test_bbox_array_intersects() -> None:
+    bbox_array = BBoxArray.from_bboxes(BBOX_ARRAY_LIST)
+    geometry = Geometry(shapely.geometry.box(46, 13, 47, 14), CRS.WGS84)
+
+    assert bbox_array.intersects(geometry).tolist() == [True, False, False]
+    assert bbox_array[[0, 2]].intersects(geometry.geometry).tolist() == [True, False]
+    assert not shapely.is_prepared(geometry.geometry)
+
+    shapely.prepare(geometry.geometry)
+    assert bbox_array.intersects(geometry.geometry).tolist() == [True, False, False]
+
+
+def test_geometry_array() -> None:
+    geometry_list = [GEOMETRY2, Geometry(GEOMETRY1.geometry, CRS.WGS84), GEOMETRY1.transform(CRS.WGS84)]
+    geometry_array = GeometryArray.from_geometries(geometry_list)
+
+    assert len(geometry_array) == 3
+    assert geometry_array.crs is CRS.WGS84
+    assert geometry_array.to_list() == geometry_list
+    assert geometry_array[1:] == GeometryArray([GEOMETRY1.geometry, GEOMETRY1.transform(CRS.WGS84).wkt], CRS.WGS84)
+    assert geometry_array.bboxes.to_list() == [geometry.bbox for geometry in geometry_list]
+    assert repr(geometry_array) == "GeometryArray(3 geometries, crs=CRS('4326'))"
+
+    assert geometry_array.transform(CRS.POP_WEB).to_list() == [
+        geometry.transform(CRS.POP_WEB) for geometry in geometry_list
+    ]
+    assert geometry_array.reverse().to_list() == [geometry.reverse() for geometry in geometry_list]
+    assert geometry_array.apply(lambda x, y: (x + 1, y)).to_list() == [
+        geometry.apply(lambda x, y: (x + 1, y)) for geometry in geometry_list
+    ]
+
+    with pytest.raises(ValueError):
+        GeometryArray.from_geometries([])
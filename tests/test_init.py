@@ -0,0 +1,76 @@
+"""
+Tests for lazy loading of public names of the package
+"""
+
+from __future__ import annotations
+
+import os
+import pkgutil
+import subprocess
+import sys
+from types import ModuleType
+from typing import Callable
+
+import pytest
+
+import sentinelhub
+import sentinelhub.api
+
+HEAVY_DEPENDENCIES = ("numpy", "pyproj", "shapely", "requests", "tifffile", "PIL", "dataclasses_json", "utm")
+
+
+def _run_python(code: str, *options: str) -> str:
+    """Runs code in a new interpreter, where no package module has been imported yet, and returns its output."""
+    process = subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+    return process.stdout + process.stderr
+
+
+def test_import_defers_dependencies() -> None:
+    output = _run_python(f"import sys, sentinelhub; print([m for m in {HEAVY_DEPENDENCIES!r} if m in sys.modules])")
+    assert output.strip() == "[]"
+
+
+@pytest.mark.benchmark()
+def test_import_time_budget(record_property: Callable[[str, object], None]) -> None:
+    output = _run_python("import sentinelhub", "-X", "importtime")
+    import_entries = [line.split("|") for line in output.splitlines() if line.startswith("import time:")]
+    cumulative_time_us = sum(
+        int(cumulative_time)
+        for _, cumulative_time, name in import_entries
+        if name.rstrip() == " sentinelhub" or name.startswith(" sentinelhub.")
+    )
+
+    assert cumulative_time_us > 0
+    record_property("import_time_us", cumulative_time_us)
+
+
+def test_submodules_are_attributes() -> None:
+    output = _run_python(
+        "import sentinelhub; print(sentinelhub.api.SentinelHubRequest.__name__, sentinelhub.download.__name__,"
+        " sentinelhub.geometry.BBox.__name__, sentinelhub.api.batch.__name__)"
+    )
+    assert output.split() == ["SentinelHubRequest", "sentinelhub.download", "BBox", "sentinelhub.api.batch"]
+
+
+@pytest.mark.parametrize("package", [sentinelhub, sentinelhub.api])
+def test_known_submodules(package: ModuleType) -> None:
+    package_folder = os.path.dirname(package.__file__)  # type: ignore[arg-type]
+    submodules = {module_info.name for module_info in pkgutil.iter_modules([package_folder])} - {"_version"}
+
+    assert submodules == package._SUBMODULES  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+@pytest.mark.parametrize("package", [sentinelhub, sentinelhub.api])
+def test_public_names(package: object) -> None:
+    for name in package.__all__:  # type: ignore[attr-defined]
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.NonExistingName  # type: ignore[attr-defined]  # noqa: B018
+
+
+def test_public_names_of_submodules() -> None:
+    assert sentinelhub.opensearch is sentinelhub.api.opensearch
+    assert sentinelhub.SentinelHubCatalog is sentinelhub.api.SentinelHubCatalog
+    assert sentinelhub.CustomUrlParam is sentinelhub.api.ogc.CustomUrlParam
@@ -6,7 +6,8 @@ from xml.etree import ElementTree
 import numpy as np
 import pytest
 
-from sentinelhub import read_data, write_data
+from sentinelhub import MimeType, read_data, read_many, write_data, write_many
+from sentinelhub.io_utils import read_chunked_array, write_chunked_array
 
 BASIC_IMAGE = np.arange((5 * 6 * 3), dtype=np.uint8).reshape((5, 6, 3))
 
@@ -76,3 +77,66 @@ def test_img_write_jpg(filename: str, tmp_path) -> None:
     # Cannot verify that data is written correctly because JPG is not a lossless format
     file_path = str(tmp_path / filename)
     write_data(file_path, BASIC_IMAGE)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.random.default_rng(42).random((50, 40, 3), dtype=np.float32),
+        np.arange(24, dtype=">i4").reshape(2, 3, 4)[:, ::2],
+        np.zeros((0, 3), dtype=np.uint16),
+        np.array(True),
+    ],
+)
+def test_write_read_chunked_array(array: np.ndarray, tmp_path) -> None:
+    file_path = str(tmp_path / "array.shchunk")
+    write_chunked_array(file_path, array, chunk_size=1000, max_threads=2)
+    new_array = read_chunked_array(file_path)
+
+    assert new_array.dtype == array.dtype
+    assert new_array.shape == array.shape
+    assert np.array_equal(new_array, array)
+
+    assert os.listdir(tmp_path) == ["array.shchunk"]
+
+    for truncated_size in (os.path.getsize(file_path) - 1, 10):
+        with open(file_path, "rb+") as file:
+            file.truncate(truncated_size)
+        with pytest.raises(ValueError):
+            read_chunked_array(file_path)
+
+
+def test_write_read_many(tmp_path) -> None:
+    arrays = [BASIC_IMAGE + index for index in range(5)]
+    filenames = [
+        str(tmp_path / folder / f"img{index}.{extension}")
+        for index, folder, extension in zip(range(5), ["a", "a", "b", "b", "c"], ["tiff", "png", "npy", "tiff", "npy"])
+    ]
+    write_many(filenames, arrays, max_threads=3)
+
+    read_arrays = read_many(filenames, max_threads=3)
+    assert isinstance(read_arrays, list)
+    for array, read_array in zip(arrays, read_arrays):
+        assert np.array_equal(array, read_array)
+
+    stacked_array = read_many(filenames, stack=True, mmap_mode="r")
+    assert isinstance(stacked_array, np.ndarray)
+    assert np.array_equal(stacked_array, np.stack(arrays))
+
+    npy_filenames = [str(tmp_path / f"array{index}") for index in range(3)]
+    write_many(npy_filenames, np.stack(arrays[:3]), data_format=MimeType.NPY)
+    memmaps = read_many([f"{filename}.npy" for filename in npy_filenames], mmap_mode="r")
+    assert all(isinstance(memmap, np.memmap) for memmap in memmaps)
+    assert np.array_equal(np.stack(memmaps), np.stack(arrays[:3]))
+
+
+def test_read_many_errors(tmp_path) -> None:
+    filenames = [str(tmp_path / "img1.npy"), str(tmp_path / "img2.npy")]
+    write_many(filenames, [BASIC_IMAGE, BASIC_IMAGE[:2]])
+
+    with pytest.raises(ValueError):
+        read_many(filenames, stack=True)
+    with pytest.raises(FileNotFoundError):
+        read_many([*filenames, str(tmp_path / "img3.npy")])
+    with pytest.raises(ValueError):
+        write_many(filenames, [BASIC_IMAGE])
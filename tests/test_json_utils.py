@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import math
+from typing import Generator
+
+import pytest
+
+from sentinelhub.json_utils import JsonBackend, get_json_backend, json_dumps, json_loads, set_json_backend
+
+INSTALLED_BACKENDS: list[JsonBackend] = [
+    backend for backend in ("orjson", "msgspec") if importlib.util.find_spec(backend) is not None  # type: ignore[misc]
+]
+
+
+@pytest.fixture(name="json_backend", params=["json", *INSTALLED_BACKENDS])
+def json_backend_fixture(request: pytest.FixtureRequest) -> Generator[JsonBackend, None, None]:
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend()
+
+
+def test_default_backend() -> None:
+    assert get_json_backend() == (INSTALLED_BACKENDS[0] if INSTALLED_BACKENDS else "json")
+
+
+def test_json_roundtrip(json_backend: JsonBackend) -> None:
+    assert get_json_backend() == json_backend
+
+    data = {"b": [1, 2.5, None, True], "a": {"nested": "ščž"}, "c": 2**70}
+    encoded_data = json_dumps(data)
+    assert isinstance(encoded_data, bytes)
+    assert json_loads(encoded_data) == data
+    assert json_loads(encoded_data.decode("utf-8")) == data
+
+    assert (
+        json_dumps(data, sort_keys=True)
+        == json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    )
+    assert json_loads(b'{"mean": NaN}')["mean"] != json_loads(b'{"mean": NaN}')["mean"]
+
+    with pytest.raises(ValueError):
+        json_loads(b'{"mean": ')
+
+
+def test_json_non_finite_floats(json_backend: JsonBackend) -> None:
+    assert get_json_backend() == json_backend
+
+    data = {"stats": [{"mean": math.nan, "max": math.inf, "min": -math.inf, "noData": None}]}
+    encoded_data = json_dumps(data)
+    assert encoded_data == b'{"stats":[{"mean":NaN,"max":Infinity,"min":-Infinity,"noData":null}]}'
+
+    decoded_stats = json_loads(encoded_data)["stats"][0]
+    assert math.isnan(decoded_stats["mean"])
+    assert decoded_stats["max"] == math.inf
+    assert decoded_stats["min"] == -math.inf
+    assert decoded_stats["noData"] is None
+
+
+def test_set_json_backend_errors() -> None:
+    with pytest.raises(ValueError):
+        set_json_backend("ujson")  # type: ignore[arg-type]
+    assert get_json_backend() == (INSTALLED_BACKENDS[0] if INSTALLED_BACKENDS else "json")